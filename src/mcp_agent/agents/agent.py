@@ -131,10 +131,16 @@ class Agent(MCPAggregator):
             try:
                 user_input = await self.human_input_callback(request)
                 logger.debug("Received human input:", data=user_input)
-                await self.executor.signal(signal_name=request_id, payload=user_input)
+                await self.executor.signal(
+                    signal_name=request_id,
+                    payload=user_input,
+                    workflow_id=request.workflow_id,
+                )
             except Exception as e:
                 await self.executor.signal(
-                    request_id, payload=f"Error getting human input: {str(e)}"
+                    request_id,
+                    payload=f"Error getting human input: {str(e)}",
+                    workflow_id=request.workflow_id,
                 )
 
         asyncio.create_task(call_callback_and_signal())
@@ -8,9 +8,19 @@ from mcp import ServerSession
 from mcp_agent.context import Context, initialize_context, cleanup_context
 from mcp_agent.config import Settings
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.executor.signal_bus import DistributedSignalHandler
+from mcp_agent.executor.task_cache import TaskCache, cached_task
+from mcp_agent.executor.workflow_manager import WorkflowRunManager
 from mcp_agent.executor.workflow_signal import SignalWaitCallback
 from mcp_agent.human_input.types import HumanInputCallback
 from mcp_agent.human_input.handler import console_input_callback
+from mcp_agent.telemetry.profiler import (
+    Profile,
+    Profiler,
+    default_profile_path,
+    format_summary,
+)
+from mcp_agent.telemetry.token_usage import UsageTracker
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
 
 R = TypeVar("R")
@@ -66,8 +76,12 @@ class MCPApp:
         self._model_selector = model_selector
 
         self._workflows: Dict[str, Type] = {}  # id to workflow class
+        self._run_manager: Optional[WorkflowRunManager] = None
         self._logger = None
         self._context: Optional[Context] = None
+
+        # Profile of the last profiled run
+        self.profile: Optional[Profile] = None
         self._initialized = False
 
     @property
@@ -106,6 +120,39 @@ class MCPApp:
     def workflows(self):
         return self._workflows
 
+    @property
+    def run_manager(self) -> WorkflowRunManager:
+        """Manager of the workflow runs started in this app process."""
+        if self._run_manager is None:
+            raise RuntimeError(
+                "MCPApp not initialized, please call initialize() first, or use async with app.run()."
+            )
+        return self._run_manager
+
+    @property
+    def usage(self) -> UsageTracker:
+        """Token usage and estimated cost of the app's LLM requests, by model, agent and workflow run."""
+        return self.context.usage_tracker
+
+    async def start_workflow(
+        self,
+        workflow: str | Type | Any,
+        *args: Any,
+        run_id: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Start a workflow run in the background and return its run id.
+        The workflow can be given by its registered name, as a class or as an instance.
+        Use `run_manager` to query, await or cancel the run.
+        """
+        if isinstance(workflow, str):
+            if workflow not in self._workflows:
+                raise ValueError(f"Workflow {workflow} is not registered")
+            workflow = self._workflows[workflow]
+
+        return await self.run_manager.start(workflow, *args, run_id=run_id, **kwargs)
+
     @property
     def tasks(self):
         return self.context.task_registry.list_activities()
@@ -124,11 +171,16 @@ class MCPApp:
         self._context = await initialize_context(self._config)
 
         # Set the properties that were passed in the constructor
+        self._context.app = self
         self._context.human_input_handler = self._human_input_callback
         self._context.signal_notification = self._signal_notification
         self._context.upstream_session = self._upstream_session
         self._context.model_selector = self._model_selector
 
+        self._run_manager = WorkflowRunManager(
+            self._context.config.workflow_runs, context=self._context
+        )
+
         self._initialized = True
         self.logger.info("MCPAgent initialized")
 
@@ -137,14 +189,28 @@ class MCPApp:
         if not self._initialized:
             return
 
+        if self._run_manager:
+            await self._run_manager.shutdown()
+            self._run_manager = None
+
+        if self._context.batch_processor:
+            await self._context.batch_processor.close()
+
+        signal_bus = self._context.executor.signal_bus
+        if isinstance(signal_bus, DistributedSignalHandler):
+            await signal_bus.close()
+
         await cleanup_context()
         self._context = None
         self._initialized = False
 
     @asynccontextmanager
-    async def run(self):
+    async def run(self, profile: bool | None = None):
         """
         Run the application. Use as context manager.
+        Args:
+            profile: Profile the run (defaults to the profiling settings). The profile is
+                written to a file when the run ends, and is available as `app.profile`.
 
         Example:
             async with app.run() as running_app:
@@ -152,11 +218,44 @@ class MCPApp:
                 pass
         """
         await self.initialize()
+        settings = self.config.profiling
+        if profile is None:
+            profile = bool(settings and settings.enabled)
+
+        profiler = None
+        if profile:
+            profiler = Profiler(
+                stall_threshold_seconds=(
+                    settings.stall_threshold_ms if settings else 100
+                )
+                / 1000
+            )
+            profiler.start()
         try:
             yield self
         finally:
+            if profiler:
+                self._save_profile(profiler.stop())
             await self.cleanup()
 
+    def _save_profile(self, profile: Profile):
+        settings = self.config.profiling
+        format = settings.format if settings else "chrome"
+        path = (settings.output_path if settings else None) or default_profile_path(
+            self.name, format
+        )
+        self.profile = profile
+        try:
+            path = profile.write(path, format)
+        except OSError as e:
+            self.logger.error(f"Failed to write profile to {path}: {e}")
+            return
+
+        self.logger.info(
+            f"Profile written to {path}:\n{format_summary(profile)}",
+            data={"stalls": len(profile.stalls)},
+        )
+
     def workflow(
         self, cls: Type, *args, workflow_id: str | None = None, **kwargs
     ) -> Type:
@@ -175,13 +274,13 @@ class MCPApp:
             execution_engine
         )
 
+        cls._app = self
         if workflow_defn_decorator:
-            return workflow_defn_decorator(cls, *args, **kwargs)
+            cls = workflow_defn_decorator(cls, *args, **kwargs)
 
-        cls._app = self
+        # Registered workflows are picked up by executors, e.g. Temporal workers
         self._workflows[workflow_id or cls.__name__] = cls
 
-        # Default no-op
         return cls
 
     def workflow_run(self, fn: Callable[..., R]) -> Callable[..., R]:
@@ -214,6 +313,8 @@ class MCPApp:
         name: str | None = None,
         schedule_to_close_timeout: timedelta | None = None,
         retry_policy: Dict[str, Any] | None = None,
+        cache: bool | TaskCache = False,
+        cache_ttl: timedelta | None = None,
         **kwargs: Any,
     ) -> Callable[[Callable[..., R]], Callable[..., R]]:
         """
@@ -224,7 +325,13 @@ class MCPApp:
             name: Optional custom name for the activity
             schedule_to_close_timeout: Maximum time the task can take to complete
             retry_policy: Retry policy configuration
-            **kwargs: Additional metadata passed to the activity registration
+            cache: Cache results by the task name and arguments, so repeated calls with
+                identical arguments aren't re-executed. True uses the app's task cache
+                (see TaskCacheSettings), or pass a TaskCache to use a dedicated one.
+            cache_ttl: How long results stay cached (defaults to the cache's TTL)
+            **kwargs: Additional metadata passed to the activity registration,
+                e.g. priority="batch" or fairness_key="tenant-a" to pin the
+                executor priority class and fairness key of the task
 
         Returns:
             Decorated function that preserves async and typing information
@@ -246,6 +353,16 @@ class MCPApp:
                 "retry_policy": retry_policy or {},
                 **kwargs,
             }
+            if cache:
+                func = cached_task(
+                    func,
+                    actual_name,
+                    (lambda: cache)
+                    if isinstance(cache, TaskCache)
+                    else (lambda: self.context.task_cache),
+                    ttl_seconds=cache_ttl.total_seconds() if cache_ttl else None,
+                )
+
             activity_registry = self.context.task_registry
             activity_registry.register(actual_name, func, metadata)
 
@@ -0,0 +1,145 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from mcp_agent.eval.benchmark import BenchmarkReport, BenchmarkResult, compare
+from mcp_agent.eval.benchmark_suite import (
+    BENCHMARKS,
+    REFERENCE_BASELINE_PATH,
+    BenchmarkSuiteSettings,
+    run_benchmarks,
+)
+
+app = typer.Typer()
+console = Console()
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}"
+
+
+def _results_table(report: BenchmarkReport, baseline: BenchmarkReport | None) -> Table:
+    table = Table(title="Benchmarks")
+    table.add_column("Benchmark")
+    table.add_column("ops/s", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p90 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("errors", justify="right")
+    if baseline:
+        table.add_column("ops/s vs baseline", justify="right")
+        table.add_column("p50 vs baseline", justify="right")
+
+    for name, result in report.results.items():
+        row = [
+            name,
+            f"{result.throughput:.1f}",
+            _ms(result.latency.p50),
+            _ms(result.latency.p90),
+            _ms(result.latency.p99),
+            str(result.errors),
+        ]
+        base: BenchmarkResult | None = baseline.results.get(name) if baseline else None
+        if baseline:
+            row.extend(
+                [
+                    f"{(result.throughput / base.throughput - 1) * 100:+.1f}%"
+                    if base and base.throughput
+                    else "-",
+                    f"{(result.latency.p50 / base.latency.p50 - 1) * 100:+.1f}%"
+                    if base and base.latency.p50
+                    else "-",
+                ]
+            )
+        table.add_row(*row)
+
+    return table
+
+
+@app.command()
+def run(
+    only: List[str] = typer.Option(
+        None, "--only", help=f"Benchmarks to run, from {list(BENCHMARKS)}"
+    ),
+    iterations: int = typer.Option(
+        BenchmarkSuiteSettings().iterations, help="Measured operations per benchmark"
+    ),
+    concurrency: int = typer.Option(
+        BenchmarkSuiteSettings().concurrency, help="Operations run concurrently"
+    ),
+    stdio: bool = typer.Option(
+        False, "--stdio", help="Run the mock MCP server in a subprocess over stdio"
+    ),
+    baseline: Path = typer.Option(
+        None,
+        help="Baseline report to compare the results with, saved on this machine "
+        f"with --save (a reference report is shipped in {REFERENCE_BASELINE_PATH})",
+    ),
+    save: Path = typer.Option(None, help="Save the report (e.g. as a new baseline)"),
+    tolerance: float = typer.Option(
+        0.25, help="Relative slowdown from the baseline reported as a regression"
+    ),
+):
+    """
+    Run the benchmarks against mock LLM providers and MCP servers, and compare them
+    with a baseline if given. Exits with status 1 if any benchmark regressed from a
+    baseline measured with the same settings on the same platform.
+    """
+    settings = BenchmarkSuiteSettings(
+        iterations=iterations,
+        concurrency=concurrency,
+        server_transport="stdio" if stdio else "in_process",
+    )
+
+    with console.status("[bold cyan]Running benchmarks...[/bold cyan]") as status:
+        report = asyncio.run(
+            run_benchmarks(
+                settings,
+                names=only,
+                on_result=lambda result: status.update(
+                    f"[bold cyan]Finished {result.name}...[/bold cyan]"
+                ),
+            )
+        )
+
+    baseline_report = None
+    comparable = False
+    if baseline:
+        if not baseline.exists():
+            console.print(f"[red]Baseline {baseline} not found[/red]")
+            raise typer.Exit(code=2)
+        baseline_report = BenchmarkReport.load(baseline)
+        if baseline_report.settings != report.settings:
+            console.print(
+                "[yellow]The baseline was measured with different settings, "
+                "its results aren't comparable: not checking for regressions[/yellow]"
+            )
+        elif baseline_report.platform != report.platform:
+            console.print(
+                f"[yellow]The baseline was measured on {baseline_report.platform}, "
+                "not checking for regressions: save a baseline on this machine "
+                "(--save)[/yellow]"
+            )
+        else:
+            comparable = True
+
+    console.print(_results_table(report, baseline_report))
+
+    if save:
+        report.save(save)
+        console.print(f"Saved the report to {save}")
+
+    if comparable:
+        regressions = compare(report, baseline_report, tolerance=tolerance)
+        for regression in regressions:
+            console.print(
+                f"[red]Regression in {regression.benchmark}: {regression.metric} "
+                f"{regression.baseline:.4g} -> {regression.current:.4g} "
+                f"({regression.change * 100:+.1f}%)[/red]"
+            )
+        if regressions:
+            raise typer.Exit(code=1)
@@ -1,11 +1,12 @@
 import typer
 from mcp_agent.cli.terminal import Application
-from mcp_agent.cli.commands import config
+from mcp_agent.cli.commands import benchmark, config
 
 app = typer.Typer()
 
 # Subcommands
 app.add_typer(config.app, name="config")
+app.add_typer(benchmark.app, name="benchmark")
 
 # Shared application context
 application = Application()
@@ -4,7 +4,7 @@ for the application configuration.
 """
 
 from pathlib import Path
-from typing import Dict, List, Literal
+from typing import Any, Dict, List, Literal
 
 from pydantic import BaseModel, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -87,6 +87,232 @@ class OpenAISettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class AsyncioSettings(BaseModel):
+    """
+    Settings for the default asyncio execution engine.
+    """
+
+    max_concurrent_activities: int | None = None
+    """Maximum number of tasks the executor runs concurrently (unbounded if unset)."""
+
+    priority_weights: Dict[str, float] | None = None
+    """
+    Relative share of executor slots for each priority class,
+    e.g. {"interactive": 8, "default": 4, "batch": 1}.
+    Only applies when max_concurrent_activities is set.
+    """
+
+    fairness_weights: Dict[str, float] | None = None
+    """Relative weights of fairness keys (workflows or tenants) within a priority class."""
+
+    default_priority: str = "default"
+    """Priority class for tasks that don't specify one."""
+
+    signal_registration_ttl_seconds: float | None = None
+    """
+    Maximum time a workflow waits for a signal (e.g. human input), even if the wait
+    has no timeout of its own, after which the wait fails with a TimeoutError
+    (waits never expire if unset).
+    """
+
+
+class ProviderConcurrencySettings(BaseModel):
+    """
+    Adaptive (AIMD) concurrency control for LLM and embedding provider calls.
+    A separate limit is tracked for each provider and model.
+    """
+
+    initial_limit: int = 4
+    """Number of concurrent calls allowed before any feedback has been observed."""
+
+    min_limit: int = 1
+    """Lower bound for the concurrency limit."""
+
+    max_limit: int = 64
+    """Upper bound for the concurrency limit."""
+
+    increase_step: float = 1.0
+    """Additive increase of the limit for every `limit` successful calls with stable latency."""
+
+    decrease_factor: float = 0.5
+    """Multiplicative decrease of the limit after a rate-limit (429) error."""
+
+    latency_tolerance: float = 2.0
+    """Latency above this multiple of the baseline latency stops the limit from growing."""
+
+    max_retries: int = 3
+    """Number of times a rate-limited call is retried (after honoring retry-after)."""
+
+    default_retry_after_seconds: float = 1.0
+    """Backoff used when a rate-limit error doesn't include a retry-after header."""
+
+
+class TokenRateLimitSettings(BaseModel):
+    """
+    Token-per-minute budgets for LLM provider requests.
+    A separate budget is tracked for each provider and model.
+    """
+
+    tokens_per_minute: Dict[str, int] = {}
+    """
+    Budget in tokens per minute, keyed by "<provider>/<model>", "<model>" or "<provider>".
+    The most specific match wins, e.g. {"Anthropic": 80000, "gpt-4o": 30000}.
+    """
+
+    default_tokens_per_minute: int | None = None
+    """Budget for providers/models without a matching entry (unlimited if unset)."""
+
+    chars_per_token: float = 4.0
+    """Characters per token used to estimate the input tokens of a request."""
+
+
+class BatchSettings(BaseModel):
+    """
+    Settings for submitting LLM requests through provider batch APIs
+    (used for requests made with RequestParams.use_batch_api).
+    """
+
+    backend: Literal["provider", "local"] = "provider"
+    """
+    Where batches are submitted: the provider's batch endpoint, or "local" to run
+    each request through the interactive API (for tests and local development).
+    """
+
+    max_batch_size: int = 1000
+    """Maximum number of requests submitted in a single batch."""
+
+    max_wait_seconds: float = 5.0
+    """Time to keep collecting requests after the first one is queued, before submitting the batch."""
+
+    poll_interval_seconds: float = 30.0
+    """Interval between checks for the completion of a submitted batch."""
+
+
+class TemporalPayloadCodecSettings(BaseModel):
+    """
+    Settings for compressing Temporal payloads and offloading large ones to a blob store,
+    which keeps workflow histories small as conversations grow.
+    """
+
+    compression: bool = True
+    """Whether to compress payloads above compression_threshold_bytes."""
+
+    compression_level: int = 6
+    """zlib compression level (1-9)."""
+
+    compression_threshold_bytes: int = 4096
+    """Payloads smaller than this are left untouched."""
+
+    offload_threshold_bytes: int = 256 * 1024
+    """Payloads that are still at least this large after compression are moved to the blob store."""
+
+    blob_store_path: str | None = ".mcp-agent/blobs"
+    """
+    Directory of the content-addressed blob store. It must be shared by all clients and workers.
+    Set to None to disable offloading.
+    """
+
+    cache_size_bytes: int = 64 * 1024 * 1024
+    """Size of the in-memory cache of blobs, which avoids re-reading them during replay."""
+
+
+class CheckpointSettings(BaseModel):
+    """
+    Settings for durable checkpoints of workflows run with the asyncio engine,
+    which allow resuming a workflow after a process restart.
+    """
+
+    backend: Literal["sqlite", "file"] = "sqlite"
+    """Where checkpoints are stored: a SQLite database, or a directory of JSON files."""
+
+    path: str | None = None
+    """
+    Path of the SQLite database (default: .mcp-agent/checkpoints.db),
+    or of the directory for the file backend (default: .mcp-agent/checkpoints).
+    """
+
+
+class TaskCacheSettings(BaseModel):
+    """
+    Settings for the cache of @workflow_task results
+    (used by tasks registered with `cache=True`).
+    """
+
+    backend: Literal["memory", "disk", "sqlite"] = "memory"
+    """
+    Where results are cached: an in-memory LRU cache (per process),
+    a directory of JSON files, or a SQLite database.
+    """
+
+    path: str | None = None
+    """
+    Path of the cache directory for the disk backend (default: .mcp-agent/task_cache),
+    or of the database for the sqlite backend (default: .mcp-agent/task_cache.db).
+    """
+
+    max_entries: int = 1024
+    """Maximum number of cached results; the least recently used are evicted first."""
+
+    ttl_seconds: float | None = None
+    """How long results stay cached, unless set on the task (no expiry if unset)."""
+
+
+class SignalBusSettings(BaseModel):
+    """
+    Settings for delivering signals (e.g. human input responses) across processes,
+    so a signal received by one replica reaches a workflow waiting on another.
+    """
+
+    backend: Literal["file", "redis"] = "file"
+    """
+    Transport for signals: a directory shared by all processes on a host
+    (or a network file system), or Redis pub/sub.
+    """
+
+    path: str | None = None
+    """Directory used by the file backend (default: .mcp-agent/signals)."""
+
+    redis_url: str = "redis://localhost:6379/0"
+    """URL of the Redis server used by the redis backend."""
+
+    channel_prefix: str = "mcp_agent:signals"
+    """Prefix of the channels signals are published to (one channel per workflow id)."""
+
+    poll_interval_seconds: float = 0.2
+    """How often the file backend checks for new signals."""
+
+
+class WorkflowRunSettings(BaseModel):
+    """Settings for the app's manager of concurrent workflow runs."""
+
+    max_concurrent_runs: int | None = None
+    """Maximum number of runs executing at once; others wait (unbounded if unset)."""
+
+    retention_seconds: float = 3600
+    """How long the status and result of finished runs are kept."""
+
+    max_retained_runs: int = 1000
+    """Maximum number of finished runs kept; the oldest are dropped first."""
+
+
+class TemporalActivitySettings(BaseModel):
+    """Timeouts and retry policy for a kind of built-in Temporal activity."""
+
+    start_to_close_timeout_seconds: float = 600
+    """Maximum time a single attempt of the activity can take."""
+
+    schedule_to_close_timeout_seconds: float | None = None
+    """Maximum time the activity can take overall, including retries (unlimited if unset)."""
+
+    retry_policy: Dict[str, Any] = {
+        "initial_interval": 1.0,
+        "backoff_coefficient": 2.0,
+        "maximum_interval": 60.0,
+        "maximum_attempts": 5,
+    }
+    """Temporal retry policy, with intervals in seconds."""
+
+
 class TemporalSettings(BaseModel):
     """
     Temporal settings for the MCP Agent application.
@@ -97,6 +323,43 @@ class TemporalSettings(BaseModel):
     task_queue: str
     api_key: str | None = None
 
+    payload_codec: TemporalPayloadCodecSettings | None = None
+    """Compression and offloading of large activity/workflow payloads (disabled if unset)."""
+
+    llm_activity: TemporalActivitySettings = TemporalActivitySettings()
+    """Timeouts and retries for LLM provider calls, which run as activities inside workflows."""
+
+    tool_activity: TemporalActivitySettings = TemporalActivitySettings(
+        start_to_close_timeout_seconds=120
+    )
+    """Timeouts and retries for MCP tool calls, which run as activities inside workflows."""
+
+    # Worker tuning. Unset values use the Temporal SDK defaults.
+    # Any number of workers can poll the same task queue, so throughput scales with worker count.
+    max_concurrent_activities: int | None = None
+    """Maximum number of activities a worker runs concurrently."""
+
+    max_concurrent_workflow_tasks: int | None = None
+    """Maximum number of workflow tasks a worker processes concurrently."""
+
+    max_concurrent_activity_task_polls: int | None = None
+    """Maximum number of concurrent pollers for activity tasks."""
+
+    max_concurrent_workflow_task_polls: int | None = None
+    """Maximum number of concurrent pollers for workflow tasks."""
+
+    max_cached_workflows: int | None = None
+    """Number of workflows kept in the sticky cache, which avoids replaying their history on every task."""
+
+    sticky_queue_schedule_to_start_timeout_seconds: float | None = None
+    """Time a workflow task waits on a worker's sticky queue before it's moved to the shared task queue."""
+
+    max_task_queue_activities_per_second: float | None = None
+    """Rate limit for activities across all workers polling the task queue."""
+
+    worker_identity: str | None = None
+    """Identity reported by workers (defaults to <pid>@<hostname>)."""
+
 
 class UsageTelemetrySettings(BaseModel):
     """
@@ -132,6 +395,81 @@ class OpenTelemetrySettings(BaseModel):
     """Sample rate for tracing (1.0 = sample everything)"""
 
 
+class MetricsSettings(BaseModel):
+    """
+    Settings for the metrics (counters, gauges and histograms) collected by the MCP Agent,
+    and how they are exported.
+    """
+
+    enabled: bool = True
+    """Collect metrics. When disabled, metric updates are no-ops"""
+
+    prometheus_port: int | None = None
+    """Serve metrics in the Prometheus text format on this port (not served if unset)"""
+
+    prometheus_host: str = "127.0.0.1"
+    """Address the Prometheus endpoint listens on"""
+
+    otlp_endpoint: str | None = None
+    """OTLP endpoint to export metrics to through OpenTelemetry (not exported if unset)"""
+
+    export_interval_seconds: float = 60.0
+    """How often metrics are exported to the OTLP endpoint"""
+
+
+class ProfilingSettings(BaseModel):
+    """
+    Settings for profiling app runs: a timeline of the run's spans with wall and CPU time,
+    and detection of event loop stalls.
+    """
+
+    enabled: bool = False
+    """Profile app runs (can also be enabled per run with `app.run(profile=True)`)"""
+
+    stall_threshold_ms: float = 100.0
+    """Report event loop stalls longer than this, with the stack of the blocking code"""
+
+    output_path: str | None = None
+    """File to write the profile to (defaults to <app name>-profile-<timestamp>.<ext>)"""
+
+    format: Literal["chrome", "folded"] = "chrome"
+    """Chrome trace JSON (chrome://tracing, Perfetto) or folded stacks for flame graphs"""
+
+
+class LogRateLimitSettings(BaseModel):
+    """
+    Sampling and rate limiting of log events from a namespace and/or with an event name.
+    Limits apply separately to each namespace and event name the rule matches.
+    """
+
+    namespace: str | None = None
+    """Namespace prefix of the events the rule applies to (all namespaces if not set)"""
+
+    name: str | None = None
+    """Event name the rule applies to (all names if not set)"""
+
+    types: List[Literal["debug", "info", "warning", "error", "progress"]] | None = None
+    """Event types the rule applies to (all types if not set)"""
+
+    first_n: int = 0
+    """Number of events that always pass, before sampling and rate limiting apply"""
+
+    sample_rate: float = 1.0
+    """Fraction of events (after the first N) to keep"""
+
+    rate: float | None = None
+    """Maximum number of events per second (token bucket refill rate)"""
+
+    burst: int | None = None
+    """Maximum burst of events above the rate (token bucket size), defaults to the rate"""
+
+    dedup_seconds: float | None = None
+    """
+    Suppress repeats of the same message within this window. The next event logged
+    after a run of repeats reports how many were suppressed.
+    """
+
+
 class LoggerSettings(BaseModel):
     """
     Logger settings for the MCP Agent application.
@@ -154,6 +492,46 @@ class LoggerSettings(BaseModel):
     max_queue_size: int = 2048
     """Maximum queue size for event processing"""
 
+    overflow_policy: Literal["drop_oldest", "drop_debug_first", "block"] = "drop_oldest"
+    """
+    What to do when the event queue is full:
+    drop the oldest event, drop the oldest debug event (or the oldest event if there
+    are no debug events queued), or make emitters wait until there is room.
+    "block" only applies to `await event_bus.emit()` and to logging from other threads:
+    logging calls on the event loop can't wait, and drop the oldest event instead.
+    """
+
+    serializer_max_depth: int = 20
+    """Maximum nesting depth of event data to serialize"""
+
+    serializer_max_string_length: int = 10_000
+    """Strings in event data longer than this are truncated"""
+
+    serializer_max_items: int = 1_000
+    """Lists and dicts in event data with more items than this are truncated"""
+
+    rate_limits: List[LogRateLimitSettings] = []
+    """
+    Sampling and rate limiting rules for noisy namespaces or events,
+    applied before events are queued. The first rule matching an event applies.
+    """
+
+    # File transport settings
+    file_max_bytes: int | None = None
+    """Rotate the log file once it exceeds this many bytes"""
+
+    file_rotate_interval: float | None = None
+    """Rotate the log file once it is older than this many seconds"""
+
+    file_backup_count: int = 5
+    """Number of rotated log files to keep"""
+
+    file_compress: bool = False
+    """Whether to gzip rotated log files"""
+
+    file_fsync: bool = False
+    """Whether to fsync the log file on every flush"""
+
     # HTTP transport settings
     http_endpoint: str | None = None
     """HTTP endpoint for event transport"""
@@ -164,6 +542,18 @@ class LoggerSettings(BaseModel):
     http_timeout: float = 5.0
     """HTTP timeout seconds for event transport"""
 
+    http_compress: bool = True
+    """Whether to gzip-compress batches sent to the HTTP endpoint"""
+
+    http_max_retries: int = 3
+    """Number of times to retry sending a batch to the HTTP endpoint"""
+
+    http_retry_backoff: float = 0.5
+    """Initial delay in seconds between retries, doubled after every attempt"""
+
+    http_spill_path: str | None = None
+    """Directory to store batches that couldn't be sent, to resend them later"""
+
 
 class Settings(BaseSettings):
     """
@@ -184,9 +574,33 @@ class Settings(BaseSettings):
     execution_engine: Literal["asyncio", "temporal"] = "asyncio"
     """Execution engine for the MCP Agent application"""
 
+    asyncio: AsyncioSettings | None = None
+    """Settings for the asyncio execution engine"""
+
     temporal: TemporalSettings | None = None
     """Settings for Temporal workflow orchestration"""
 
+    provider_concurrency: ProviderConcurrencySettings | None = None
+    """Adaptive concurrency control for LLM/embedding provider calls (disabled if unset)"""
+
+    checkpoint: CheckpointSettings | None = None
+    """Durable checkpoints for asyncio-engine workflows (disabled if unset)"""
+
+    workflow_runs: WorkflowRunSettings = WorkflowRunSettings()
+    """Concurrency and retention of workflow runs started through the app's run manager"""
+
+    signal_bus: SignalBusSettings | None = None
+    """Cross-process signal delivery for the asyncio engine (in-process only if unset)"""
+
+    task_cache: TaskCacheSettings | None = None
+    """Cache for @workflow_task results (an in-memory LRU cache if unset)"""
+
+    token_rate_limit: TokenRateLimitSettings | None = None
+    """Token-per-minute budgets for LLM provider requests (disabled if unset)"""
+
+    batch: BatchSettings | None = BatchSettings()
+    """Settings for submitting LLM requests through provider batch APIs"""
+
     anthropic: AnthropicSettings | None = None
     """Settings for using Anthropic models in the MCP Agent application"""
 
@@ -202,6 +616,12 @@ class Settings(BaseSettings):
     logger: LoggerSettings | None = LoggerSettings()
     """Logger settings for the MCP Agent application"""
 
+    metrics: MetricsSettings | None = MetricsSettings()
+    """Metrics collection and export settings for the MCP Agent application"""
+
+    profiling: ProfilingSettings | None = ProfilingSettings()
+    """Profiling settings for runs of the MCP Agent application"""
+
     usage_telemetry: UsageTelemetrySettings | None = UsageTelemetrySettings()
     """Usage tracking settings for the MCP Agent application"""
 
@@ -14,34 +14,52 @@ from opentelemetry import trace
 from opentelemetry.propagate import set_global_textmap
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 from mcp_agent.config import get_settings
 from mcp_agent.config import Settings
-from mcp_agent.executor.executor import Executor
+from mcp_agent.executor.checkpoint import CheckpointStore, create_checkpoint_store
+from mcp_agent.executor.executor import Executor, ExecutorConfig
+from mcp_agent.executor.signal_bus import (
+    DistributedSignalHandler,
+    create_signal_backend,
+)
+from mcp_agent.executor.task_cache import (
+    MemoryTaskCache,
+    TaskCache,
+    create_task_cache,
+)
 from mcp_agent.executor.decorator_registry import (
     DecoratorRegistry,
     register_asyncio_decorators,
     register_temporal_decorators,
 )
 from mcp_agent.executor.task_registry import ActivityRegistry
+from mcp_agent.executor.token_limiter import TokenRateLimiter
 from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.executor.workflow_signal import AsyncioSignalHandler
 
 from mcp_agent.logging.events import EventFilter
 from mcp_agent.logging.logger import LoggingConfig
 from mcp_agent.logging.transport import create_transport
+from mcp_agent.telemetry.metrics import metrics, start_prometheus_server
+from mcp_agent.telemetry.token_usage import UsageTracker
 from mcp_agent.mcp_server_registry import ServerRegistry
+from mcp_agent.workflows.llm.batch import BatchProcessor
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
 from mcp_agent.logging.logger import get_logger
 
 
 if TYPE_CHECKING:
+    from mcp_agent.app import MCPApp
     from mcp_agent.human_input.types import HumanInputCallback
     from mcp_agent.executor.workflow_signal import SignalWaitCallback
 else:
     # Runtime placeholders for the types
+    MCPApp = Any
     HumanInputCallback = Any
     SignalWaitCallback = Any
 
@@ -55,11 +73,17 @@ class Context(BaseModel):
     """
 
     config: Optional[Settings] = None
+    app: Optional[MCPApp] = None
     executor: Optional[Executor] = None
     human_input_handler: Optional[HumanInputCallback] = None
     signal_notification: Optional[SignalWaitCallback] = None
     upstream_session: Optional[ServerSession] = None  # TODO: saqadri - figure this out
     model_selector: Optional[ModelSelector] = None
+    token_limiter: Optional[TokenRateLimiter] = None
+    checkpoint_store: Optional[CheckpointStore] = None
+    task_cache: Optional[TaskCache] = None
+    batch_processor: Optional[BatchProcessor] = None
+    usage_tracker: Optional[UsageTracker] = None
 
     # Registries
     server_registry: Optional[ServerRegistry] = None
@@ -101,8 +125,12 @@ async def configure_otel(config: "Settings"):
         }
     )
 
-    # Create provider with resource
-    tracer_provider = TracerProvider(resource=resource)
+    # Create provider with resource. Root spans are sampled at the configured rate,
+    # child spans follow their parent's decision so traces are kept whole
+    tracer_provider = TracerProvider(
+        resource=resource,
+        sampler=ParentBased(TraceIdRatioBased(config.otel.sample_rate)),
+    )
 
     # Add exporters based on config
     otlp_endpoint = config.otel.otlp_endpoint
@@ -134,9 +162,51 @@ async def configure_logger(config: "Settings"):
         transport=transport,
         batch_size=config.logger.batch_size,
         flush_interval=config.logger.flush_interval,
+        max_queue_size=config.logger.max_queue_size,
+        overflow_policy=config.logger.overflow_policy,
+        rate_limits=config.logger.rate_limits,
     )
 
 
+async def configure_metrics(config: "Settings"):
+    """
+    Configure metrics collection and export based on the application config.
+    """
+    global _metrics_server, _meter_provider
+
+    settings = config.metrics
+    metrics.enabled = bool(settings and settings.enabled)
+    if not metrics.enabled:
+        return
+
+    if settings.otlp_endpoint and _meter_provider is None:
+        from opentelemetry import metrics as metrics_api
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+            OTLPMetricExporter,
+        )
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+        reader = PeriodicExportingMetricReader(
+            OTLPMetricExporter(endpoint=settings.otlp_endpoint),
+            export_interval_millis=settings.export_interval_seconds * 1000,
+        )
+        _meter_provider = MeterProvider(
+            resource=Resource.create({"service.name": config.otel.service_name}),
+            metric_readers=[reader],
+        )
+        metrics_api.set_meter_provider(_meter_provider)
+        metrics.bind_otel(_meter_provider.get_meter("mcp_agent"))
+
+    if settings.prometheus_port is not None and _metrics_server is None:
+        _metrics_server = start_prometheus_server(
+            metrics, port=settings.prometheus_port, host=settings.prometheus_host
+        )
+        logger.info(
+            f"Serving metrics at http://{settings.prometheus_host}:{settings.prometheus_port}/metrics"
+        )
+
+
 async def configure_usage_telemetry(_config: "Settings"):
     """
     Configure usage telemetry based on the application config.
@@ -145,21 +215,40 @@ async def configure_usage_telemetry(_config: "Settings"):
     pass
 
 
-async def configure_executor(config: "Settings"):
+async def configure_executor(config: "Settings", context: Optional["Context"] = None):
     """
     Configure the executor based on the application config.
     """
     if config.execution_engine == "asyncio":
-        return AsyncioExecutor()
+        executor_config = ExecutorConfig(
+            **(config.asyncio.model_dump() if config.asyncio else {}),
+            provider_concurrency=config.provider_concurrency,
+        )
+        registration_ttl_seconds = (
+            config.asyncio.signal_registration_ttl_seconds if config.asyncio else None
+        )
+        if config.signal_bus:
+            signal_bus = DistributedSignalHandler(
+                create_signal_backend(config.signal_bus),
+                channel_prefix=config.signal_bus.channel_prefix,
+                registration_ttl_seconds=registration_ttl_seconds,
+            )
+        else:
+            signal_bus = AsyncioSignalHandler(
+                registration_ttl_seconds=registration_ttl_seconds
+            )
+        return AsyncioExecutor(
+            config=executor_config, signal_bus=signal_bus, context=context
+        )
     elif config.execution_engine == "temporal":
         # Configure Temporal executor
         from mcp_agent.executor.temporal import TemporalExecutor
 
-        executor = TemporalExecutor(config=config.temporal)
+        executor = TemporalExecutor(config=config.temporal, context=context)
         return executor
     else:
         # Default to asyncio executor
-        executor = AsyncioExecutor()
+        executor = AsyncioExecutor(context=context)
         return executor
 
 
@@ -179,12 +268,32 @@ async def initialize_context(
     # Configure logging and telemetry
     await configure_otel(config)
     await configure_logger(config)
+    await configure_metrics(config)
     await configure_usage_telemetry(config)
 
     # Configure the executor
-    context.executor = await configure_executor(config)
+    context.executor = await configure_executor(config, context)
     context.task_registry = ActivityRegistry()
 
+    # Token budgets are shared by every LLM in the context
+    if config.token_rate_limit:
+        context.token_limiter = TokenRateLimiter(config.token_rate_limit)
+
+    # Token usage and cost of every LLM in the context
+    context.usage_tracker = UsageTracker()
+
+    if config.batch:
+        context.batch_processor = BatchProcessor(config.batch)
+
+    if config.checkpoint and config.execution_engine == "asyncio":
+        # Temporal keeps its own durable history
+        context.checkpoint_store = create_checkpoint_store(config.checkpoint)
+
+    # Only used by tasks registered with cache=True
+    context.task_cache = (
+        create_task_cache(config.task_cache) if config.task_cache else MemoryTaskCache()
+    )
+
     context.decorator_registry = DecoratorRegistry()
     register_asyncio_decorators(context.decorator_registry)
     register_temporal_decorators(context.decorator_registry)
@@ -204,12 +313,28 @@ async def cleanup_context():
     Cleanup the global application context.
     """
 
+    global _metrics_server, _meter_provider
+
     # Shutdown logging and telemetry
     await LoggingConfig.shutdown()
 
+    if _metrics_server is not None:
+        await asyncio.to_thread(_metrics_server.shutdown)
+        _metrics_server.server_close()
+        _metrics_server = None
+
+    if _meter_provider is not None:
+        # Exports the final metrics
+        await asyncio.to_thread(_meter_provider.shutdown)
+        _meter_provider = None
+
 
 _global_context: Context | None = None
 
+# Metrics exporters, shared by every context in the process like the metrics registry
+_metrics_server = None
+_meter_provider = None
+
 
 def get_current_context() -> Context:
     """
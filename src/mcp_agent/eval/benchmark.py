@@ -0,0 +1,242 @@
+"""
+Benchmark harness: runs an async operation repeatedly, measures its throughput and
+latency percentiles, and compares the results with a stored baseline so that
+performance regressions show up.
+
+Example:
+    result = await measure("generate", lambda: llm.generate("hi"), iterations=100)
+    report = BenchmarkReport(results={result.name: result})
+    regressions = compare(report, BenchmarkReport.load("baseline.json"))
+"""
+
+import asyncio
+import gc
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from numpy import percentile
+from pydantic import BaseModel, Field
+
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LatencyStats(BaseModel):
+    """Latency distribution of an operation, in seconds."""
+
+    count: int = 0
+    mean: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: List[float]) -> "LatencyStats":
+        if not samples:
+            return cls()
+
+        p50, p90, p99 = percentile(samples, [50, 90, 99])
+        return cls(
+            count=len(samples),
+            mean=sum(samples) / len(samples),
+            min=min(samples),
+            max=max(samples),
+            p50=float(p50),
+            p90=float(p90),
+            p99=float(p99),
+        )
+
+
+class BenchmarkResult(BaseModel):
+    """Measurements of a benchmark."""
+
+    name: str
+    """Name of the benchmark"""
+
+    description: str | None = None
+    """What the benchmark measures"""
+
+    iterations: int
+    """Number of measured operations"""
+
+    concurrency: int = 1
+    """Number of operations run concurrently"""
+
+    errors: int = 0
+    """Number of operations that raised an error"""
+
+    duration_seconds: float
+    """Wall time of all measured operations"""
+
+    throughput: float
+    """Operations completed per second"""
+
+    latency: LatencyStats
+    """Latency of the operations"""
+
+
+class BenchmarkReport(BaseModel):
+    """Results of a benchmark run, which can be saved as a baseline."""
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    """When the benchmarks ran"""
+
+    python_version: str = Field(default_factory=lambda: sys.version.split()[0])
+    """Python version the benchmarks ran on"""
+
+    platform: str = Field(default_factory=platform.platform)
+    """Platform the benchmarks ran on"""
+
+    settings: Dict[str, Any] = Field(default_factory=dict)
+    """Workloads the benchmarks ran with; results are only comparable for equal settings"""
+
+    results: Dict[str, BenchmarkResult] = Field(default_factory=dict)
+    """Results by benchmark name"""
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(self.model_dump_json(indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BenchmarkReport":
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+class Regression(BaseModel):
+    """A metric of a benchmark that got worse than its baseline beyond the tolerance."""
+
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (e.g. 0.3 for 30% more)."""
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+async def measure(
+    name: str,
+    operation: Callable[[], Awaitable[Any]],
+    iterations: int = 100,
+    concurrency: int = 1,
+    warmup: int = 1,
+    description: str | None = None,
+    freeze_heap: bool = True,
+) -> BenchmarkResult:
+    """
+    Run `operation` `iterations` times, at most `concurrency` at a time, after `warmup`
+    unmeasured runs, and return its throughput and latency distribution.
+
+    With `freeze_heap`, the objects that exist before measuring are exempted from
+    garbage collection while measuring, so that full collections of a large heap,
+    which pause the whole process for as long as it takes to traverse it, don't add
+    noise unrelated to the operation to its tail latency.
+    """
+    for _ in range(warmup):
+        await operation()
+
+    if freeze_heap:
+        gc.collect()
+        gc.freeze()
+
+    latencies: List[float] = []
+    errors = 0
+    # Workers take the iterations in turn, rather than a task per iteration
+    # waiting on a semaphore, so starting the run doesn't delay the first operations
+    remaining = iter(range(iterations))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await operation()
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Benchmark {name}: operation failed: {e}")
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, iterations))))
+    finally:
+        duration = time.perf_counter() - start
+        if freeze_heap:
+            gc.unfreeze()
+
+    return BenchmarkResult(
+        name=name,
+        description=description,
+        iterations=iterations,
+        concurrency=concurrency,
+        errors=errors,
+        duration_seconds=duration,
+        throughput=len(latencies) / duration if duration else 0.0,
+        latency=LatencyStats.from_samples(latencies),
+    )
+
+
+def compare(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    tolerance: float = 0.25,
+    min_latency_delta_seconds: float = 0.002,
+) -> List[Regression]:
+    """
+    Compare a report with a baseline, returning the regressions: throughput lower, or
+    p50/p99 latency higher, than the baseline's by more than `tolerance` (relative).
+    Latency increases below `min_latency_delta_seconds` are ignored as noise.
+    Benchmarks missing from either report are skipped.
+    """
+    regressions: List[Regression] = []
+    for name, result in report.results.items():
+        base = baseline.results.get(name)
+        if base is None:
+            continue
+
+        if result.errors > base.errors:
+            regressions.append(
+                Regression(
+                    benchmark=name,
+                    metric="errors",
+                    baseline=base.errors,
+                    current=result.errors,
+                )
+            )
+
+        if result.throughput < base.throughput * (1 - tolerance):
+            regressions.append(
+                Regression(
+                    benchmark=name,
+                    metric="throughput",
+                    baseline=base.throughput,
+                    current=result.throughput,
+                )
+            )
+
+        for metric in ("p50", "p99"):
+            current = getattr(result.latency, metric)
+            previous = getattr(base.latency, metric)
+            if (
+                current > previous * (1 + tolerance)
+                and current - previous > min_latency_delta_seconds
+            ):
+                regressions.append(
+                    Regression(
+                        benchmark=name,
+                        metric=f"latency.{metric}",
+                        baseline=previous,
+                        current=current,
+                    )
+                )
+
+    return regressions
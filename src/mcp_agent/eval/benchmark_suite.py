@@ -0,0 +1,383 @@
+"""
+Benchmarks of the framework's hot paths, run against mock LLM providers and mock MCP
+servers so that they need no network access and measure the framework's own overhead:
+
+- generate_tool_loop: an AugmentedLLM generation with tool calls to an MCP server
+- parallel_fan_out: a ParallelLLM fanning a request out to several LLMs and back in
+- orchestrator_plan: an Orchestrator planning, executing and synthesizing a full plan
+- embedding_router: routing a request among many categories with an EmbeddingRouter
+- event_bus_logging: logging an event and dispatching it through the event bus
+
+Example:
+    report = await run_benchmarks(BenchmarkSuiteSettings(iterations=20))
+    report.save("baseline.json")
+    ...
+    regressions = compare(report, BenchmarkReport.load("baseline.json"))
+"""
+
+import asyncio
+import itertools
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Literal
+
+from pydantic import BaseModel, Field
+
+from mcp_agent.agents.agent import Agent
+from mcp_agent.app import MCPApp
+from mcp_agent.config import (
+    LoggerSettings,
+    MCPServerSettings,
+    MCPSettings,
+    OpenTelemetrySettings,
+    Settings,
+)
+from mcp_agent.context import Context
+from mcp_agent.eval.benchmark import BenchmarkReport, BenchmarkResult, measure
+from mcp_agent.eval.mock_llm import (
+    MockAugmentedLLM,
+    MockEmbeddingModel,
+    MockProviderSettings,
+)
+from mcp_agent.eval.mock_server import (
+    MockServerSettings,
+    create_mock_server,
+    in_process_transport,
+    stdio_server_settings,
+)
+from mcp_agent.logging.events import Event, EventFilter
+from mcp_agent.logging.listeners import FilteredListener
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.workflows.llm.augmented_llm import RequestParams
+from mcp_agent.workflows.orchestrator.orchestrator import Orchestrator
+from mcp_agent.workflows.orchestrator.orchestrator_models import (
+    AgentTask,
+    Plan,
+    Step,
+)
+from mcp_agent.workflows.parallel.parallel_llm import ParallelLLM
+from mcp_agent.workflows.router.router_embedding import EmbeddingRouter
+
+logger = get_logger(__name__)
+
+REFERENCE_BASELINE_PATH = (
+    Path(__file__).parent.parent / "data" / "benchmark_baseline.json"
+)
+"""
+Reference report shipped with the package, measured with the default suite settings
+on the maintainers' machine. It gives an idea of the expected results, but isn't
+comparable with runs on other machines: save a baseline on the machine that runs
+the regression checks instead.
+"""
+
+MOCK_SERVER_NAME = "mock"
+
+
+class BenchmarkSuiteSettings(BaseModel):
+    """Workloads of the benchmark suite."""
+
+    iterations: int = 50
+    """Number of measured operations of each benchmark"""
+
+    concurrency: int = 8
+    """Number of operations run concurrently"""
+
+    llm: MockProviderSettings = Field(
+        default_factory=lambda: MockProviderSettings(
+            latency_seconds=0.01, output_tokens=200, tool_turns=2, tool_calls_per_turn=2
+        )
+    )
+    """Behavior of the mock LLM provider"""
+
+    server: MockServerSettings = Field(
+        default_factory=lambda: MockServerSettings(
+            tools=8, tool_latency_seconds=0.002, payload_bytes=4096
+        )
+    )
+    """Behavior of the mock MCP server"""
+
+    server_transport: Literal["in_process", "stdio"] = "in_process"
+    """Run the mock MCP server in-process, or in a subprocess over stdio"""
+
+    fan_out: int = 8
+    """Number of LLMs a ParallelLLM fans out to"""
+
+    plan_steps: int = 3
+    """Number of steps of orchestrator plans"""
+
+    plan_tasks_per_step: int = 3
+    """Number of (parallel) tasks of each step of orchestrator plans"""
+
+    router_categories: int = 64
+    """Number of categories the EmbeddingRouter chooses from"""
+
+    embedding_dim: int = 256
+    """Dimensionality of the mock embeddings"""
+
+    log_iterations: int = 20000
+    """Number of events of the event bus benchmark"""
+
+    log_concurrency: int = 256
+    """Number of events in flight in the event bus benchmark"""
+
+
+BenchmarkFunction = Callable[
+    [Context, BenchmarkSuiteSettings], Awaitable[BenchmarkResult]
+]
+
+
+async def benchmark_generate_tool_loop(
+    context: Context, settings: BenchmarkSuiteSettings
+) -> BenchmarkResult:
+    agent = Agent(
+        name="benchmark_agent",
+        instruction="You answer questions using the tools of the mock server.",
+        server_names=[MOCK_SERVER_NAME],
+        context=context,
+    )
+    async with agent:
+        llm = MockAugmentedLLM(agent=agent, settings=settings.llm, context=context)
+        params = RequestParams(use_history=False)
+
+        return await measure(
+            "generate_tool_loop",
+            lambda: llm.generate("What's in the mock data?", request_params=params),
+            iterations=settings.iterations,
+            concurrency=settings.concurrency,
+            description=(
+                f"generate() with {settings.llm.tool_turns} tool turns of "
+                f"{settings.llm.tool_calls_per_turn} calls to a "
+                f"{settings.server_transport} MCP server"
+            ),
+        )
+
+
+async def benchmark_parallel_fan_out(
+    context: Context, settings: BenchmarkSuiteSettings
+) -> BenchmarkResult:
+    llm_settings = settings.llm.model_copy(update={"tool_turns": 0})
+    parallel = ParallelLLM(
+        fan_in_agent=MockAugmentedLLM(
+            name="fan_in", settings=llm_settings, context=context
+        ),
+        fan_out_agents=[
+            MockAugmentedLLM(
+                name=f"fan_out_{i}", settings=llm_settings, context=context
+            )
+            for i in range(settings.fan_out)
+        ],
+        context=context,
+    )
+    params = RequestParams(use_history=False)
+
+    return await measure(
+        "parallel_fan_out",
+        lambda: parallel.generate("Review this proposal.", request_params=params),
+        iterations=settings.iterations,
+        concurrency=settings.concurrency,
+        description=f"ParallelLLM.generate() fanning out to {settings.fan_out} LLMs",
+    )
+
+
+async def benchmark_orchestrator_plan(
+    context: Context, settings: BenchmarkSuiteSettings
+) -> BenchmarkResult:
+    llm_settings = settings.llm.model_copy(update={"tool_turns": 0})
+    worker_names = [f"worker_{i}" for i in range(settings.plan_tasks_per_step)]
+    plan = Plan(
+        steps=[
+            Step(
+                description=f"Step {step}",
+                tasks=[
+                    AgentTask(description=f"Task {step}.{task}", agent=worker)
+                    for task, worker in enumerate(worker_names)
+                ],
+            )
+            for step in range(settings.plan_steps)
+        ],
+        is_complete=False,
+    )
+
+    async def run_plan():
+        # The planner returns the plan, then declares the objective complete
+        plans = iter([plan, Plan(steps=[], is_complete=True)])
+        orchestrator = Orchestrator(
+            llm_factory=lambda agent: MockAugmentedLLM(
+                agent=agent, settings=llm_settings, context=context
+            ),
+            planner=MockAugmentedLLM(
+                name="planner",
+                settings=llm_settings,
+                structured_output=lambda response_model, text: next(plans),
+                context=context,
+            ),
+            available_agents=[
+                Agent(name=name, instruction=f"You are {name}.", context=context)
+                for name in worker_names
+            ],
+            plan_type="full",
+            context=context,
+        )
+        return await orchestrator.generate("Write a report on the mock data.")
+
+    return await measure(
+        "orchestrator_plan",
+        run_plan,
+        iterations=settings.iterations,
+        concurrency=settings.concurrency,
+        description=(
+            f"Orchestrator.generate() of a full plan of {settings.plan_steps} steps "
+            f"of {settings.plan_tasks_per_step} tasks"
+        ),
+    )
+
+
+async def benchmark_embedding_router(
+    context: Context, settings: BenchmarkSuiteSettings
+) -> BenchmarkResult:
+    topics = ["billing", "shipping", "returns", "accounts", "security", "search"]
+
+    def make_function(i: int) -> Callable:
+        def handler(request: str) -> str:
+            return request
+
+        topic = topics[i % len(topics)]
+        handler.__name__ = f"handle_{topic}_{i}"
+        handler.__doc__ = (
+            f"Handles {topic} requests of kind {i}, such as {topic} issue {i}."
+        )
+        return handler
+
+    router = await EmbeddingRouter.create(
+        embedding_model=MockEmbeddingModel(dim=settings.embedding_dim, context=context),
+        functions=[make_function(i) for i in range(settings.router_categories)],
+        context=context,
+    )
+    requests = itertools.cycle(
+        f"I have a {topic} issue {i}" for i, topic in enumerate(topics * 4)
+    )
+
+    return await measure(
+        "embedding_router",
+        lambda: router.route(next(requests), top_k=3),
+        iterations=settings.iterations,
+        concurrency=settings.concurrency,
+        description=(
+            f"EmbeddingRouter.route() among {settings.router_categories} categories"
+        ),
+    )
+
+
+class _DeliveryListener(FilteredListener):
+    """Resolves the futures of benchmark events as they are dispatched."""
+
+    def __init__(self, namespace: str):
+        super().__init__(event_filter=EventFilter(namespaces={namespace}))
+        self.pending: Dict[int, asyncio.Future] = {}
+
+    async def handle_matched_events(self, events: List[Event]):
+        for event in events:
+            future = self.pending.pop(event.data.get("seq"), None)
+            if future is not None and not future.done():
+                future.set_result(None)
+
+
+async def benchmark_event_bus_logging(
+    context: Context, settings: BenchmarkSuiteSettings
+) -> BenchmarkResult:
+    namespace = f"{__name__}.events"
+    event_logger = get_logger(namespace)
+    bus = event_logger.event_bus
+    listener = _DeliveryListener(namespace)
+    bus.add_listener("benchmark", listener)
+    sequence = itertools.count()
+
+    async def log_event():
+        seq = next(sequence)
+        future = asyncio.get_running_loop().create_future()
+        listener.pending[seq] = future
+        event_logger.info(
+            "Benchmark event", name="benchmark", seq=seq, payload={"value": seq}
+        )
+        await future
+
+    try:
+        return await measure(
+            "event_bus_logging",
+            log_event,
+            iterations=settings.log_iterations,
+            concurrency=settings.log_concurrency,
+            description="Logger.info() until the event bus dispatches the event",
+        )
+    finally:
+        bus.remove_listener("benchmark")
+
+
+BENCHMARKS: Dict[str, BenchmarkFunction] = {
+    "generate_tool_loop": benchmark_generate_tool_loop,
+    "parallel_fan_out": benchmark_parallel_fan_out,
+    "orchestrator_plan": benchmark_orchestrator_plan,
+    "embedding_router": benchmark_embedding_router,
+    "event_bus_logging": benchmark_event_bus_logging,
+}
+
+
+def create_benchmark_app(settings: BenchmarkSuiteSettings) -> MCPApp:
+    """
+    Create an app configured with the mock MCP server, that logs warnings only
+    and doesn't export traces.
+    """
+    if settings.server_transport == "stdio":
+        server_settings = stdio_server_settings(settings.server, MOCK_SERVER_NAME)
+    else:
+        server_settings = MCPServerSettings(
+            name=MOCK_SERVER_NAME, description="Mock MCP server for benchmarks"
+        )
+
+    return MCPApp(
+        name="mcp_agent_benchmark",
+        settings=Settings(
+            mcp=MCPSettings(servers={MOCK_SERVER_NAME: server_settings}),
+            logger=LoggerSettings(type="none", level="warning"),
+            otel=OpenTelemetrySettings(enabled=False),
+        ),
+        human_input_callback=None,
+    )
+
+
+async def run_benchmarks(
+    settings: BenchmarkSuiteSettings | None = None,
+    names: List[str] | None = None,
+    on_result: Callable[[BenchmarkResult], Any] | None = None,
+) -> BenchmarkReport:
+    """
+    Run the benchmarks of the suite (or those in `names`) one after the other,
+    calling `on_result` with the result of each as it completes.
+    """
+    settings = settings or BenchmarkSuiteSettings()
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmarks {unknown}, choose from {list(BENCHMARKS)}"
+        )
+
+    report = BenchmarkReport(settings=settings.model_dump(mode="json"))
+    app = create_benchmark_app(settings)
+    async with app.run() as running_app:
+        context = running_app.context
+        if settings.server_transport == "in_process":
+            context.server_registry.register_transport(
+                MOCK_SERVER_NAME,
+                in_process_transport(
+                    create_mock_server(settings.server, MOCK_SERVER_NAME)
+                ),
+            )
+
+        for name in names:
+            logger.info(f"Running benchmark {name}")
+            result = await BENCHMARKS[name](context, settings)
+            report.results[name] = result
+            if on_result:
+                on_result(result)
+
+    return report
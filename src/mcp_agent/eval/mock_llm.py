@@ -0,0 +1,362 @@
+"""
+Deterministic mock LLM provider and embedding model, for benchmarks and tests that
+must run without network access.
+
+MockAugmentedLLM runs the same tool loop as the provider AugmentedLLMs: each request
+goes through `call_provider` (executor, concurrency limits, token budget, usage
+accounting, tracing) and each requested tool is called through the LLM's aggregator.
+Only the provider itself is simulated, by a MockProvider that answers after a configured
+latency with a configured number of output tokens, requesting tools for the first
+`tool_turns` turns of each generation.
+
+Example:
+    llm = MockAugmentedLLM(
+        agent=agent,
+        settings=MockProviderSettings(latency_seconds=0.05, tool_turns=2),
+    )
+    result = await llm.generate_str("What's the weather?")
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from typing import Any, Callable, Dict, List, Literal, Optional, Type, TYPE_CHECKING
+
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    TextContent,
+)
+from numpy import float32, stack, zeros
+from numpy.linalg import norm
+from pydantic import BaseModel, Field
+
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+from mcp_agent.workflows.llm.augmented_llm import (
+    AugmentedLLM,
+    ModelT,
+    RequestParams,
+    llm_iterations,
+)
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.context import Context
+
+logger = get_logger(__name__)
+
+MockMessageParam = Dict[str, Any]
+"""A message sent to the mock provider: a dict with a role and content."""
+
+
+class MockProviderSettings(BaseModel):
+    """Behavior of a mock LLM provider."""
+
+    model: str = "mock-model"
+    """Name of the model reported in responses"""
+
+    latency_seconds: float = 0.05
+    """Time taken to answer each request"""
+
+    latency_jitter_seconds: float = 0.0
+    """Maximum random time added to the latency of each request (seeded, so reproducible)"""
+
+    output_tokens: int = 100
+    """Number of output tokens of each response"""
+
+    tool_turns: int = 0
+    """Number of turns of each generation that request tool calls before answering"""
+
+    tool_calls_per_turn: int = 1
+    """Number of tools called in each tool turn"""
+
+    response_text: str | None = None
+    """Fixed text of the final answers, instead of `output_tokens` generated tokens"""
+
+    seed: int = 0
+    """Seed of the latency jitter"""
+
+
+class MockUsage(BaseModel):
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class MockToolCall(BaseModel):
+    id: str
+    name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+
+
+class MockMessage(BaseModel):
+    """A response of the mock provider, shaped like an Anthropic Message."""
+
+    id: str
+    model: str
+    role: Literal["assistant"] = "assistant"
+    content: str = ""
+    tool_calls: List[MockToolCall] = Field(default_factory=list)
+    stop_reason: Literal["end_turn", "tool_use"] = "end_turn"
+    usage: MockUsage = Field(default_factory=MockUsage)
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count of a text (about 4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class MockProvider:
+    """Simulated LLM provider API, answering requests after a configured latency."""
+
+    def __init__(self, settings: MockProviderSettings | None = None):
+        self.settings = settings or MockProviderSettings()
+        self._random = random.Random(self.settings.seed)
+        self._requests = 0
+
+    def next_latency(self) -> float:
+        """Return the latency of the next request."""
+        jitter = self.settings.latency_jitter_seconds
+        if not jitter:
+            return self.settings.latency_seconds
+        return self.settings.latency_seconds + self._random.uniform(0, jitter)
+
+    async def create(
+        self,
+        messages: List[MockMessageParam],
+        tools: List[str] | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> MockMessage:
+        """Answer a request, like a provider SDK's message creation function."""
+        self._requests += 1
+        request_id = f"mock-{self._requests}"
+        await asyncio.sleep(self.next_latency())
+
+        input_tokens = sum(count_tokens(str(m.get("content", ""))) for m in messages)
+        input_tokens += sum(count_tokens(tool) for tool in tools or [])
+
+        # Request tools in the first turns after the latest user message
+        turn = 0
+        for message in reversed(messages):
+            if message.get("role") == "user":
+                break
+            if message.get("role") == "assistant":
+                turn += 1
+
+        settings = self.settings
+        if tools and turn < settings.tool_turns:
+            tool_calls = [
+                MockToolCall(
+                    id=f"{request_id}-{i}",
+                    name=tools[(turn * settings.tool_calls_per_turn + i) % len(tools)],
+                    arguments={"query": f"turn {turn}, call {i}"},
+                )
+                for i in range(settings.tool_calls_per_turn)
+            ]
+            return MockMessage(
+                id=request_id,
+                model=settings.model,
+                tool_calls=tool_calls,
+                stop_reason="tool_use",
+                usage=MockUsage(
+                    input_tokens=input_tokens,
+                    output_tokens=sum(
+                        count_tokens(json.dumps(call.model_dump()))
+                        for call in tool_calls
+                    ),
+                ),
+            )
+
+        output_tokens = settings.output_tokens
+        if max_tokens:
+            output_tokens = min(output_tokens, max_tokens)
+        content = (
+            settings.response_text
+            if settings.response_text is not None
+            else " ".join(f"tok{i % 100}" for i in range(output_tokens))
+        )
+        return MockMessage(
+            id=request_id,
+            model=settings.model,
+            content=content,
+            usage=MockUsage(input_tokens=input_tokens, output_tokens=output_tokens),
+        )
+
+
+class MockAugmentedLLM(AugmentedLLM[MockMessageParam, MockMessage]):
+    """
+    An AugmentedLLM backed by a MockProvider, with the tool loop of the provider LLMs.
+    Structured outputs are parsed from the response text as JSON, or made by
+    `structured_output(response_model, text)` if given.
+    """
+
+    def __init__(
+        self,
+        *args,
+        settings: MockProviderSettings | None = None,
+        structured_output: Callable[[Type[ModelT], str], ModelT] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.provider = "Mock"
+        self.settings = settings or MockProviderSettings()
+        self.mock_provider = MockProvider(self.settings)
+        self.structured_output = structured_output
+
+        self.default_request_params = self.default_request_params or RequestParams(
+            model=self.settings.model,
+            maxTokens=2048,
+            systemPrompt=self.instruction,
+            max_iterations=10,
+            use_history=True,
+        )
+
+    async def generate(
+        self,
+        message: str | MockMessageParam | List[MockMessageParam],
+        request_params: RequestParams | None = None,
+    ) -> List[MockMessage]:
+        params = self.get_request_params(request_params)
+        messages: List[MockMessageParam] = []
+
+        if params.use_history:
+            messages.extend(self.history.get())
+
+        if isinstance(message, str):
+            messages.append({"role": "user", "content": message})
+        elif isinstance(message, list):
+            messages.extend(message)
+        else:
+            messages.append(message)
+
+        response = await self.aggregator.list_tools()
+        tools = [tool.name for tool in response.tools]
+
+        responses: List[MockMessage] = []
+        model = params.model or self.settings.model
+
+        for i in range(params.max_iterations):
+            response = await self.call_provider(
+                model,
+                self.mock_provider.create,
+                params,
+                messages=list(messages),
+                tools=tools,
+                max_tokens=params.maxTokens,
+            )
+
+            messages.append(self.convert_message_to_message_param(response))
+            responses.append(response)
+
+            if response.stop_reason != "tool_use":
+                break
+
+            for tool_call in response.tool_calls:
+                result = await self.call_tool(
+                    request=CallToolRequest(
+                        method="tools/call",
+                        params=CallToolRequestParams(
+                            name=tool_call.name, arguments=tool_call.arguments
+                        ),
+                    ),
+                    tool_call_id=tool_call.id,
+                )
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": tool_call.id,
+                        "content": self._tool_result_text(result),
+                    }
+                )
+
+        if params.use_history:
+            self.history.set(messages)
+
+        llm_iterations.record(len(responses), provider=self.provider)
+        return responses
+
+    async def generate_str(
+        self,
+        message: str | MockMessageParam | List[MockMessageParam],
+        request_params: RequestParams | None = None,
+    ) -> str:
+        responses = await self.generate(message=message, request_params=request_params)
+        return "\n".join(self.message_str(response) for response in responses)
+
+    async def generate_structured(
+        self,
+        message: str | MockMessageParam | List[MockMessageParam],
+        response_model: Type[ModelT],
+        request_params: RequestParams | None = None,
+    ) -> ModelT:
+        responses = await self.generate(message=message, request_params=request_params)
+        text = responses[-1].content if responses else ""
+        if self.structured_output:
+            return self.structured_output(response_model, text)
+        return response_model.model_validate_json(text)
+
+    @classmethod
+    def convert_message_to_message_param(
+        cls, message: MockMessage, **kwargs
+    ) -> MockMessageParam:
+        """Convert a response object to an input parameter object to allow LLM calls to be chained."""
+        param: MockMessageParam = {"role": "assistant", "content": message.content}
+        if message.tool_calls:
+            param["tool_calls"] = [call.model_dump() for call in message.tool_calls]
+        return param
+
+    def message_str(self, message: MockMessage) -> str:
+        """Convert an output message to a string representation."""
+        if message.tool_calls:
+            return "\n".join(
+                f"[Calling tool {call.name} with args {call.arguments}]"
+                for call in message.tool_calls
+            )
+        return message.content
+
+    @staticmethod
+    def _tool_result_text(result: CallToolResult) -> str:
+        return "\n".join(
+            content.text
+            for content in result.content or []
+            if isinstance(content, TextContent)
+        )
+
+
+class MockEmbeddingModel(EmbeddingModel):
+    """
+    Embedding model that embeds texts deterministically by hashing their words into
+    the vector's dimensions (so texts sharing words are similar), after a configured latency.
+    """
+
+    def __init__(
+        self,
+        dim: int = 256,
+        latency_seconds: float = 0.0,
+        context: Optional["Context"] = None,
+    ):
+        super().__init__(context=context)
+        self.dim = dim
+        self.latency_seconds = latency_seconds
+
+    async def embed(self, data: List[str]) -> FloatArray:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return stack([self._embed_text(text) for text in data])
+
+    def _embed_text(self, text: str) -> FloatArray:
+        vector = zeros(self.dim, dtype=float32)
+        for word in text.lower().split():
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            index = int.from_bytes(digest[:4], "little") % self.dim
+            vector[index] += 1.0 if digest[4] & 1 else -1.0
+
+        length = norm(vector)
+        return vector / length if length else vector
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.dim
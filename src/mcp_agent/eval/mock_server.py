@@ -0,0 +1,144 @@
+"""
+Mock MCP server with tools that answer after a configured latency with a payload of
+a configured size, for benchmarks and tests that must run without network access.
+
+The server can run in a subprocess over stdio, like real MCP servers:
+    python -m mcp_agent.eval.mock_server --tools 4 --tool-latency-ms 20 --payload-bytes 2048
+
+or in-process over memory streams, which measures the client side alone:
+    registry.registry["mock"] = MCPServerSettings(name="mock")
+    registry.register_transport("mock", in_process_transport(create_mock_server()))
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+
+import anyio
+import typer
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_client_server_memory_streams
+from pydantic import BaseModel
+
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.mcp_server_registry import TransportContextFactory
+
+_PAYLOAD_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+class MockServerSettings(BaseModel):
+    """Behavior of a mock MCP server."""
+
+    tools: int = 4
+    """Number of tools the server provides (named mock_tool_0, mock_tool_1, ...)"""
+
+    tool_latency_seconds: float = 0.01
+    """Time taken by each tool call"""
+
+    payload_bytes: int = 1024
+    """Size of the text returned by each tool call"""
+
+
+def make_payload(size: int) -> str:
+    """Return a deterministic ASCII text of `size` bytes."""
+    repeats = size // len(_PAYLOAD_ALPHABET) + 1
+    return (_PAYLOAD_ALPHABET * repeats)[:size]
+
+
+def create_mock_server(
+    settings: MockServerSettings | None = None, name: str = "mock"
+) -> FastMCP:
+    """Create a mock MCP server."""
+    settings = settings or MockServerSettings()
+    payload = make_payload(settings.payload_bytes)
+    # Keep the server's per-request logs out of the benchmark's output
+    server = FastMCP(name, log_level="WARNING")
+
+    async def mock_tool(query: str = "") -> str:
+        await asyncio.sleep(settings.tool_latency_seconds)
+        return payload
+
+    for i in range(settings.tools):
+        server.add_tool(
+            mock_tool,
+            name=f"mock_tool_{i}",
+            description=f"Mock tool {i}, returns {settings.payload_bytes} bytes",
+        )
+
+    return server
+
+
+def in_process_transport(server: FastMCP) -> TransportContextFactory:
+    """
+    Return a transport that runs the server in-process, connected over memory streams,
+    to register with `ServerRegistry.register_transport`.
+    """
+
+    @asynccontextmanager
+    async def connect():
+        async with create_client_server_memory_streams() as (
+            client_streams,
+            server_streams,
+        ):
+            lowlevel_server = server._mcp_server
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(
+                    lambda: lowlevel_server.run(
+                        server_streams[0],
+                        server_streams[1],
+                        lowlevel_server.create_initialization_options(),
+                    )
+                )
+                try:
+                    yield client_streams
+                finally:
+                    tg.cancel_scope.cancel()
+
+    return connect
+
+
+def stdio_server_settings(
+    settings: MockServerSettings | None = None, name: str = "mock"
+) -> MCPServerSettings:
+    """Return the configuration of a mock MCP server run in a subprocess over stdio."""
+    settings = settings or MockServerSettings()
+    return MCPServerSettings(
+        name=name,
+        description="Mock MCP server for benchmarks",
+        transport="stdio",
+        command=sys.executable,
+        args=[
+            "-m",
+            "mcp_agent.eval.mock_server",
+            "--name",
+            name,
+            "--tools",
+            str(settings.tools),
+            "--tool-latency-ms",
+            str(settings.tool_latency_seconds * 1000),
+            "--payload-bytes",
+            str(settings.payload_bytes),
+        ],
+    )
+
+
+def main(
+    name: str = "mock",
+    tools: int = 4,
+    tool_latency_ms: float = 10.0,
+    payload_bytes: int = 1024,
+):
+    """Run a mock MCP server over stdio."""
+    server = create_mock_server(
+        MockServerSettings(
+            tools=tools,
+            tool_latency_seconds=tool_latency_ms / 1000,
+            payload_bytes=payload_bytes,
+        ),
+        name=name,
+    )
+    server.run("stdio")
+
+
+if __name__ == "__main__":
+    typer.run(main)
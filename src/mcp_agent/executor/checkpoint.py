@@ -0,0 +1,252 @@
+"""
+Durable checkpoints for workflows run with the asyncio engine.
+
+Temporal records every completed activity in the workflow history, so a crashed workflow
+resumes where it left off. With the asyncio engine, a process restart would otherwise lose
+an in-progress workflow along with all the tokens already spent on it. A CheckpointStore
+records the results of completed work keyed by workflow id:
+    - steps of Workflow.run (see Workflow.run_step)
+    - Orchestrator plan results, after every completed step
+    - @workflow_task results
+
+Running the same workflow id again resumes it, skipping the work that is already done.
+
+Example:
+    with checkpoint_scope("nightly-report-2025-01-01"):
+        result = await orchestrator.execute(objective)
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from mcp_agent.config import CheckpointSettings
+from mcp_agent.executor.storage import SQLiteStore, atomic_write_bytes
+
+T = TypeVar("T")
+
+
+def stable_hash(*args: Any, **kwargs: Any) -> str:
+    """
+    Hash arguments into a key that is stable across processes and runs.
+    Raises TypeError/ValueError for values that can't be serialized to JSON.
+    """
+    payload = json.dumps(
+        to_jsonable_python([args, kwargs]), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _takes_instance(func: Callable) -> bool:
+    """Whether a (not bound) function is a method taking its instance or class first."""
+    try:
+        parameters = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(parameters) and parameters[0] in ("self", "cls")
+
+
+def task_arguments_hash(func: Callable, *args: Any, **kwargs: Any) -> str:
+    """
+    Hash the arguments of a call to a task function with stable_hash. For tasks that
+    are methods, the instance (or class) the task is called on is left out: it's the
+    caller (e.g. the workflow), not an input of the task.
+    Raises TypeError/ValueError for other arguments that can't be serialized to JSON.
+    """
+    if args and not inspect.ismethod(func) and _takes_instance(func):
+        args = args[1:]
+    return stable_hash(*args, **kwargs)
+
+
+class CheckpointStore(ABC):
+    """Stores JSON-serializable results of completed work, keyed by workflow id and key."""
+
+    @abstractmethod
+    async def load(self, workflow_id: str, key: str) -> Any:
+        """Return the value stored for the key. Raises KeyError if there is none."""
+
+    @abstractmethod
+    async def save(self, workflow_id: str, key: str, value: Any) -> None:
+        """Store a value for the key, replacing any previous value."""
+
+    @abstractmethod
+    async def load_all(self, workflow_id: str) -> Dict[str, Any]:
+        """Return all values stored for a workflow, keyed by key."""
+
+    @abstractmethod
+    async def delete(self, workflow_id: str) -> None:
+        """Delete all checkpoints of a workflow (e.g. once it has completed)."""
+
+
+class SQLiteCheckpointStore(SQLiteStore, CheckpointStore):
+    """Checkpoint store backed by a SQLite database file."""
+
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            workflow_id TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (workflow_id, key)
+        )
+        """,
+    )
+
+    async def load(self, workflow_id: str, key: str) -> Any:
+        rows = await self.execute(
+            "SELECT value FROM checkpoints WHERE workflow_id = ? AND key = ?",
+            (workflow_id, key),
+        )
+        if not rows:
+            raise KeyError(key)
+        return json.loads(rows[0][0])
+
+    async def save(self, workflow_id: str, key: str, value: Any) -> None:
+        await self.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+            (workflow_id, key, json.dumps(to_jsonable_python(value)), time.time()),
+        )
+
+    async def load_all(self, workflow_id: str) -> Dict[str, Any]:
+        rows = await self.execute(
+            "SELECT key, value FROM checkpoints WHERE workflow_id = ?",
+            (workflow_id,),
+        )
+        return {key: json.loads(value) for key, value in rows}
+
+    async def delete(self, workflow_id: str) -> None:
+        await self.execute(
+            "DELETE FROM checkpoints WHERE workflow_id = ?",
+            (workflow_id,),
+        )
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint store that keeps one JSON file per workflow in a directory."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = asyncio.Lock()
+
+    def _workflow_path(self, workflow_id: str) -> Path:
+        # Workflow ids are free-form, so hash them into safe file names
+        return self.path / f"{hashlib.sha256(workflow_id.encode()).hexdigest()}.json"
+
+    def _read(self, workflow_id: str) -> Dict[str, Any]:
+        path = self._workflow_path(workflow_id)
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())["checkpoints"]
+
+    def _write(self, workflow_id: str, checkpoints: Dict[str, Any]):
+        path = self._workflow_path(workflow_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"workflow_id": workflow_id, "checkpoints": checkpoints})
+        # A crash mid-write must not corrupt existing checkpoints
+        atomic_write_bytes(path, data.encode())
+
+    async def load(self, workflow_id: str, key: str) -> Any:
+        checkpoints = await asyncio.to_thread(self._read, workflow_id)
+        return checkpoints[key]
+
+    async def save(self, workflow_id: str, key: str, value: Any) -> None:
+        value = to_jsonable_python(value)
+        async with self._lock:
+            checkpoints = await asyncio.to_thread(self._read, workflow_id)
+            checkpoints[key] = value
+            await asyncio.to_thread(self._write, workflow_id, checkpoints)
+
+    async def load_all(self, workflow_id: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._read, workflow_id)
+
+    async def delete(self, workflow_id: str) -> None:
+        async with self._lock:
+            path = self._workflow_path(workflow_id)
+            if path.exists():
+                await asyncio.to_thread(path.unlink)
+
+
+def create_checkpoint_store(settings: CheckpointSettings) -> CheckpointStore:
+    """Create the checkpoint store configured in the settings."""
+    if settings.backend == "sqlite":
+        return SQLiteCheckpointStore(settings.path or ".mcp-agent/checkpoints.db")
+    elif settings.backend == "file":
+        return FileCheckpointStore(settings.path or ".mcp-agent/checkpoints")
+    else:
+        raise ValueError(f"Unsupported checkpoint store backend: {settings.backend}")
+
+
+class CheckpointScope:
+    """The workflow that checkpoints are currently recorded for."""
+
+    def __init__(self, workflow_id: str):
+        self.workflow_id = workflow_id
+        self._occurrences: Dict[str, int] = {}
+
+    def next_key(self, key: str) -> str:
+        """
+        Return a unique key for the next occurrence of `key` in this workflow run,
+        so that repeated identical calls get their own checkpoints.
+        Occurrences are numbered in call order, which is stable across runs.
+        """
+        occurrence = self._occurrences.get(key, 0)
+        self._occurrences[key] = occurrence + 1
+        return f"{key}:{occurrence}"
+
+
+_checkpoint_scope: ContextVar[CheckpointScope | None] = ContextVar(
+    "mcp_agent_checkpoint_scope", default=None
+)
+
+
+@contextmanager
+def checkpoint_scope(workflow_id: str | CheckpointScope):
+    """
+    Record checkpoints for work done within this block (including tasks spawned from it)
+    under the given workflow id, and restore previously recorded results.
+    Pass a CheckpointScope to continue numbering the occurrences of an earlier block.
+    """
+    scope = (
+        workflow_id
+        if isinstance(workflow_id, CheckpointScope)
+        else CheckpointScope(workflow_id)
+    )
+    token = _checkpoint_scope.set(scope)
+    try:
+        yield
+    finally:
+        _checkpoint_scope.reset(token)
+
+
+def get_checkpoint_scope() -> CheckpointScope | None:
+    """Return the current checkpoint scope, or None if checkpoints aren't being recorded."""
+    return _checkpoint_scope.get()
+
+
+async def load_checkpoint(
+    store: CheckpointStore,
+    workflow_id: str,
+    key: str,
+    result_type: Type[T] | None = None,
+) -> T:
+    """
+    Load a checkpoint, validating it as `result_type` if given.
+    Raises KeyError if there is no checkpoint for the key.
+    """
+    value = await store.load(workflow_id, key)
+    if result_type is None:
+        return value
+    return TypeAdapter(result_type).validate_python(value)
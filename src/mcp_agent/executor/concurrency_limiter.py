@@ -0,0 +1,280 @@
+"""
+Adaptive concurrency control for calls to LLM and embedding providers.
+
+Each (provider, model) pair gets its own limiter that follows an AIMD policy:
+    - additive increase: the limit grows by `increase_step` for every `limit`
+      successful calls, as long as latency stays close to its baseline.
+    - multiplicative decrease: the limit is cut by `decrease_factor` when the
+      provider responds with a rate-limit error (e.g. HTTP 429).
+Rate-limited calls are retried, and no new calls are admitted until the
+provider's retry-after period has elapsed.
+"""
+
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Tuple, TypeVar
+
+from opentelemetry import trace
+
+from mcp_agent.config import ProviderConcurrencySettings
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+tracer = trace.get_tracer(__name__)
+
+R = TypeVar("R")
+
+RATE_LIMIT_STATUS_CODES = {429, 529}
+"""HTTP status codes that indicate a provider wants callers to back off (529 = Anthropic overloaded)."""
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check if an exception raised by a provider SDK is a rate-limit error."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+
+    if status_code in RATE_LIMIT_STATUS_CODES:
+        return True
+
+    return type(error).__name__ in ("RateLimitError", "TooManyRequestsError")
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """
+    Extract the retry-after period (in seconds) from a provider error, if present.
+    Supports `retry-after-ms`, and `retry-after` as either seconds or an HTTP date.
+    """
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(float(retry_after_ms) / 1000.0, 0.0)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(retry_at.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter for a single provider/model.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(ProviderConcurrencySettings())
+        response = await limiter.run(lambda: client.messages.create(**arguments))
+    """
+
+    def __init__(self, settings: ProviderConcurrencySettings, name: str | None = None):
+        self.settings = settings
+        self.name = name
+
+        self.limit: float = float(
+            min(max(settings.initial_limit, settings.min_limit), settings.max_limit)
+        )
+        self.in_flight = 0
+        self.blocked_until = 0.0
+
+        self.baseline_latency: float | None = None
+        self.smoothed_latency: float | None = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """Wait until the limiter admits another call. Waiting calls are admitted in FIFO order."""
+        woken = False
+        while True:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                # Honor the provider's retry-after before admitting anything new
+                with tracer.start_as_current_span("provider retry-after wait"):
+                    await asyncio.sleep(self.blocked_until - now)
+                continue
+
+            if self.in_flight < int(self.limit) and not self._waiters:
+                self.in_flight += 1
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            if woken:
+                # Woken up but the slot is gone (e.g. the limit decreased meanwhile):
+                # keep our place at the head of the queue rather than go to the back
+                self._waiters.appendleft(waiter)
+            else:
+                self._waiters.append(waiter)
+            try:
+                with tracer.start_as_current_span(
+                    "provider concurrency wait",
+                    attributes={"mcp_agent.limiter.limit": int(self.limit)},
+                ):
+                    await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # We were woken up as we got cancelled, pass the wake-up on
+                    self._wake_waiters()
+                raise
+
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return
+            woken = True
+
+    def release(
+        self,
+        latency: float | None = None,
+        rate_limited: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Release a call and adjust the limit based on its outcome.
+
+        Args:
+            latency: Duration of a successful call in seconds
+            rate_limited: Whether the provider rejected the call with a rate-limit error
+            retry_after: Seconds the provider asked us to wait before retrying
+        """
+        self.in_flight -= 1
+
+        if rate_limited:
+            self._on_rate_limited(retry_after)
+        elif latency is not None:
+            self._on_success(latency)
+
+        self._wake_waiters()
+
+    async def run(self, fn: Callable[[], Awaitable[R]]) -> R:
+        """
+        Run a provider call through the limiter, retrying after rate-limit errors.
+        `fn` must raise the provider's exception on failure.
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            start = time.monotonic()
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self.release()
+                raise
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    self.release()
+                    raise
+
+                retry_after = get_retry_after(e)
+                self.release(rate_limited=True, retry_after=retry_after)
+
+                if attempt >= self.settings.max_retries:
+                    raise
+
+                attempt += 1
+                logger.warning(
+                    f"Rate limited by provider {self.name}, retrying "
+                    f"(attempt {attempt}/{self.settings.max_retries})",
+                    data={"limit": int(self.limit), "retry_after": retry_after},
+                )
+                continue
+
+            self.release(latency=time.monotonic() - start)
+            return result
+
+    def _on_success(self, latency: float):
+        if self.smoothed_latency is None:
+            self.smoothed_latency = latency
+        else:
+            self.smoothed_latency += 0.2 * (latency - self.smoothed_latency)
+
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        else:
+            # Let the baseline drift slowly so it adapts to e.g. longer prompts
+            self.baseline_latency += 0.01 * (latency - self.baseline_latency)
+
+        if self.smoothed_latency <= self.settings.latency_tolerance * max(
+            self.baseline_latency, 1e-6
+        ):
+            # Latency is stable: grow by increase_step per `limit` successful calls
+            self.limit = min(
+                self.limit + self.settings.increase_step / max(self.limit, 1.0),
+                float(self.settings.max_limit),
+            )
+
+    def _on_rate_limited(self, retry_after: float | None):
+        now = time.monotonic()
+        if retry_after is None:
+            retry_after = self.settings.default_retry_after_seconds
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+
+        # Calls that were already in flight when we got throttled tend to be throttled too,
+        # so only decrease once per congestion event
+        window = self.smoothed_latency or retry_after
+        if now - self._last_decrease < window:
+            return
+
+        self._last_decrease = now
+        self.limit = max(
+            self.limit * self.settings.decrease_factor, float(self.settings.min_limit)
+        )
+
+    def _wake_waiters(self):
+        available = int(self.limit) - self.in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current state of the limiter."""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self.baseline_latency,
+            "smoothed_latency": self.smoothed_latency,
+            "blocked_for": max(self.blocked_until - time.monotonic(), 0.0),
+        }
+
+
+class ProviderConcurrencyLimiters:
+    """Keeps a separate AdaptiveConcurrencyLimiter for each provider and model."""
+
+    def __init__(self, settings: ProviderConcurrencySettings):
+        self.settings = settings
+        self._limiters: Dict[Tuple[str, str | None], AdaptiveConcurrencyLimiter] = {}
+
+    def get(
+        self, provider: str, model: str | None = None
+    ) -> AdaptiveConcurrencyLimiter:
+        key = (provider, model)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(
+                self.settings, name=f"{provider}/{model}" if model else provider
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every limiter, keyed by provider/model."""
+        return {limiter.name: limiter.stats() for limiter in self._limiters.values()}
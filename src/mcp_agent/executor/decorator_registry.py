@@ -3,8 +3,11 @@ Keep track of all workflow decorator overloads indexed by executor backend.
 Different executors may have different ways of configuring workflows.
 """
 
+import functools
 from typing import Callable, Dict, Type, TypeVar
 
+from mcp_agent.telemetry.token_usage import get_usage_workflow_id, usage_scope
+
 R = TypeVar("R")
 
 
@@ -80,10 +83,19 @@ def default_workflow_defn(cls: Type, *args, **kwargs) -> Type:
 
 
 def default_workflow_run(fn: Callable[..., R]) -> Callable[..., R]:
-    """Default no-op workflow run decorator."""
-
-    def wrapper(*args, **kwargs):
-        return fn(*args, **kwargs)
+    """
+    Default workflow run decorator, which attributes the LLM usage of the run
+    to the workflow's id (see Workflow.usage).
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        workflow_id = getattr(self, "workflow_id", None)
+        if workflow_id is None or get_usage_workflow_id() == workflow_id:
+            return await fn(self, *args, **kwargs)
+
+        with usage_scope(workflow_id):
+            return await fn(self, *args, **kwargs)
 
     return wrapper
 
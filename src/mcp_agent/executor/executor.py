@@ -1,5 +1,7 @@
 import asyncio
 import functools
+import time
+import typing
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from datetime import timedelta
@@ -18,7 +20,15 @@ from typing import (
 
 from pydantic import BaseModel, ConfigDict
 
+from mcp_agent.config import ProviderConcurrencySettings
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.executor.checkpoint import (
+    get_checkpoint_scope,
+    load_checkpoint,
+    task_arguments_hash,
+)
+from mcp_agent.executor.concurrency_limiter import ProviderConcurrencyLimiters
+from mcp_agent.executor.scheduler import PriorityScheduler
 from mcp_agent.executor.workflow_signal import (
     AsyncioSignalHandler,
     Signal,
@@ -26,12 +36,21 @@ from mcp_agent.executor.workflow_signal import (
     SignalValueT,
 )
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.telemetry.metrics import metrics
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
 
 logger = get_logger(__name__)
 
+_tasks = metrics.counter("mcp_agent.executor.tasks", "Tasks run by the executor")
+_task_duration = metrics.histogram(
+    "mcp_agent.executor.task_duration", "Duration of executor tasks", unit="s"
+)
+_tasks_in_flight = metrics.gauge(
+    "mcp_agent.executor.tasks_in_flight", "Executor tasks currently running"
+)
+
 # Type variable for the return type of tasks
 R = TypeVar("R")
 
@@ -42,6 +61,10 @@ class ExecutorConfig(BaseModel):
     max_concurrent_activities: int | None = None  # Unbounded by default
     timeout_seconds: timedelta | None = None  # No timeout by default
     retry_policy: Dict[str, Any] | None = None
+    priority_weights: Dict[str, float] | None = None  # Share of slots per class
+    fairness_weights: Dict[str, float] | None = None  # Weights of workflows/tenants
+    default_priority: str = "default"
+    provider_concurrency: ProviderConcurrencySettings | None = None  # AIMD limits
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -68,6 +91,13 @@ class Executor(ABC, ContextDependent):
             self.config = ExecutorConfig()
 
         self.signal_bus = signal_bus
+        # Tasks already warned about for arguments that can't be checkpointed
+        self._unhashable_tasks: set[str] = set()
+
+        self.provider_limiters: ProviderConcurrencyLimiters | None = None
+        provider_concurrency = getattr(self.config, "provider_concurrency", None)
+        if provider_concurrency:
+            self.provider_limiters = ProviderConcurrencyLimiters(provider_concurrency)
 
     @asynccontextmanager
     async def execution_context(self):
@@ -94,6 +124,52 @@ class Executor(ABC, ContextDependent):
     ) -> AsyncIterator[R | BaseException]:
         """Execute tasks and yield results as they complete"""
 
+    def in_workflow(self) -> bool:
+        """
+        Whether the caller is running inside durable workflow code, where side effects
+        (provider and tool calls) must run as activities instead of directly.
+        """
+        return False
+
+    def is_replaying(self) -> bool:
+        """
+        Whether durable workflow code is being replayed from its history, in which case
+        side effects outside the workflow (metrics, usage accounting) must not be repeated.
+        """
+        return False
+
+    def clock(self) -> float:
+        """
+        Return the time of a monotonic clock in seconds, for measuring durations.
+        Durable workflow code must use the workflow's deterministic clock instead.
+        """
+        return time.perf_counter()
+
+    async def execute_provider_call(
+        self,
+        provider: str,
+        model: str | None,
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+        **kwargs: Any,
+    ) -> R:
+        """
+        Execute a single LLM/embedding provider call.
+        If adaptive concurrency control is configured, the call is admitted through
+        the limiter for (provider, model) and retried after rate-limit errors.
+        Unlike execute(), errors are raised rather than returned.
+        """
+
+        async def call() -> R:
+            result = (await self.execute(task, **kwargs))[0]
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        if not self.provider_limiters:
+            return await call()
+
+        return await self.provider_limiters.get(provider, model).run(call)
+
     async def map(
         self,
         func: Callable[..., R],
@@ -139,14 +215,20 @@ class Executor(ABC, ContextDependent):
         signal_name: str,
         payload: SignalValueT = None,
         signal_description: str | None = None,
-    ) -> None:
+        workflow_id: str | None = None,
+    ) -> int | None:
         """
-        Emit a signal.
+        Emit a signal. If a workflow id is given, only waiters of that workflow
+        receive it (which also routes it to the process the workflow is waiting in).
+        Returns the number of waiters the signal reached, if the signal bus can tell.
         """
         signal = Signal[SignalValueT](
-            name=signal_name, payload=payload, description=signal_description
+            name=signal_name,
+            payload=payload,
+            description=signal_description,
+            workflow_id=workflow_id,
         )
-        await self.signal_bus.signal(signal)
+        return await self.signal_bus.signal(signal)
 
     async def wait_for_signal(
         self,
@@ -178,7 +260,7 @@ class Executor(ABC, ContextDependent):
         signal = Signal[signal_type](
             name=signal_name, description=signal_description, workflow_id=workflow_id
         )
-        return await self.signal_bus.wait_for_signal(signal)
+        return await self.signal_bus.wait_for_signal(signal, timeout_seconds)
 
 
 class AsyncioExecutor(Executor):
@@ -188,20 +270,27 @@ class AsyncioExecutor(Executor):
         self,
         config: ExecutorConfig | None = None,
         signal_bus: SignalHandler | None = None,
+        context: Optional["Context"] = None,
     ):
         signal_bus = signal_bus or AsyncioSignalHandler()
-        super().__init__(engine="asyncio", config=config, signal_bus=signal_bus)
+        super().__init__(
+            engine="asyncio", config=config, signal_bus=signal_bus, context=context
+        )
 
-        self._activity_semaphore: asyncio.Semaphore | None = None
+        # Admission control is only needed when concurrency is bounded
+        self.scheduler: PriorityScheduler | None = None
         if self.config.max_concurrent_activities is not None:
-            self._activity_semaphore = asyncio.Semaphore(
-                self.config.max_concurrent_activities
+            self.scheduler = PriorityScheduler(
+                capacity=self.config.max_concurrent_activities,
+                priority_weights=self.config.priority_weights,
+                fairness_weights=self.config.fairness_weights,
+                default_priority=self.config.default_priority,
             )
 
     async def _execute_task(
         self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
     ) -> R | BaseException:
-        async def run_task(task: Callable[..., R] | Coroutine[Any, Any, R]) -> R:
+        async def call_task(task: Callable[..., R] | Coroutine[Any, Any, R]) -> R:
             try:
                 if asyncio.iscoroutine(task):
                     return await task
@@ -227,11 +316,114 @@ class AsyncioExecutor(Executor):
                 # TODO: saqadri - adding logging or other error handling here
                 return e
 
-        if self._activity_semaphore:
-            async with self._activity_semaphore:
-                return await run_task(task)
+        async def run_task(task: Callable[..., R] | Coroutine[Any, Any, R]) -> R:
+            _tasks_in_flight.add(1)
+            start = time.perf_counter()
+            status = "cancelled"
+            try:
+                result = await call_task(task)
+                status = "error" if isinstance(result, BaseException) else "ok"
+                return result
+            finally:
+                _tasks_in_flight.add(-1)
+                _task_duration.record(time.perf_counter() - start, status=status)
+                _tasks.add(1, status=status)
+
+        # The checkpoint key must be taken before any await, so that tasks started
+        # together get the same occurrence numbers on every run
+        checkpoint_key = self._get_checkpoint_key(task, **kwargs)
+        if checkpoint_key:
+            try:
+                return await load_checkpoint(
+                    self.context.checkpoint_store,
+                    get_checkpoint_scope().workflow_id,
+                    checkpoint_key,
+                    self._get_result_type(task),
+                )
+            except KeyError:
+                pass
+
+        if self.scheduler:
+            # Priority and fairness key can be pinned on the task via @workflow_task metadata,
+            # otherwise they come from the current scheduling context
+            func = task.func if isinstance(task, functools.partial) else task
+            execution_metadata: Dict[str, Any] = getattr(func, "execution_metadata", {})
+            async with self.scheduler.slot(
+                priority=execution_metadata.get("priority"),
+                fairness_key=execution_metadata.get("fairness_key"),
+            ):
+                result = await run_task(task)
         else:
-            return await run_task(task)
+            result = await run_task(task)
+
+        if checkpoint_key and not isinstance(result, BaseException):
+            try:
+                await self.context.checkpoint_store.save(
+                    get_checkpoint_scope().workflow_id, checkpoint_key, result
+                )
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not checkpointing result of {checkpoint_key}: {e}")
+
+        return result
+
+    @asynccontextmanager
+    async def _waiting_on_tasks(self):
+        """
+        While the caller waits on the tasks it submitted, any slot it holds goes to
+        them: nested tasks are counted against the concurrency limit, and can't
+        deadlock on slots held by the tasks waiting for them.
+        """
+        if self.scheduler is None:
+            yield
+            return
+
+        async with self.scheduler.released():
+            yield
+
+    def _get_checkpoint_key(
+        self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
+    ) -> str | None:
+        """
+        Return the checkpoint key for a @workflow_task run within a checkpoint scope,
+        or None if its result shouldn't be checkpointed.
+        """
+        scope = get_checkpoint_scope()
+        if scope is None or asyncio.iscoroutine(task):
+            return None
+
+        func = task.func if isinstance(task, functools.partial) else task
+        if not getattr(func, "is_workflow_task", False):
+            return None
+        if self.context.checkpoint_store is None:
+            return None
+
+        execution_metadata: Dict[str, Any] = getattr(func, "execution_metadata", {})
+        activity_name = execution_metadata.get(
+            "activity_name", f"{func.__module__}.{func.__qualname__}"
+        )
+        args = task.args if isinstance(task, functools.partial) else ()
+        keywords = task.keywords if isinstance(task, functools.partial) else {}
+        try:
+            arguments_hash = task_arguments_hash(func, *args, **keywords, **kwargs)
+        except (TypeError, ValueError) as e:
+            # Arguments that can't be serialized can't be matched across runs
+            if activity_name not in self._unhashable_tasks:
+                self._unhashable_tasks.add(activity_name)
+                logger.warning(
+                    f"Not checkpointing {activity_name}: its arguments can't be "
+                    f"hashed ({e}), so a resumed run re-executes it"
+                )
+            return None
+
+        return scope.next_key(f"task:{activity_name}:{arguments_hash}")
+
+    @staticmethod
+    def _get_result_type(task: Callable[..., R]) -> Type[R] | None:
+        func = task.func if isinstance(task, functools.partial) else task
+        try:
+            return typing.get_type_hints(func).get("return")
+        except Exception:
+            return None
 
     async def execute(
         self,
@@ -239,7 +431,7 @@ class AsyncioExecutor(Executor):
         **kwargs: Any,
     ) -> List[R | BaseException]:
         # TODO: saqadri - validate if async with self.execution_context() is needed here
-        async with self.execution_context():
+        async with self.execution_context(), self._waiting_on_tasks():
             return await asyncio.gather(
                 *(self._execute_task(task, **kwargs) for task in tasks),
                 return_exceptions=True,
@@ -251,7 +443,7 @@ class AsyncioExecutor(Executor):
         **kwargs: Any,
     ) -> AsyncIterator[R | BaseException]:
         # TODO: saqadri - validate if async with self.execution_context() is needed here
-        async with self.execution_context():
+        async with self.execution_context(), self._waiting_on_tasks():
             # Create futures for all tasks
             futures = [
                 asyncio.create_task(self._execute_task(task, **kwargs))
@@ -271,8 +463,11 @@ class AsyncioExecutor(Executor):
         signal_name: str,
         payload: SignalValueT = None,
         signal_description: str | None = None,
-    ) -> None:
-        await super().signal(signal_name, payload, signal_description)
+        workflow_id: str | None = None,
+    ) -> int | None:
+        return await super().signal(
+            signal_name, payload, signal_description, workflow_id
+        )
 
     async def wait_for_signal(
         self,
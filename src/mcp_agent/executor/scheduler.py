@@ -0,0 +1,406 @@
+"""
+Priority-aware admission control for tasks submitted to an executor.
+
+Work is grouped into priority classes (e.g. "interactive", "default", "batch").
+Classes share the available slots in proportion to their weights (stride scheduling),
+so a flood of batch work cannot starve interactive requests, while batch work still
+makes progress. Within a class, slots are shared between fairness keys
+(a workflow id, a tenant, ...) using weighted fair queuing.
+
+The priority and fairness key for a task are taken from (in order):
+    - the task's @workflow_task metadata ("priority" / "fairness_key")
+    - the current scheduling context (see `scheduling_context`)
+    - the scheduler defaults
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Tuple
+
+from opentelemetry import trace
+from pydantic import BaseModel, Field
+
+DEFAULT_PRIORITY_WEIGHTS: Dict[str, float] = {
+    "interactive": 8.0,
+    "default": 4.0,
+    "batch": 1.0,
+}
+"""Default relative share of executor slots for each priority class."""
+
+DEFAULT_PRIORITY = "default"
+DEFAULT_FAIRNESS_KEY = "default"
+
+_scheduling_priority: ContextVar[str | None] = ContextVar(
+    "mcp_agent_scheduling_priority", default=None
+)
+_scheduling_fairness_key: ContextVar[str | None] = ContextVar(
+    "mcp_agent_scheduling_fairness_key", default=None
+)
+_slot_lease: ContextVar["_SlotLease | None"] = ContextVar(
+    "mcp_agent_slot_lease", default=None
+)
+
+tracer = trace.get_tracer(__name__)
+
+
+@contextmanager
+def scheduling_context(priority: str | None = None, fairness_key: str | None = None):
+    """
+    Set the priority class and fairness key for tasks submitted to the executor
+    from within this block (including tasks spawned from it).
+    Unspecified values are inherited from any enclosing scheduling context.
+
+    Example:
+        with scheduling_context(priority="batch", fairness_key="nightly-eval"):
+            await executor.execute(*tasks)
+    """
+    priority_token = (
+        _scheduling_priority.set(priority) if priority is not None else None
+    )
+    fairness_token = (
+        _scheduling_fairness_key.set(fairness_key) if fairness_key is not None else None
+    )
+    try:
+        yield
+    finally:
+        if fairness_token is not None:
+            _scheduling_fairness_key.reset(fairness_token)
+        if priority_token is not None:
+            _scheduling_priority.reset(priority_token)
+
+
+def get_scheduling_context() -> Tuple[str | None, str | None]:
+    """Return the (priority, fairness_key) of the current scheduling context."""
+    return _scheduling_priority.get(), _scheduling_fairness_key.get()
+
+
+class PriorityClassStats(BaseModel):
+    """Queue depth and wait-time metrics for a single priority class."""
+
+    queue_depth: int = 0
+    """Number of tasks currently waiting for a slot."""
+
+    admitted: int = 0
+    """Number of tasks admitted so far."""
+
+    total_wait_seconds: float = 0.0
+    """Cumulative time admitted tasks spent waiting for a slot."""
+
+    max_wait_seconds: float = 0.0
+    """Longest time any admitted task spent waiting for a slot."""
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.admitted if self.admitted else 0.0
+
+
+class SchedulerStats(BaseModel):
+    """Snapshot of scheduler metrics."""
+
+    capacity: int
+    active: int
+    classes: Dict[str, PriorityClassStats] = Field(default_factory=dict)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(c.queue_depth for c in self.classes.values())
+
+
+class _SlotLease:
+    """A slot held by a task, which it can give up while waiting on nested work."""
+
+    __slots__ = ("task", "priority", "fairness_key", "held")
+
+    def __init__(self, task: asyncio.Task | None, priority: str, fairness_key: str):
+        self.task = task
+        self.priority = priority
+        self.fairness_key = fairness_key
+        self.held = True
+
+
+class _Waiter:
+    __slots__ = ("future", "priority", "fairness_key", "enqueued_at", "dequeued")
+
+    def __init__(self, future: asyncio.Future, priority: str, fairness_key: str):
+        self.future = future
+        self.priority = priority
+        self.fairness_key = fairness_key
+        self.enqueued_at = time.perf_counter()
+        self.dequeued = False
+
+
+class _PriorityClass:
+    """Weighted fair queue of waiters belonging to one priority class."""
+
+    def __init__(self, name: str, weight: float):
+        self.name = name
+        self.weight = weight
+        # Stride scheduling "pass" value, used to pick between classes
+        self.pass_value = 0.0
+        # WFQ state, used to pick between fairness keys within the class
+        self.virtual_time = 0.0
+        self.last_finish: Dict[str, float] = {}
+        self.pending: Dict[str, int] = {}
+        self.queue: List[Tuple[float, int, _Waiter]] = []
+        self.stats = PriorityClassStats()
+
+    def has_waiters(self) -> bool:
+        return self.stats.queue_depth > 0
+
+    def push(self, waiter: _Waiter, flow_weight: float, seq: int):
+        key = waiter.fairness_key
+        start = max(self.virtual_time, self.last_finish.get(key, 0.0))
+        finish = start + 1.0 / flow_weight
+        self.last_finish[key] = finish
+        self.pending[key] = self.pending.get(key, 0) + 1
+        heapq.heappush(self.queue, (finish, seq, waiter))
+        self.stats.queue_depth += 1
+
+    def pop(self) -> _Waiter | None:
+        """Pop the waiter with the smallest finish tag, skipping abandoned ones."""
+        while self.queue:
+            finish, _, waiter = heapq.heappop(self.queue)
+            if waiter.dequeued:
+                continue
+            self.remove(waiter)
+            if waiter.future.done():
+                # The waiting task was cancelled
+                continue
+            self.virtual_time = max(self.virtual_time, finish)
+            return waiter
+        return None
+
+    def remove(self, waiter: _Waiter):
+        """
+        Account for a waiter leaving the queue.
+        Abandoned waiters are dropped from the heap lazily by pop().
+        """
+        if waiter.dequeued:
+            return
+        waiter.dequeued = True
+
+        key = waiter.fairness_key
+        remaining = self.pending.get(key, 0) - 1
+        if remaining > 0:
+            self.pending[key] = remaining
+        else:
+            self.pending.pop(key, None)
+            # Idle flows don't need their finish tag once the class has caught up
+            if self.last_finish.get(key, 0.0) <= self.virtual_time:
+                self.last_finish.pop(key, None)
+
+        self.stats.queue_depth -= 1
+
+
+class PriorityScheduler:
+    """
+    Admission control with `capacity` concurrent slots shared between
+    priority classes (stride scheduling) and fairness keys (weighted fair queuing).
+
+    Slots are held per asyncio task: a task that already holds a slot re-enters
+    it, but tasks it spawns (e.g. the fan-out of a parallel or orchestrator step)
+    queue for slots of their own. To keep nested executor calls from deadlocking
+    when all slots are taken, a task gives up its slot while it waits on the work
+    it spawned (see `released`), and queues to get it back afterwards.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        priority_weights: Dict[str, float] | None = None,
+        fairness_weights: Dict[str, float] | None = None,
+        default_priority: str = DEFAULT_PRIORITY,
+    ):
+        if capacity < 1:
+            raise ValueError("Scheduler capacity must be at least 1")
+
+        self.capacity = capacity
+        self.priority_weights = priority_weights or dict(DEFAULT_PRIORITY_WEIGHTS)
+        self.fairness_weights = fairness_weights or {}
+        self.default_priority = default_priority
+
+        self._active = 0
+        self._seq = itertools.count()
+        self._classes: Dict[str, _PriorityClass] = {}
+
+    @property
+    def active(self) -> int:
+        """Number of slots currently in use."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks currently waiting for a slot."""
+        return sum(c.stats.queue_depth for c in self._classes.values())
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of queue-depth and wait-time metrics per priority class."""
+        return SchedulerStats(
+            capacity=self.capacity,
+            active=self._active,
+            classes={name: c.stats.model_copy() for name, c in self._classes.items()},
+        )
+
+    def resolve(
+        self, priority: str | None = None, fairness_key: str | None = None
+    ) -> Tuple[str, str]:
+        """Resolve the effective priority class and fairness key for a task."""
+        context_priority, context_fairness_key = get_scheduling_context()
+        return (
+            priority or context_priority or self.default_priority,
+            fairness_key or context_fairness_key or DEFAULT_FAIRNESS_KEY,
+        )
+
+    @asynccontextmanager
+    async def slot(self, priority: str | None = None, fairness_key: str | None = None):
+        """
+        Hold an execution slot for the duration of the block.
+
+        Example:
+            async with scheduler.slot(priority="interactive"):
+                await do_work()
+        """
+        current_task = asyncio.current_task()
+        lease = _slot_lease.get()
+        if lease is not None and lease.held and lease.task is current_task:
+            # The task already holds a slot
+            yield
+            return
+
+        priority, fairness_key = self.resolve(priority, fairness_key)
+        await self.acquire(priority=priority, fairness_key=fairness_key)
+        lease = _SlotLease(current_task, priority, fairness_key)
+        token = _slot_lease.set(lease)
+        try:
+            yield
+        finally:
+            _slot_lease.reset(token)
+            if lease.held:
+                self.release()
+
+    @asynccontextmanager
+    async def released(self):
+        """
+        Give up the current task's slot for the duration of the block, e.g. while it
+        waits on tasks it submitted to the executor, and queue to get it back after.
+        Does nothing if the current task holds no slot.
+        """
+        lease = _slot_lease.get()
+        if lease is None or not lease.held or lease.task is not asyncio.current_task():
+            yield
+            return
+
+        lease.held = False
+        self.release()
+        try:
+            yield
+        finally:
+            # If cancelled while queuing, the slot is not held and must not be released
+            await self.acquire(priority=lease.priority, fairness_key=lease.fairness_key)
+            lease.held = True
+
+    async def acquire(
+        self, priority: str | None = None, fairness_key: str | None = None
+    ) -> None:
+        """Wait until a slot is granted to a task of the given priority and fairness key."""
+        priority, fairness_key = self.resolve(priority, fairness_key)
+        priority_class = self._get_class(priority)
+
+        if self._active < self.capacity and not self._has_waiters():
+            self._active += 1
+            self._record_admission(priority_class, 0.0)
+            return
+
+        if not priority_class.has_waiters():
+            # A class that was idle must not accumulate credit while idle
+            priority_class.pass_value = max(
+                priority_class.pass_value, self._min_active_pass()
+            )
+
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            priority=priority,
+            fairness_key=fairness_key,
+        )
+        priority_class.push(
+            waiter,
+            flow_weight=self.fairness_weights.get(fairness_key, 1.0),
+            seq=next(self._seq),
+        )
+
+        try:
+            with tracer.start_as_current_span(
+                "executor queue wait",
+                attributes={
+                    "mcp_agent.scheduler.priority": priority,
+                    "mcp_agent.scheduler.fairness_key": fairness_key,
+                },
+            ):
+                await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted right as we were cancelled, hand it on
+                self.release()
+            else:
+                priority_class.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Release a slot and grant it to the next waiter, if any."""
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._active < self.capacity:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+
+            self._active += 1
+            self._record_admission(
+                self._classes[waiter.priority],
+                time.perf_counter() - waiter.enqueued_at,
+            )
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        while True:
+            candidates = [c for c in self._classes.values() if c.has_waiters()]
+            if not candidates:
+                return None
+
+            priority_class = min(candidates, key=lambda c: c.pass_value)
+            waiter = priority_class.pop()
+            if waiter is None:
+                continue
+
+            priority_class.pass_value += 1.0 / priority_class.weight
+            return waiter
+
+    def _has_waiters(self) -> bool:
+        return any(c.has_waiters() for c in self._classes.values())
+
+    def _min_active_pass(self) -> float:
+        passes = [c.pass_value for c in self._classes.values() if c.has_waiters()]
+        return min(passes) if passes else 0.0
+
+    def _get_class(self, priority: str) -> _PriorityClass:
+        priority_class = self._classes.get(priority)
+        if priority_class is None:
+            weight = self.priority_weights.get(
+                priority, self.priority_weights.get(self.default_priority, 1.0)
+            )
+            priority_class = _PriorityClass(priority, weight)
+            self._classes[priority] = priority_class
+        return priority_class
+
+    @staticmethod
+    def _record_admission(priority_class: _PriorityClass, waited: float):
+        stats = priority_class.stats
+        stats.admitted += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
@@ -0,0 +1,381 @@
+"""
+Distributed signal delivery for the asyncio engine.
+
+AsyncioSignalHandler only delivers signals within one process, so a human-input response
+or an approval that arrives at a different replica never reaches the waiting workflow.
+DistributedSignalHandler publishes signals through a SignalBackend instead, routed by
+workflow id: each process subscribes to the channels of the workflows it has waits for
+(and to a shared channel for signals without a workflow id), and delivers the signals it
+receives to its local waiters.
+
+Backends follow Redis pub/sub semantics: a message is delivered to every current
+subscriber of its channel, and messages published while nobody is subscribed are dropped.
+    - RedisSignalBackend: Redis pub/sub (requires the `redis` package)
+    - FileSignalBackend: a stand-in for single-host deployments and development, which
+      exchanges messages through per-subscriber inbox directories
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+from pydantic import TypeAdapter, ValidationError
+
+from mcp_agent.config import SignalBusSettings
+from mcp_agent.executor.storage import atomic_write_bytes
+from mcp_agent.executor.workflow_signal import (
+    AsyncioSignalHandler,
+    Signal,
+    SignalValueT,
+)
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+MessageCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class SignalBackend(ABC):
+    """Publish/subscribe transport for signals (modeled after Redis pub/sub)."""
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        """Publish a message to a channel. Returns the number of subscribers it reached."""
+
+    @abstractmethod
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        """Deliver messages published to the channel to the callback."""
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str) -> None:
+        """Stop delivering messages published to the channel."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Unsubscribe from all channels and release resources."""
+
+
+class FileSignalBackend(SignalBackend):
+    """
+    Signal backend that exchanges messages through a (shared) directory.
+    Every subscriber of a channel has an inbox directory, which publishers write
+    messages into and the subscriber polls. Inboxes of subscribers that stopped
+    polling (e.g. crashed processes) are removed by publishers.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        poll_interval_seconds: float = 0.2,
+        stale_after_seconds: float = 30.0,
+    ):
+        self.path = Path(path)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+
+        self._subscriber_id = uuid.uuid4().hex
+        self._callbacks: Dict[str, MessageCallback] = {}
+        self._poll_task: asyncio.Task | None = None
+
+    def _channel_path(self, channel: str) -> Path:
+        # Channel names are free-form, so hash them into safe directory names
+        return self.path / hashlib.sha256(channel.encode()).hexdigest()
+
+    def _inbox_path(self, channel: str) -> Path:
+        return self._channel_path(channel) / self._subscriber_id
+
+    def _publish(self, channel: str, data: str) -> int:
+        channel_path = self._channel_path(channel)
+        if not channel_path.exists():
+            return 0
+
+        delivered = 0
+        now = time.time()
+        for inbox in channel_path.iterdir():
+            try:
+                if now - inbox.stat().st_mtime > self.stale_after_seconds:
+                    shutil.rmtree(inbox, ignore_errors=True)
+                    continue
+
+                # Subscribers ignore the temporary file until it is renamed,
+                # so they never read partial messages
+                atomic_write_bytes(
+                    inbox / f"{time.time_ns()}-{uuid.uuid4().hex}.json", data.encode()
+                )
+                delivered += 1
+            except FileNotFoundError:
+                # The subscriber unsubscribed concurrently
+                continue
+
+        return delivered
+
+    def _receive(self, channel: str) -> list[Dict[str, Any]]:
+        inbox = self._inbox_path(channel)
+        try:
+            # Refresh the inbox's heartbeat, so publishers know it's still polled
+            os.utime(inbox)
+            paths = sorted(inbox.glob("*.json"))
+        except FileNotFoundError:
+            # Removed as stale by a publisher (e.g. after a long pause), re-create it
+            if channel in self._callbacks:
+                inbox.mkdir(parents=True, exist_ok=True)
+            return []
+
+        messages = []
+        for path in paths:
+            try:
+                messages.append(json.loads(path.read_text()))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable signal message {path}: {e}")
+            path.unlink(missing_ok=True)
+        return messages
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        return await asyncio.to_thread(self._publish, channel, json.dumps(message))
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        await asyncio.to_thread(
+            self._inbox_path(channel).mkdir, parents=True, exist_ok=True
+        )
+        self._callbacks[channel] = callback
+
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll())
+
+    def _remove_inbox(self, channel: str):
+        shutil.rmtree(self._inbox_path(channel), ignore_errors=True)
+        try:
+            # Remove the channel too once its last subscriber is gone
+            self._channel_path(channel).rmdir()
+        except OSError:
+            pass
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._callbacks.pop(channel, None)
+        await asyncio.to_thread(self._remove_inbox, channel)
+
+    async def close(self) -> None:
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+        for channel in list(self._callbacks.keys()):
+            await self.unsubscribe(channel)
+
+    async def _poll(self):
+        while self._callbacks:
+            for channel, callback in list(self._callbacks.items()):
+                for message in await asyncio.to_thread(self._receive, channel):
+                    try:
+                        await callback(message)
+                    except Exception as e:
+                        logger.error(f"Error delivering signal on {channel}: {e}")
+
+            await asyncio.sleep(self.poll_interval_seconds)
+
+
+class RedisSignalBackend(SignalBackend):
+    """Signal backend using Redis pub/sub."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0"):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis signal backend requires the redis package: pip install redis"
+            ) from e
+
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._callbacks: Dict[str, MessageCallback] = {}
+        self._listen_task: asyncio.Task | None = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        return await self._client.publish(channel, json.dumps(message))
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        self._callbacks[channel] = callback
+        await self._pubsub.subscribe(channel)
+
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._callbacks.pop(channel, None)
+        await self._pubsub.unsubscribe(channel)
+
+    async def close(self) -> None:
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
+        await self._pubsub.aclose()
+        await self._client.aclose()
+
+    async def _listen(self):
+        async for message in self._pubsub.listen():
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+
+            callback = self._callbacks.get(channel)
+            if callback is None:
+                continue
+            try:
+                await callback(json.loads(message["data"]))
+            except Exception as e:
+                logger.error(f"Error delivering signal on {channel}: {e}")
+
+
+def create_signal_backend(settings: SignalBusSettings) -> SignalBackend:
+    """Create the signal backend configured in the settings."""
+    if settings.backend == "file":
+        return FileSignalBackend(
+            settings.path or ".mcp-agent/signals",
+            poll_interval_seconds=settings.poll_interval_seconds,
+        )
+    elif settings.backend == "redis":
+        return RedisSignalBackend(settings.redis_url)
+    else:
+        raise ValueError(f"Unsupported signal bus backend: {settings.backend}")
+
+
+class DistributedSignalHandler(AsyncioSignalHandler[SignalValueT]):
+    """
+    Signal handler that delivers signals across processes through a SignalBackend.
+    Signals are published to the channel of their workflow id, and each process
+    subscribes to the channels of the workflows it is waiting on, so a signal
+    reaches its waiter regardless of which replica received it.
+
+    Handlers registered with on_signal receive the signals delivered to this process:
+    those without a workflow id (the handler keeps this process subscribed to the
+    shared channel) and those for workflows it is waiting on.
+    """
+
+    def __init__(
+        self,
+        backend: SignalBackend,
+        channel_prefix: str = "mcp_agent:signals",
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.backend = backend
+        self.channel_prefix = channel_prefix
+        self._subscriptions: Dict[str, int] = {}
+        self._subscription_lock = asyncio.Lock()
+        self._handler_subscription: asyncio.Task | None = None
+
+    def get_channel(self, workflow_id: str | None) -> str:
+        """Return the channel that signals for a workflow are published to."""
+        if workflow_id is None:
+            return self.channel_prefix
+        return f"{self.channel_prefix}:{workflow_id}"
+
+    async def _acquire_channel(self, channel: str):
+        async with self._subscription_lock:
+            count = self._subscriptions.get(channel, 0)
+            if count == 0:
+                await self.backend.subscribe(channel, self._on_message)
+            self._subscriptions[channel] = count + 1
+
+    async def _release_channel(self, channel: str):
+        async with self._subscription_lock:
+            count = self._subscriptions.get(channel, 0) - 1
+            if count > 0:
+                self._subscriptions[channel] = count
+                return
+            self._subscriptions.pop(channel, None)
+            await self.backend.unsubscribe(channel)
+
+    def on_signal(self, signal_name):
+        register = super().on_signal(signal_name)
+
+        def decorator(func):
+            wrapped = register(func)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Subscribed by the next signal or wait instead
+                return wrapped
+            self._start_handler_subscription()
+            return wrapped
+
+        return decorator
+
+    def _start_handler_subscription(self) -> asyncio.Task | None:
+        """
+        Subscribe to the shared channel once handlers are registered, so signals without
+        a workflow id reach them even while no waiter of this process is subscribed.
+        """
+        if self._handler_subscription is None and self._handlers:
+            self._handler_subscription = asyncio.create_task(
+                self._acquire_channel(self.get_channel(None))
+            )
+        return self._handler_subscription
+
+    async def _subscribe_handlers(self):
+        subscription = self._start_handler_subscription()
+        if subscription is not None:
+            await asyncio.shield(subscription)
+
+    async def _on_message(self, message: Dict[str, Any]):
+        # Deliver to the waiters and handlers in this process
+        await super().signal(Signal(**message))
+
+    async def wait_for_signal(
+        self, signal, timeout_seconds: int | None = None
+    ) -> SignalValueT:
+        await self._subscribe_handlers()
+        channel = self.get_channel(signal.workflow_id)
+        await self._acquire_channel(channel)
+        try:
+            value = await super().wait_for_signal(signal, timeout_seconds)
+        finally:
+            await self._release_channel(channel)
+
+        # Payloads arrive as JSON, restore them as the type of the awaited signal
+        payload_type = type(signal).model_fields["payload"].annotation
+        try:
+            return TypeAdapter(payload_type).validate_python(value)
+        except ValidationError:
+            return value
+
+    async def signal(self, signal) -> int:
+        """
+        Publish a signal to the channel of its workflow.
+        Returns the number of processes subscribed to the channel it reached.
+        """
+        self.validate_signal(signal)
+        await self._subscribe_handlers()
+        receivers = await self.backend.publish(
+            self.get_channel(signal.workflow_id), signal.model_dump(mode="json")
+        )
+        if receivers == 0:
+            logger.debug(
+                f"No process is waiting for signal {signal.name}",
+                data={"workflow_id": signal.workflow_id},
+            )
+        return receivers
+
+    async def close(self):
+        """Close the backend, which stops delivering signals to this process."""
+        if self._handler_subscription is not None:
+            self._handler_subscription.cancel()
+            self._handler_subscription = None
+        self._subscriptions.clear()
+        await self.backend.close()
@@ -0,0 +1,68 @@
+"""
+Local storage helpers shared by the file and SQLite backed stores
+(checkpoints, task cache, signal bus, payload blob store).
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Sequence
+
+
+def atomic_write_bytes(path: str | Path, data: bytes, suffix: str = ".tmp") -> None:
+    """
+    Write a file atomically: the data is written to a temporary file (named with
+    `suffix`) in the same directory, which then replaces `path`. Readers never see
+    a partial file, and a crash mid-write leaves the previous content intact.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class SQLiteStore:
+    """
+    Base class of stores backed by a SQLite database file.
+    Queries run in worker threads (see `execute`) over a single connection;
+    subclasses create their tables and indexes with the statements in `schema`.
+    """
+
+    schema: Sequence[str] = ()
+    """Statements run when the database is opened, e.g. CREATE TABLE IF NOT EXISTS"""
+
+    def __init__(self, path: str | Path, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._transaction() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                connection.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection for a transaction, committed when the block exits."""
+        with self._lock, self._connection:
+            yield self._connection
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._transaction() as connection:
+            return connection.execute(sql, params).fetchall()
+
+    async def execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a statement in a worker thread and return the rows it produced."""
+        return await asyncio.to_thread(self._execute, sql, params)
@@ -0,0 +1,359 @@
+"""
+Caching of @workflow_task results.
+
+Tasks registered with `@app.workflow_task(cache=True)` are memoized: results are keyed by
+the activity name and a stable hash of the task arguments, so a task that is called again
+with identical inputs (e.g. re-summarizing the same document in a later workflow run) is
+served from the cache instead of being re-executed.
+
+Caching wraps the task function itself, so it applies with both execution engines:
+with Temporal, the cache is consulted by the worker executing the activity.
+
+Backends:
+    - MemoryTaskCache: LRU cache in process memory
+    - DiskTaskCache: one JSON file per result in a directory
+    - SQLiteTaskCache: a SQLite database
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import time
+import typing
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Tuple, Type, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from mcp_agent.config import TaskCacheSettings
+from mcp_agent.executor.checkpoint import task_arguments_hash
+from mcp_agent.executor.storage import SQLiteStore, atomic_write_bytes
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+
+class TaskCache(ABC):
+    """Cache of task results, keyed by activity name and argument hash."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def get(self, key: str, result_type: Type[R] | None = None) -> R:
+        """
+        Return the cached result for the key, validated as `result_type` if given.
+        Raises KeyError if there is no (unexpired) result.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Cache a result, expiring after `ttl_seconds` (or the cache's default TTL)."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a result from the cache."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all results from the cache."""
+
+    def _expires_at(self, ttl_seconds: float | None) -> float | None:
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        return time.time() + ttl_seconds if ttl_seconds is not None else None
+
+
+def _validate(value: Any, result_type: Type[R] | None) -> R:
+    if result_type is None:
+        return value
+    return TypeAdapter(result_type).validate_python(value)
+
+
+class MemoryTaskCache(TaskCache):
+    """
+    LRU cache in process memory. Results are stored as-is (not copied),
+    so callers shouldn't mutate results they get from a cached task.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._entries: OrderedDict[str, Tuple[float | None, Any]] = OrderedDict()
+
+    async def get(self, key: str, result_type: Type[R] | None = None) -> R:
+        expires_at, value = self._entries[key]
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            raise KeyError(key)
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        self._entries[key] = (self._expires_at(ttl_seconds), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskTaskCache(TaskCache):
+    """
+    Cache that stores each result as a JSON file in a directory.
+    File modification times track recency for LRU eviction.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._entry_count = len(list(self.path.glob("*.json")))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read(self, key: str) -> Any:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            raise KeyError(key)
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self._remove(path)
+            raise KeyError(key)
+
+        # Mark as recently used
+        os.utime(path)
+        return entry["value"]
+
+    def _write(self, key: str, data: str):
+        path = self._entry_path(key)
+        existed = path.exists()
+
+        # Concurrent readers must never see a partial entry
+        atomic_write_bytes(path, data.encode())
+
+        if not existed:
+            self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        # Evict down to 90% of capacity, so that eviction (which lists the whole
+        # directory) doesn't run on every write once the cache is full
+        paths = sorted(self.path.glob("*.json"), key=self._mtime)
+        self._entry_count = len(paths)
+        for path in paths[: max(0, len(paths) - int(self.max_entries * 0.9))]:
+            self._remove(path)
+
+    @staticmethod
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def _remove(self, path: Path):
+        try:
+            path.unlink()
+            self._entry_count -= 1
+        except FileNotFoundError:
+            pass
+
+    async def get(self, key: str, result_type: Type[R] | None = None) -> R:
+        value = await asyncio.to_thread(self._read, key)
+        return _validate(value, result_type)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        data = json.dumps(
+            {
+                "key": key,
+                "value": to_jsonable_python(value),
+                "expires_at": self._expires_at(ttl_seconds),
+            }
+        )
+        await asyncio.to_thread(self._write, key, data)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._remove, self._entry_path(key))
+
+    async def clear(self) -> None:
+        for path in self.path.glob("*.json"):
+            await asyncio.to_thread(self._remove, path)
+        self._entry_count = 0
+
+
+class SQLiteTaskCache(SQLiteStore, TaskCache):
+    """Cache backed by a SQLite database file."""
+
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS task_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL,
+            accessed_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS task_cache_accessed_at ON task_cache (accessed_at)",
+    )
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+    ):
+        super().__init__(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def _read(self, key: str) -> Any:
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT value, expires_at FROM task_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(key)
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                connection.execute("DELETE FROM task_cache WHERE key = ?", (key,))
+                raise KeyError(key)
+
+            connection.execute(
+                "UPDATE task_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return json.loads(value)
+
+    def _write(self, key: str, data: str, expires_at: float | None):
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO task_cache VALUES (?, ?, ?, ?)",
+                (key, data, expires_at, now),
+            )
+            connection.execute(
+                "DELETE FROM task_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            )
+            # Evict the least recently used entries beyond the size limit
+            connection.execute(
+                """
+                DELETE FROM task_cache WHERE key IN (
+                    SELECT key FROM task_cache ORDER BY accessed_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    async def get(self, key: str, result_type: Type[R] | None = None) -> R:
+        value = await asyncio.to_thread(self._read, key)
+        return _validate(value, result_type)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        data = json.dumps(to_jsonable_python(value))
+        await asyncio.to_thread(self._write, key, data, self._expires_at(ttl_seconds))
+
+    async def delete(self, key: str) -> None:
+        await self.execute("DELETE FROM task_cache WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        await self.execute("DELETE FROM task_cache")
+
+
+def create_task_cache(settings: TaskCacheSettings) -> TaskCache:
+    """Create the task cache configured in the settings."""
+    if settings.backend == "memory":
+        return MemoryTaskCache(settings.max_entries, settings.ttl_seconds)
+    elif settings.backend == "disk":
+        return DiskTaskCache(
+            settings.path or ".mcp-agent/task_cache",
+            settings.max_entries,
+            settings.ttl_seconds,
+        )
+    elif settings.backend == "sqlite":
+        return SQLiteTaskCache(
+            settings.path or ".mcp-agent/task_cache.db",
+            settings.max_entries,
+            settings.ttl_seconds,
+        )
+    else:
+        raise ValueError(f"Unsupported task cache backend: {settings.backend}")
+
+
+def cached_task(
+    func: Callable[..., Awaitable[R]],
+    name: str,
+    get_cache: Callable[[], TaskCache | None],
+    ttl_seconds: float | None = None,
+) -> Callable[..., Awaitable[R]]:
+    """
+    Wrap an async task function so that its results are cached under
+    `<name>:<hash of the arguments>` (leaving out `self` for methods, see
+    task_arguments_hash). Calls with arguments that can't be hashed stably
+    (e.g. arbitrary objects) bypass the cache, with a warning the first time.
+    """
+    result_type = None
+    result_type_resolved = False
+    warned_unhashable = False
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> R:
+        nonlocal result_type, result_type_resolved, warned_unhashable
+
+        cache = get_cache()
+        if cache is None:
+            return await func(*args, **kwargs)
+
+        try:
+            key = f"{name}:{task_arguments_hash(func, *args, **kwargs)}"
+        except (TypeError, ValueError) as e:
+            if not warned_unhashable:
+                logger.warning(
+                    f"Not caching {name}: its arguments can't be hashed ({e}). "
+                    "Pass JSON-serializable arguments to cache its results."
+                )
+                warned_unhashable = True
+            return await func(*args, **kwargs)
+
+        if not result_type_resolved:
+            # Used to restore results from serializing backends as their original type
+            try:
+                result_type = typing.get_type_hints(func).get("return")
+            except Exception:
+                result_type = None
+            result_type_resolved = True
+
+        try:
+            return await cache.get(key, result_type)
+        except KeyError:
+            pass
+
+        result = await func(*args, **kwargs)
+        try:
+            await cache.set(key, result, ttl_seconds)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching result of {name}: {e}")
+        return result
+
+    return wrapper
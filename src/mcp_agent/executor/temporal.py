@@ -6,8 +6,10 @@ Read more: https://docs.temporal.io/develop/python/core-application
 """
 
 import asyncio
+import dataclasses
 import functools
 import uuid
+from datetime import timedelta
 from typing import (
     Any,
     AsyncIterator,
@@ -16,33 +18,70 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     TYPE_CHECKING,
 )
 
+from mcp.types import CallToolResult, ListToolsResult
 from pydantic import ConfigDict
+from pydantic_core import to_jsonable_python
 from temporalio import activity, workflow, exceptions
 from temporalio.client import Client as TemporalClient
+from temporalio.common import RetryPolicy
+from temporalio.converter import DataConverter
 from temporalio.worker import Worker
 
-from mcp_agent.config import TemporalSettings
+from mcp_agent.config import TemporalActivitySettings, TemporalSettings
 from mcp_agent.executor.executor import Executor, ExecutorConfig, R
+from mcp_agent.executor.temporal_activities import (
+    BUILTIN_ACTIVITIES,
+    CALL_TOOL_ACTIVITY,
+    LIST_TOOLS_ACTIVITY,
+    PROVIDER_CALL_ACTIVITY,
+)
+from mcp_agent.executor.temporal_codec import CompactingPayloadCodec
 from mcp_agent.executor.workflow_signal import (
     BaseSignalHandler,
+    PendingSignal,
     Signal,
     SignalHandler,
     SignalRegistration,
     SignalValueT,
 )
 
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+from mcp_agent.workflows.llm.augmented_llm import get_provider_request
+
 if TYPE_CHECKING:
     from mcp_agent.context import Context
 
+logger = get_logger(__name__)
+
+
+def to_retry_policy(
+    retry_policy: RetryPolicy | Dict[str, Any] | None,
+) -> RetryPolicy | None:
+    """
+    Convert a retry policy from config/@workflow_task metadata to a Temporal RetryPolicy.
+    Intervals can be given as timedeltas or in seconds, e.g.
+    {"maximum_attempts": 3, "initial_interval": 1, "backoff_coefficient": 2.0}
+    """
+    if not retry_policy or isinstance(retry_policy, RetryPolicy):
+        return retry_policy or None
+
+    policy = dict(retry_policy)
+    for key in ("initial_interval", "maximum_interval"):
+        if isinstance(policy.get(key), (int, float)):
+            policy[key] = timedelta(seconds=policy[key])
+    return RetryPolicy(**policy)
+
 
 class TemporalSignalHandler(BaseSignalHandler[SignalValueT]):
     """Temporal-based signal handling using workflow signals"""
 
     async def wait_for_signal(self, signal, timeout_seconds=None) -> SignalValueT:
-        if not workflow._Runtime.current():
+        if not workflow._Runtime.maybe_current():
             raise RuntimeError(
                 "TemporalSignalHandler.wait_for_signal must be called from within a workflow"
             )
@@ -58,17 +97,12 @@ class TemporalSignalHandler(BaseSignalHandler[SignalValueT]):
         container = {"value": None, "completed": False}
 
         # Define the signal handler for this specific registration
-        @workflow.signal(name=unique_signal_name)
         def signal_handler(value: SignalValueT):
             container["value"] = value
             container["completed"] = True
 
-        async with self._lock:
-            # Register both the signal registration and handler atomically
-            self._pending_signals.setdefault(signal.name, []).append(registration)
-            self._handlers.setdefault(signal.name, []).append(
-                (unique_signal_name, signal_handler)
-            )
+        workflow.set_signal_handler(unique_signal_name, signal_handler)
+        self._add_pending(PendingSignal(registration=registration))
 
         try:
             # Wait for signal with optional timeout
@@ -80,26 +114,8 @@ class TemporalSignalHandler(BaseSignalHandler[SignalValueT]):
         except asyncio.TimeoutError as exc:
             raise TimeoutError(f"Timeout waiting for signal {signal.name}") from exc
         finally:
-            async with self._lock:
-                # Remove ourselves from _pending_signals
-                if signal.name in self._pending_signals:
-                    self._pending_signals[signal.name] = [
-                        sr
-                        for sr in self._pending_signals[signal.name]
-                        if sr.unique_name != unique_signal_name
-                    ]
-                    if not self._pending_signals[signal.name]:
-                        del self._pending_signals[signal.name]
-
-                # Remove ourselves from _handlers
-                if signal.name in self._handlers:
-                    self._handlers[signal.name] = [
-                        h
-                        for h in self._handlers[signal.name]
-                        if h[0] != unique_signal_name
-                    ]
-                    if not self._handlers[signal.name]:
-                        del self._handlers[signal.name]
+            self._remove_pending(signal.name, unique_signal_name)
+            workflow.set_signal_handler(unique_signal_name, None)
 
     def on_signal(self, signal_name):
         """Decorator to register a signal handler."""
@@ -123,9 +139,7 @@ class TemporalSignalHandler(BaseSignalHandler[SignalValueT]):
                     func(signal)
 
             # Register the handler under the original signal name
-            self._handlers.setdefault(signal_name, []).append(
-                (unique_signal_name, wrapped)
-            )
+            self._add_handler(signal_name, unique_signal_name, wrapped)
             return func
 
         return decorator
@@ -138,28 +152,18 @@ class TemporalSignalHandler(BaseSignalHandler[SignalValueT]):
         )
 
         # Send the signal to all registrations of this signal
-        async with self._lock:
-            signal_tasks = []
-
-            if signal.name in self._pending_signals:
-                for pending_signal in self._pending_signals[signal.name]:
-                    registration = pending_signal.registration
-                    if registration.workflow_id == signal.workflow_id:
-                        # Only signal for registrations of that workflow
-                        signal_tasks.append(
-                            workflow_handle.signal(
-                                registration.unique_name, signal.payload
-                            )
-                        )
-                    else:
-                        continue
+        signal_tasks = []
+        for pending_signal in self._get_pending(signal.name):
+            registration = pending_signal.registration
+            if registration.workflow_id == signal.workflow_id:
+                # Only signal for registrations of that workflow
+                signal_tasks.append(
+                    workflow_handle.signal(registration.unique_name, signal.payload)
+                )
 
-            # Notify any registered handler functions
-            if signal.name in self._handlers:
-                for unique_name, _ in self._handlers[signal.name]:
-                    signal_tasks.append(
-                        workflow_handle.signal(unique_name, signal.payload)
-                    )
+        # Notify any registered handler functions
+        for unique_name, _ in self._get_handlers(signal.name):
+            signal_tasks.append(workflow_handle.signal(unique_name, signal.payload))
 
         await asyncio.gather(*signal_tasks, return_exceptions=True)
 
@@ -203,8 +207,10 @@ class TemporalExecutor(Executor):
         self.client = client
         self._worker = None
         self._activity_semaphore = None
+        # Aggregators of the worker's tool call activities, by server names
+        self._aggregators: Dict[Tuple[str, ...], MCPAggregator] = {}
 
-        if config.max_concurrent_activities is not None:
+        if self.config.max_concurrent_activities is not None:
             self._activity_semaphore = asyncio.Semaphore(
                 self.config.max_concurrent_activities
             )
@@ -234,6 +240,77 @@ class TemporalExecutor(Executor):
 
         return wrapped_activity
 
+    def in_workflow(self) -> bool:
+        return workflow._Runtime.maybe_current() is not None
+
+    def is_replaying(self) -> bool:
+        return self.in_workflow() and workflow.unsafe.is_replaying()
+
+    def clock(self) -> float:
+        # The system clock can't be read from workflow code
+        return workflow.time() if self.in_workflow() else super().clock()
+
+    async def execute_provider_call(
+        self,
+        provider: str,
+        model: str | None,
+        task: Callable[..., R],
+        **kwargs: Any,
+    ) -> R:
+        """
+        Execute an LLM provider call. Inside a workflow, the call runs as an activity
+        (the SDK function `task` is rebuilt on the worker from the provider's registered request).
+        """
+        if not self.in_workflow():
+            return await super().execute_provider_call(provider, model, task, **kwargs)
+
+        _, response_type = get_provider_request(provider)
+        result = await self._execute_builtin_activity(
+            PROVIDER_CALL_ACTIVITY,
+            [provider, model, to_jsonable_python(kwargs)],
+            self.config.llm_activity,
+        )
+        return response_type.model_validate(result)
+
+    async def execute_tool_call(
+        self, server_names: List[str], name: str, arguments: dict | None = None
+    ) -> CallToolResult:
+        """Call an MCP tool as an activity. Must be called from within a workflow."""
+        result = await self._execute_builtin_activity(
+            CALL_TOOL_ACTIVITY,
+            [server_names, name, to_jsonable_python(arguments)],
+            self.config.tool_activity,
+        )
+        return CallToolResult.model_validate(result)
+
+    async def execute_list_tools(self, server_names: List[str]) -> ListToolsResult:
+        """List the tools of MCP servers as an activity. Must be called from within a workflow."""
+        result = await self._execute_builtin_activity(
+            LIST_TOOLS_ACTIVITY, [server_names], self.config.tool_activity
+        )
+        return ListToolsResult.model_validate(result)
+
+    async def _execute_builtin_activity(
+        self, activity_name: str, args: List[Any], settings: TemporalActivitySettings
+    ) -> Any:
+        try:
+            return await workflow.execute_activity(
+                activity_name,
+                args=args,
+                task_queue=self.config.task_queue,
+                start_to_close_timeout=timedelta(
+                    seconds=settings.start_to_close_timeout_seconds
+                ),
+                schedule_to_close_timeout=(
+                    timedelta(seconds=settings.schedule_to_close_timeout_seconds)
+                    if settings.schedule_to_close_timeout_seconds
+                    else None
+                ),
+                retry_policy=to_retry_policy(settings.retry_policy),
+            )
+        except exceptions.ActivityError as e:
+            raise e.cause if e.cause else e
+
     async def _execute_task_as_async(
         self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
     ) -> R | BaseException:
@@ -302,8 +379,7 @@ class TemporalExecutor(Executor):
                 args=kwargs.get("args", ()),
                 task_queue=self.config.task_queue,
                 schedule_to_close_timeout=schedule_to_close,
-                retry_policy=retry_policy,
-                **kwargs,
+                retry_policy=to_retry_policy(retry_policy),
             )
             return result
         except Exception as e:
@@ -318,7 +394,7 @@ class TemporalExecutor(Executor):
         **kwargs: Any,
     ) -> List[R | BaseException]:
         # Must be called from within a workflow
-        if not workflow._Runtime.current():
+        if not self.in_workflow():
             raise RuntimeError(
                 "TemporalExecutor.execute must be called from within a workflow"
             )
@@ -335,7 +411,7 @@ class TemporalExecutor(Executor):
         *tasks: Callable[..., R] | Coroutine[Any, Any, R],
         **kwargs: Any,
     ) -> AsyncIterator[R | BaseException]:
-        if not workflow._Runtime.current():
+        if not self.in_workflow():
             raise RuntimeError(
                 "TemporalExecutor.execute_streaming must be called from within a workflow"
             )
@@ -360,46 +436,120 @@ class TemporalExecutor(Executor):
     async def ensure_client(self):
         """Ensure we have a connected Temporal client."""
         if self.client is None:
+            data_converter = DataConverter.default
+            if self.config.payload_codec:
+                # Workers created from this client use the same codec
+                data_converter = dataclasses.replace(
+                    data_converter,
+                    payload_codec=CompactingPayloadCodec(self.config.payload_codec),
+                )
+
             self.client = await TemporalClient.connect(
                 target_host=self.config.host,
                 namespace=self.config.namespace,
                 api_key=self.config.api_key,
+                data_converter=data_converter,
             )
 
         return self.client
 
-    async def start_worker(self):
+    def get_worker_options(self) -> Dict[str, Any]:
+        """Worker concurrency, poller and sticky cache options from the Temporal settings."""
+        config = self.config
+        options = {
+            "max_concurrent_activities": config.max_concurrent_activities,
+            "max_concurrent_workflow_tasks": config.max_concurrent_workflow_tasks,
+            "max_concurrent_activity_task_polls": config.max_concurrent_activity_task_polls,
+            "max_concurrent_workflow_task_polls": config.max_concurrent_workflow_task_polls,
+            "max_cached_workflows": config.max_cached_workflows,
+            "max_task_queue_activities_per_second": config.max_task_queue_activities_per_second,
+            "identity": config.worker_identity,
+        }
+        if config.sticky_queue_schedule_to_start_timeout_seconds is not None:
+            options["sticky_queue_schedule_to_start_timeout"] = timedelta(
+                seconds=config.sticky_queue_schedule_to_start_timeout_seconds
+            )
+
+        # Leave anything that isn't configured to the SDK defaults
+        return {k: v for k, v in options.items() if v is not None}
+
+    def get_activities(self) -> List[Callable]:
+        """
+        Return the built-in provider/tool call activities and all tasks
+        from the activity registry as Temporal activity definitions.
+        """
+        activity_registry = self.context.task_registry
+        activities = list(BUILTIN_ACTIVITIES)
+        for name in activity_registry.list_activities():
+            func = activity_registry.get_activity(name)
+            if not hasattr(func, "__temporal_activity_definition"):
+                func = activity.defn(name=name)(func)
+            activities.append(func)
+        return activities
+
+    def get_workflows(self) -> List[type]:
+        """Return the workflow classes registered on the app with @app.workflow."""
+        app = self.context.app
+        return list(app.workflows.values()) if app else []
+
+    def get_aggregator(self, server_names: List[str]) -> MCPAggregator:
+        """
+        Return the aggregator the worker's tool call activities use for the servers.
+        Aggregators are reused across activities so their tool index is only loaded
+        once, and are closed when the worker shuts down.
+        """
+        key = tuple(server_names)
+        aggregator = self._aggregators.get(key)
+        if aggregator is None:
+            aggregator = MCPAggregator(server_names=server_names, context=self.context)
+            self._aggregators[key] = aggregator
+        return aggregator
+
+    async def close_aggregators(self):
+        """Close the aggregators of the worker's tool call activities."""
+        aggregators = list(self._aggregators.values())
+        self._aggregators.clear()
+        for aggregator in aggregators:
+            try:
+                await aggregator.close()
+            except Exception as e:
+                logger.error(f"Error closing MCP aggregator: {e}")
+
+    async def start_worker(
+        self,
+        workflows: List[type] | None = None,
+        activities: List[Callable] | None = None,
+    ):
         """
-        Start a worker in this process, auto-registering all tasks
-        from the global registry. Also picks up any classes decorated
-        with @workflow_defn as recognized workflows.
+        Start a worker in this process, auto-registering all workflows registered
+        with @app.workflow and all tasks from the activity registry.
+        Additional workflows and activities can be passed in explicitly.
+
+        Workers are stateless, so the same worker can be started in any number of
+        processes/hosts polling the same task queue to scale throughput horizontally.
         """
         await self.ensure_client()
 
         if self._worker is None:
-            # We'll collect the activities from the global registry
-            # and optionally wrap them with `activity.defn` if we want
-            # (Not strictly required if your code calls `execute_activity("name")` by name)
-            activity_registry = self.context.task_registry
-            activities = []
-            for name in activity_registry.list_activities():
-                activities.append(activity_registry.get_activity(name))
-
-            # Now we attempt to discover any classes that are recognized as workflows
-            # But in this simple example, we rely on the user specifying them or
-            # we might do a dynamic scan.
-            # For demonstration, we'll just assume the user is only using
-            # the workflow classes they decorate with `@workflow_defn`.
-            # We'll rely on them passing the classes or scanning your code.
+            worker_workflows = self.get_workflows()
+            worker_workflows += [
+                w for w in workflows or [] if w not in worker_workflows
+            ]
+            worker_activities = self.get_activities() + list(activities or [])
 
             self._worker = Worker(
                 client=self.client,
                 task_queue=self.config.task_queue,
-                activities=activities,
-                workflows=[],  # We'll auto-load by Python scanning or let the user specify
+                activities=worker_activities,
+                workflows=worker_workflows,
+                **self.get_worker_options(),
             )
-            print(
-                f"Starting Temporal Worker on task queue '{self.config.task_queue}' with {len(activities)} activities."
+            logger.info(
+                f"Starting Temporal Worker on task queue '{self.config.task_queue}' "
+                f"with {len(worker_workflows)} workflows and {len(worker_activities)} activities."
             )
 
-        await self._worker.run()
+        try:
+            await self._worker.run()
+        finally:
+            await self.close_aggregators()
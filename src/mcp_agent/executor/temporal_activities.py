@@ -0,0 +1,94 @@
+"""
+Built-in Temporal activities for LLM provider calls and MCP tool calls.
+
+With the Temporal engine, AugmentedLLM requests and MCPAggregator.call_tool calls made
+from workflow code are executed as these activities. Their results are recorded in the
+workflow history, so they are retried durably, and a long agent run resumes after a crash
+from its last completed LLM/tool step instead of restarting.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+from temporalio import activity
+
+from mcp_agent.context import get_current_context
+from mcp_agent.logging.tracing import (
+    provider_span_attributes,
+    set_genai_response_attributes,
+)
+from mcp_agent.telemetry.token_usage import TokenUsage
+from mcp_agent.workflows.llm.augmented_llm import (
+    get_provider_request,
+    get_request_payload,
+)
+
+PROVIDER_CALL_ACTIVITY = "mcp_agent.provider_call"
+CALL_TOOL_ACTIVITY = "mcp_agent.call_tool"
+LIST_TOOLS_ACTIVITY = "mcp_agent.list_tools"
+
+
+@activity.defn(name=PROVIDER_CALL_ACTIVITY)
+async def provider_call_activity(
+    provider: str, model: str | None, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Make a request to an LLM provider, within the worker's token budget (if any).
+    The request is traced here, its usage is accounted by the calling workflow's LLM.
+    """
+    context = get_current_context()
+    request_factory, _ = get_provider_request(provider)
+    request = request_factory(context)
+
+    tracer = context.tracer or trace.get_tracer(__name__)
+    with tracer.start_as_current_span(
+        f"chat {model}",
+        kind=SpanKind.CLIENT,
+        attributes=provider_span_attributes(
+            provider,
+            model,
+            arguments.get("max_tokens"),
+            arguments.get("temperature"),
+        ),
+    ) as span:
+        # Provider SDK clients are synchronous, don't block the worker's event loop
+        if context.token_limiter:
+            response = await context.token_limiter.run(
+                provider,
+                model,
+                get_request_payload(arguments),
+                arguments.get("max_tokens"),
+                lambda: asyncio.to_thread(request, **arguments),
+            )
+        else:
+            response = await asyncio.to_thread(request, **arguments)
+
+        set_genai_response_attributes(
+            span, response, TokenUsage.from_response(response)
+        )
+
+    return response.model_dump(mode="json")
+
+
+@activity.defn(name=CALL_TOOL_ACTIVITY)
+async def call_tool_activity(
+    server_names: List[str], name: str, arguments: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Call a tool on one of the given MCP servers."""
+    aggregator = get_current_context().executor.get_aggregator(server_names)
+    result = await aggregator.call_tool(name, arguments)
+    return result.model_dump(mode="json")
+
+
+@activity.defn(name=LIST_TOOLS_ACTIVITY)
+async def list_tools_activity(server_names: List[str]) -> Dict[str, Any]:
+    """List the (namespaced) tools of the given MCP servers."""
+    aggregator = get_current_context().executor.get_aggregator(server_names)
+    result = await aggregator.list_tools()
+    return result.model_dump(mode="json")
+
+
+BUILTIN_ACTIVITIES = [provider_call_activity, call_tool_activity, list_tools_activity]
+"""Activities registered on every worker."""
@@ -0,0 +1,168 @@
+"""
+Payload codec that keeps Temporal payloads (and therefore workflow histories) small.
+
+Activity arguments and results such as message histories, tool results and plan results
+can grow large as conversations grow. Large payloads slow down history fetches and
+replay, and can exceed Temporal's payload size limits. This codec:
+    - compresses payloads above a size threshold, and
+    - moves payloads that are still large after compression to a content-addressed
+      blob store, leaving only a small reference in the workflow history.
+
+Since blobs are content-addressed, identical payloads (e.g. the same conversation prefix
+passed to several activities) are stored only once. Blobs are cached in memory after
+they are first read, so replaying a workflow doesn't re-read them from the store.
+
+Note: the blob store must be reachable by every client and worker that uses the codec
+(the local filesystem store is a stand-in for shared object storage).
+"""
+
+import asyncio
+import hashlib
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Sequence
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+from mcp_agent.config import TemporalPayloadCodecSettings
+from mcp_agent.executor.storage import atomic_write_bytes
+
+ZLIB_ENCODING = b"binary/zlib"
+BLOB_REFERENCE_ENCODING = b"mcp-agent/blob-ref"
+
+
+class BlobStore(ABC):
+    """Content-addressed storage for large payloads."""
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Store the data and return its key (derived from the content)."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        """Return the data stored under the key."""
+
+
+class LocalFileBlobStore(BlobStore):
+    """Blob store backed by a local (or shared network) directory."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def _blob_path(self, key: str) -> Path:
+        # Fan out into subdirectories to keep directory sizes manageable
+        return self.path / key[:2] / key
+
+    async def put(self, data: bytes) -> str:
+        key = hashlib.sha256(data).hexdigest()
+        await asyncio.to_thread(self._write, key, data)
+        return key
+
+    async def get(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._blob_path(key).read_bytes)
+
+    def _write(self, key: str, data: bytes):
+        blob_path = self._blob_path(key)
+        if blob_path.exists():
+            # Content-addressed: the blob is already stored
+            return
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent readers must never see a partial blob
+        atomic_write_bytes(blob_path, data)
+
+
+class CompactingPayloadCodec(PayloadCodec):
+    """
+    Compresses large payloads, and offloads the ones that remain large
+    to a blob store, replacing them with a reference.
+    """
+
+    def __init__(
+        self,
+        settings: TemporalPayloadCodecSettings,
+        blob_store: BlobStore | None = None,
+    ):
+        self.settings = settings
+        self.blob_store = blob_store
+        if self.blob_store is None and settings.blob_store_path:
+            self.blob_store = LocalFileBlobStore(settings.blob_store_path)
+
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_size = 0
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        return [await self._encode_payload(p) for p in payloads]
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        return [await self._decode_payload(p) for p in payloads]
+
+    async def _encode_payload(self, payload: Payload) -> Payload:
+        data = payload.SerializeToString()
+        if len(data) < self.settings.compression_threshold_bytes:
+            return payload
+
+        encoding = b""
+        if self.settings.compression:
+            compressed = zlib.compress(data, self.settings.compression_level)
+            if len(compressed) < len(data):
+                data = compressed
+                encoding = ZLIB_ENCODING
+
+        if self.blob_store is None or len(data) < self.settings.offload_threshold_bytes:
+            if not encoding:
+                # Compression didn't help and the payload stays inline
+                return payload
+            return Payload(metadata={"encoding": encoding}, data=data)
+
+        key = await self.blob_store.put(data)
+        self._cache_blob(key, data)
+        return Payload(
+            metadata={
+                "encoding": BLOB_REFERENCE_ENCODING,
+                "blob-encoding": encoding or b"binary/plain",
+            },
+            data=key.encode(),
+        )
+
+    async def _decode_payload(self, payload: Payload) -> Payload:
+        encoding = payload.metadata.get("encoding", b"")
+
+        if encoding == BLOB_REFERENCE_ENCODING:
+            data = await self._get_blob(payload.data.decode())
+            if payload.metadata.get("blob-encoding") == ZLIB_ENCODING:
+                data = zlib.decompress(data)
+            return Payload.FromString(data)
+
+        if encoding == ZLIB_ENCODING:
+            return Payload.FromString(zlib.decompress(payload.data))
+
+        return payload
+
+    async def _get_blob(self, key: str) -> bytes:
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            return data
+
+        if self.blob_store is None:
+            raise RuntimeError(
+                f"Payload references blob {key}, but no blob store is configured"
+            )
+
+        data = await self.blob_store.get(key)
+        self._cache_blob(key, data)
+        return data
+
+    def _cache_blob(self, key: str, data: bytes):
+        if key in self._cache or len(data) > self.settings.cache_size_bytes:
+            return
+
+        self._cache[key] = data
+        self._cache_size += len(data)
+        while self._cache_size > self.settings.cache_size_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_size -= len(evicted)
@@ -0,0 +1,221 @@
+"""
+Token-per-minute rate limiting for LLM provider requests.
+
+Provider quotas are expressed in tokens per minute, so each (provider, model) pair
+gets a token bucket that refills at its configured budget. Before a request is
+dispatched, its estimated input tokens plus the maximum number of output tokens
+are reserved from the bucket (waiting for the bucket to refill if necessary).
+Once the response arrives, the reservation is reconciled with the actual token
+usage reported by the provider, returning any unused tokens to the bucket.
+
+A single TokenRateLimiter is shared by everything running in a Context, so a
+large fan-out of requests smooths itself out to the quota instead of failing.
+"""
+
+import asyncio
+import json
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+from opentelemetry import trace
+
+from mcp_agent.config import TokenRateLimitSettings
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.telemetry.token_usage import TokenUsage
+
+logger = get_logger(__name__)
+
+tracer = trace.get_tracer(__name__)
+
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at `tokens_per_minute`, holding at most one minute of budget.
+    Requests are admitted in FIFO order so large requests can't be starved by small ones.
+    """
+
+    def __init__(self, tokens_per_minute: int, name: str | None = None):
+        if tokens_per_minute < 1:
+            raise ValueError("tokens_per_minute must be at least 1")
+
+        self.name = name
+        self.capacity = float(tokens_per_minute)
+        self.refill_rate = tokens_per_minute / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.tokens + (now - self._updated_at) * self.refill_rate, self.capacity
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: int) -> float:
+        """
+        Take `tokens` from the bucket, waiting until enough have accumulated.
+        Requests larger than the bucket wait for a full bucket and put it into debt.
+        Returns the time spent waiting, in seconds.
+        """
+        start = time.monotonic()
+        required = min(float(tokens), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= required:
+                    self.tokens -= tokens
+                    return time.monotonic() - start
+
+                with tracer.start_as_current_span(
+                    "token budget wait", attributes={"mcp_agent.tokens": tokens}
+                ):
+                    await asyncio.sleep((required - self.tokens) / self.refill_rate)
+
+    def refund(self, tokens: float):
+        """
+        Return tokens to the bucket. A negative amount charges the bucket instead
+        (e.g. when a request used more tokens than were reserved for it).
+        """
+        self._refill()
+        self.tokens = min(self.tokens + tokens, self.capacity)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current state of the bucket."""
+        self._refill()
+        return {
+            "tokens_per_minute": int(self.capacity),
+            "available_tokens": int(self.tokens),
+        }
+
+
+class TokenReservation:
+    """Tokens reserved from a bucket for a single request."""
+
+    def __init__(self, bucket: TokenBucket | None, tokens: int):
+        self.bucket = bucket
+        self.tokens = tokens
+        self._settled = False
+
+    def reconcile(self, usage: TokenUsage | None):
+        """
+        Settle the reservation against the tokens actually used by the request.
+        If usage is unknown, the estimate is kept.
+        """
+        if self._settled or self.bucket is None:
+            return
+        self._settled = True
+
+        if usage is not None:
+            self.bucket.refund(self.tokens - usage.total_tokens)
+
+    def release(self):
+        """Return the whole reservation to the bucket (e.g. when the request failed)."""
+        if self._settled or self.bucket is None:
+            return
+        self._settled = True
+        self.bucket.refund(self.tokens)
+
+
+class TokenRateLimiter:
+    """
+    Keeps a TokenBucket for each provider and model with a configured budget.
+
+    Example:
+        response = await limiter.run(
+            "Anthropic",
+            model,
+            arguments["messages"],
+            max_tokens,
+            lambda: client.messages.create(**arguments),
+        )
+    """
+
+    def __init__(self, settings: TokenRateLimitSettings):
+        self.settings = settings
+        self._buckets: Dict[Tuple[str | None, str | None], TokenBucket | None] = {}
+
+    def get_tokens_per_minute(
+        self, provider: str | None, model: str | None
+    ) -> int | None:
+        """Find the budget for a provider/model, preferring the most specific match."""
+        limits = self.settings.tokens_per_minute
+        for key in (f"{provider}/{model}", model, provider):
+            if key in limits:
+                return limits[key]
+        return self.settings.default_tokens_per_minute
+
+    def get(self, provider: str | None, model: str | None) -> TokenBucket | None:
+        """Return the bucket for a provider/model, or None if it has no budget."""
+        key = (provider, model)
+        if key not in self._buckets:
+            tokens_per_minute = self.get_tokens_per_minute(provider, model)
+            self._buckets[key] = (
+                TokenBucket(tokens_per_minute, name=f"{provider}/{model}")
+                if tokens_per_minute
+                else None
+            )
+        return self._buckets[key]
+
+    def estimate_tokens(self, payload: Any) -> int:
+        """Roughly estimate the number of input tokens in a request payload."""
+        text = payload if isinstance(payload, str) else json.dumps(payload, default=str)
+        return math.ceil(len(text) / self.settings.chars_per_token)
+
+    async def reserve(
+        self,
+        provider: str | None,
+        model: str | None,
+        payload: Any,
+        max_tokens: int | None = None,
+    ) -> TokenReservation:
+        """
+        Reserve the estimated input tokens of `payload` plus `max_tokens` output tokens,
+        waiting until the provider/model budget allows it.
+        """
+        bucket = self.get(provider, model)
+        if bucket is None:
+            return TokenReservation(None, 0)
+
+        tokens = self.estimate_tokens(payload) + (max_tokens or 0)
+        waited = await bucket.acquire(tokens)
+        if waited > 0:
+            logger.debug(
+                f"Waited {waited:.2f}s for token budget of {bucket.name}",
+                data={"reserved_tokens": tokens},
+            )
+        return TokenReservation(bucket, tokens)
+
+    async def run(
+        self,
+        provider: str | None,
+        model: str | None,
+        payload: Any,
+        max_tokens: int | None,
+        fn: Callable[[], Awaitable[R]],
+    ) -> R:
+        """
+        Run a provider request within the token budget: reserve tokens for it,
+        then reconcile the reservation with the usage reported in its response.
+        """
+        reservation = await self.reserve(provider, model, payload, max_tokens)
+        try:
+            response = await fn()
+        except BaseException:
+            # Failed requests (e.g. rate limited) don't count against the budget
+            reservation.release()
+            raise
+
+        reservation.reconcile(TokenUsage.from_response(response))
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every bucket, keyed by provider/model."""
+        return {
+            bucket.name: bucket.stats()
+            for bucket in self._buckets.values()
+            if bucket is not None
+        }
@@ -1,18 +1,31 @@
+import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
 from typing import (
     Any,
+    Awaitable,
+    Callable,
     Dict,
     Generic,
+    Type,
     TypeVar,
     Union,
 )
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mcp_agent.executor.checkpoint import (
+    CheckpointScope,
+    checkpoint_scope,
+    get_checkpoint_scope,
+    load_checkpoint,
+)
 from mcp_agent.executor.executor import Executor
+from mcp_agent.telemetry.token_usage import TokenUsage
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class WorkflowState(BaseModel):
@@ -25,6 +38,9 @@ class WorkflowState(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     updated_at: float | None = None
     error: Dict[str, Any] | None = None
+    progress: float | None = None
+    progress_total: float | None = None
+    progress_message: str | None = None
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -41,6 +57,8 @@ class WorkflowResult(BaseModel, Generic[T]):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     start_time: float | None = None
     end_time: float | None = None
+    usage: TokenUsage | None = None
+    """Token usage and estimated cost of the LLM requests made by the workflow run"""
 
     # def complete(self) -> "WorkflowResult[T]":
     #     import asyncio
@@ -63,6 +81,10 @@ class Workflow(ABC, Generic[T]):
             - any task methods MUST be decorated with @workflow_task.
 
         - Persistent state: Provides a simple `state` object for storing data across tasks.
+
+        - Durable steps: with the asyncio engine and checkpoints enabled, the results of
+          steps run with `run_step` are checkpointed under the workflow id, so running
+          a workflow with the same id again resumes after its last completed step.
     """
 
     def __init__(
@@ -70,11 +92,16 @@ class Workflow(ABC, Generic[T]):
         executor: Executor,
         name: str | None = None,
         metadata: Dict[str, Any] | None = None,
+        workflow_id: str | None = None,
         **kwargs: Any,
     ):
         self.executor = executor
         self.name = name or self.__class__.__name__
+        self.workflow_id = workflow_id or f"{self.name}-{uuid.uuid4().hex}"
+        self._checkpoint_scope = CheckpointScope(self.workflow_id)
         self.init_kwargs = kwargs
+        # Human input provided while the run wasn't waiting for it (see provide_input)
+        self._pending_input: deque[str] = deque()
         # TODO: handle logging
         # self._logger = logging.getLogger(self.name)
 
@@ -89,22 +116,105 @@ class Workflow(ABC, Generic[T]):
         Main workflow implementation. Myst be overridden by subclasses.
         """
 
+    async def run_step(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[R]],
+        *args: Any,
+        result_type: Type[R] | None = None,
+        **kwargs: Any,
+    ) -> R:
+        """
+        Run a step of the workflow, checkpointing its result.
+        If this workflow id already completed the step, the checkpointed result
+        (validated as `result_type`, if given) is returned instead of running it again.
+        Work done within the step (e.g. @workflow_task calls) is checkpointed as well.
+        """
+        store = self.executor.context.checkpoint_store
+        if store is None:
+            return await fn(*args, **kwargs)
+
+        scope = get_checkpoint_scope()
+        if scope is None or scope.workflow_id != self.workflow_id:
+            with checkpoint_scope(self._checkpoint_scope):
+                return await self.run_step(
+                    name, fn, *args, result_type=result_type, **kwargs
+                )
+
+        key = scope.next_key(f"step:{name}")
+        try:
+            return await load_checkpoint(store, self.workflow_id, key, result_type)
+        except KeyError:
+            pass
+
+        result = await fn(*args, **kwargs)
+        await store.save(self.workflow_id, key, result)
+        return result
+
+    @property
+    def usage(self) -> TokenUsage:
+        """
+        Token usage and estimated cost of the LLM requests made by this workflow run.
+        Usage is attributed to the run while it executes in its usage scope: runs
+        started with the WorkflowRunManager (`app.start_workflow`), and runs whose
+        run method is decorated with `@app.workflow_run`. Usage of a plain `run()`
+        method awaited directly is not attributed to the workflow.
+        """
+        tracker = self.executor.context.usage_tracker
+        if tracker is None:
+            return TokenUsage()
+        return tracker.get_workflow_usage(self.workflow_id)
+
     async def update_state(self, **kwargs):
         """Syntactic sugar to update workflow state."""
         for key, value in kwargs.items():
-            self.state[key] = value
             setattr(self.state, key, value)
 
         self.state.updated_at = datetime.utcnow().timestamp()
 
+    async def report_progress(
+        self,
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+    ):
+        """
+        Report how far the workflow has come (e.g. steps done out of `total`).
+        Progress is part of the workflow state, so it is visible in the run status
+        and is forwarded to MCP clients waiting on the run.
+        """
+        await self.update_state(
+            progress=progress, progress_total=total, progress_message=message
+        )
+
     async def wait_for_input(self, description: str = "Provide input") -> str:
         """
         Convenience method for human input. Uses `human_input` signal
         so we can unify local (console input) and Temporal signals.
+        The signal must be sent for this workflow's id (e.g. by the
+        `provide_user_input` tool of the MCP agent server).
+        Input given with provide_input before this wait is returned right away.
         """
+        if self._pending_input:
+            return self._pending_input.popleft()
+
         return await self.executor.wait_for_signal(
-            "human_input", description=description
+            "human_input",
+            workflow_id=self.workflow_id,
+            signal_description=description,
+        )
+
+    async def provide_input(self, input_data: str) -> None:
+        """
+        Provide human input to this workflow run. The input is delivered to the run's
+        current `wait_for_input`, or kept for its next one if it isn't waiting.
+        """
+        delivered = await self.executor.signal(
+            "human_input", payload=input_data, workflow_id=self.workflow_id
         )
+        # None if the signal bus can't tell, e.g. Temporal, which buffers signals itself
+        if delivered == 0:
+            self._pending_input.append(input_data)
 
 
 # ############################
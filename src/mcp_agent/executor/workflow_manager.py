@@ -0,0 +1,308 @@
+"""
+In-process manager for concurrent workflow runs.
+
+The WorkflowRunManager starts Workflow instances as background tasks, each identified
+by a run id (the workflow id), and tracks their status, state and result so that one
+app process can serve many concurrent runs:
+    - runs beyond the concurrency cap wait in "pending" status until a slot frees up
+    - runs can be queried, awaited and cancelled by id
+    - finished runs are retained for a bounded time/number of runs, then forgotten
+
+With checkpoints enabled, runs execute within a checkpoint scope for their workflow id,
+so starting a run with the id of an interrupted one resumes it.
+
+Example:
+    run_id = await app.run_manager.start(ReportWorkflow, topic="sales")
+    status = app.run_manager.get_status(run_id)
+    result = await app.run_manager.wait(run_id)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, Type, TYPE_CHECKING
+
+from opentelemetry import trace
+from pydantic import BaseModel, ConfigDict
+
+from mcp_agent.config import WorkflowRunSettings
+from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.executor.checkpoint import checkpoint_scope
+from mcp_agent.executor.workflow import Workflow, WorkflowResult, WorkflowState
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.telemetry.token_usage import usage_scope
+
+if TYPE_CHECKING:
+    from mcp_agent.context import Context
+
+logger = get_logger(__name__)
+
+WorkflowRunStatusT = Literal["pending", "running", "completed", "failed", "cancelled"]
+
+
+class WorkflowRunStatus(BaseModel):
+    """Snapshot of the status of a workflow run."""
+
+    run_id: str
+    workflow_name: str
+    status: WorkflowRunStatusT
+    state: WorkflowState | None = None
+    result: WorkflowResult | None = None
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class WorkflowRun:
+    """A workflow run tracked by the WorkflowRunManager."""
+
+    def __init__(self, workflow: Workflow):
+        self.workflow = workflow
+        self.status: WorkflowRunStatusT = "pending"
+        self.result: WorkflowResult | None = None
+        self.error: str | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.task: asyncio.Task | None = None
+
+    @property
+    def run_id(self) -> str:
+        return self.workflow.workflow_id
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def to_status(self) -> WorkflowRunStatus:
+        return WorkflowRunStatus(
+            run_id=self.run_id,
+            workflow_name=self.workflow.name,
+            status=self.status,
+            state=self.workflow.state,
+            result=self.result,
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
+
+
+StatusListener = Callable[[WorkflowRunStatus], Any]
+
+
+class WorkflowRunManager(ContextDependent):
+    """Starts workflow runs in the background and tracks them by run id."""
+
+    def __init__(
+        self,
+        settings: WorkflowRunSettings | None = None,
+        context: Optional["Context"] = None,
+        **kwargs,
+    ):
+        super().__init__(context=context, **kwargs)
+        self.settings = settings or WorkflowRunSettings()
+
+        self._runs: Dict[str, WorkflowRun] = {}
+        # Finished runs in the order they finished, for pruning
+        self._finished: OrderedDict[str, WorkflowRun] = OrderedDict()
+        self._listeners: List[StatusListener] = []
+        self._listener_tasks: set[asyncio.Task] = set()
+        self._semaphore = (
+            asyncio.Semaphore(self.settings.max_concurrent_runs)
+            if self.settings.max_concurrent_runs
+            else None
+        )
+
+    async def start(
+        self,
+        workflow: Workflow | Type[Workflow],
+        *args: Any,
+        run_id: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Start a workflow run in the background and return its run id.
+        `workflow` is either a Workflow instance (whose workflow id is the run id),
+        or a Workflow class, which is instantiated with the context's executor
+        and `run_id` (generated if not given) as its workflow id.
+        Remaining arguments are passed to the workflow's run method.
+        """
+        if isinstance(workflow, type):
+            workflow = workflow(executor=self.context.executor, workflow_id=run_id)
+        elif run_id is not None and run_id != workflow.workflow_id:
+            raise ValueError("The run id of a Workflow instance is its workflow_id")
+
+        existing = self._runs.get(workflow.workflow_id)
+        if existing and not existing.is_finished:
+            raise ValueError(f"Workflow run {workflow.workflow_id} is already active")
+
+        self._prune()
+
+        run = WorkflowRun(workflow)
+        self._finished.pop(run.run_id, None)
+        self._runs[run.run_id] = run
+        run.task = asyncio.create_task(self._run(run, *args, **kwargs))
+        run.task.add_done_callback(lambda _: self._on_task_done(run))
+        self._notify(run)
+        return run.run_id
+
+    async def _run(self, run: WorkflowRun, *args: Any, **kwargs: Any):
+        try:
+            if self._semaphore:
+                async with self._semaphore:
+                    await self._execute(run, *args, **kwargs)
+            else:
+                await self._execute(run, *args, **kwargs)
+        except asyncio.CancelledError:
+            run.workflow.state.status = "cancelled"
+            self._finish(run, "cancelled")
+        except Exception as e:
+            logger.error(f"Workflow run {run.run_id} failed: {e}")
+            run.error = f"{type(e).__name__}: {e}"
+            run.workflow.state.status = "failed"
+            run.workflow.state.record_error(e)
+            self._finish(run, "failed")
+
+    async def _execute(self, run: WorkflowRun, *args: Any, **kwargs: Any):
+        run.status = "running"
+        run.started_at = time.time()
+        run.workflow.state.status = "running"
+        self._notify(run)
+
+        tracer = self.context.tracer or trace.get_tracer(__name__)
+        with (
+            tracer.start_as_current_span(
+                f"workflow {run.workflow.name}",
+                attributes={
+                    "mcp_agent.workflow.name": run.workflow.name,
+                    "mcp_agent.workflow.id": run.run_id,
+                },
+            ),
+            usage_scope(run.run_id),
+        ):
+            if self.context.checkpoint_store:
+                with checkpoint_scope(run.workflow._checkpoint_scope):
+                    result = await run.workflow.run(*args, **kwargs)
+            else:
+                result = await run.workflow.run(*args, **kwargs)
+
+        if not isinstance(result, WorkflowResult):
+            result = WorkflowResult(value=result)
+        result.usage = run.workflow.usage
+        run.result = result
+        run.workflow.state.status = "completed"
+        self._finish(run, "completed")
+
+    def _on_task_done(self, run: WorkflowRun):
+        # A run cancelled before its task started never reaches _run's handlers
+        if not run.is_finished:
+            run.workflow.state.status = "cancelled"
+            self._finish(run, "cancelled")
+
+    def _finish(self, run: WorkflowRun, status: WorkflowRunStatusT):
+        run.status = status
+        run.finished_at = time.time()
+        self._finished[run.run_id] = run
+        self._notify(run)
+
+    def _prune(self):
+        """Forget finished runs beyond the retention window or count."""
+        cutoff = time.time() - self.settings.retention_seconds
+        while self._finished:
+            run_id, run = next(iter(self._finished.items()))
+            if (
+                run.finished_at > cutoff
+                and len(self._finished) <= self.settings.max_retained_runs
+            ):
+                break
+            del self._finished[run_id]
+            if self._runs.get(run_id) is run:
+                del self._runs[run_id]
+                if self.context.usage_tracker:
+                    self.context.usage_tracker.forget_workflow(run_id)
+
+    def _get_run(self, run_id: str) -> WorkflowRun:
+        run = self._runs.get(run_id)
+        if run is None:
+            raise KeyError(f"Workflow run {run_id} not found")
+        return run
+
+    def get_status(self, run_id: str) -> WorkflowRunStatus:
+        """Return the status of a run. Raises KeyError for unknown (or pruned) runs."""
+        self._prune()
+        return self._get_run(run_id).to_status()
+
+    def list_runs(
+        self, status: WorkflowRunStatusT | None = None
+    ) -> List[WorkflowRunStatus]:
+        """Return the status of all tracked runs, optionally filtered by status."""
+        self._prune()
+        return [
+            run.to_status()
+            for run in self._runs.values()
+            if status is None or run.status == status
+        ]
+
+    async def wait(
+        self, run_id: str, timeout_seconds: float | None = None
+    ) -> WorkflowRunStatus:
+        """Wait for a run to finish (or the timeout to pass) and return its status."""
+        run = self._get_run(run_id)
+        if not run.is_finished:
+            await asyncio.wait({run.task}, timeout=timeout_seconds)
+        return run.to_status()
+
+    async def provide_input(self, run_id: str, input_data: str) -> None:
+        """
+        Provide human input to a run (see Workflow.provide_input).
+        Raises ValueError if the run has already finished.
+        """
+        run = self._get_run(run_id)
+        if run.is_finished:
+            raise ValueError(f"Workflow run {run_id} has already finished")
+        await run.workflow.provide_input(input_data)
+
+    async def cancel(self, run_id: str) -> bool:
+        """Cancel a run. Returns False if it had already finished."""
+        run = self._get_run(run_id)
+        if run.is_finished:
+            return False
+
+        run.task.cancel()
+        await asyncio.wait({run.task})
+        return True
+
+    async def shutdown(self):
+        """Cancel all active runs."""
+        tasks = [run.task for run in self._runs.values() if not run.is_finished]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def add_listener(self, listener: StatusListener):
+        """Call `listener` with the new status whenever a run changes status."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StatusListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, run: WorkflowRun):
+        if not self._listeners:
+            return
+
+        status = run.to_status()
+        for listener in list(self._listeners):
+            try:
+                result = listener(status)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.create_task(result)
+                    self._listener_tasks.add(task)
+                    task.add_done_callback(self._listener_tasks.discard)
+            except Exception as e:
+                logger.error(f"Error in workflow run listener: {e}")
@@ -36,8 +36,11 @@ class SignalHandler(Protocol, Generic[SignalValueT]):
     """Protocol for handling signals."""
 
     @abstractmethod
-    async def signal(self, signal: Signal[SignalValueT]) -> None:
-        """Emit a signal to all waiting handlers and registered callbacks."""
+    async def signal(self, signal: Signal[SignalValueT]) -> int | None:
+        """
+        Emit a signal to all waiting handlers and registered callbacks.
+        Returns the number of waiters it reached, if the handler can tell.
+        """
 
     @abstractmethod
     async def wait_for_signal(
@@ -63,32 +66,39 @@ class PendingSignal(BaseModel):
 
     registration: SignalRegistration
     event: asyncio.Event | None = None
+    future: asyncio.Future | None = None
     value: SignalValueT | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class BaseSignalHandler(ABC, Generic[SignalValueT]):
-    """Base class implementing common signal handling functionality."""
+    """
+    Base class implementing common signal handling functionality.
 
-    def __init__(self):
-        # Map signal_name -> list of PendingSignal objects
-        self._pending_signals: Dict[str, List[PendingSignal]] = {}
-        # Map signal_name -> list of (unique_name, handler) tuples
-        self._handlers: Dict[str, List[tuple[str, Callable]]] = {}
-        self._lock = asyncio.Lock()
+    Waiters and handlers are indexed by signal name and then by their unique name,
+    so registering, signaling and removing them never scans unrelated registrations.
+    All bookkeeping happens synchronously on the event loop, so no lock is needed.
+    """
+
+    def __init__(self, registration_ttl_seconds: float | None = None):
+        # Map signal_name -> unique_name -> PendingSignal
+        self._pending_signals: Dict[str, Dict[str, PendingSignal]] = {}
+        # Map signal_name -> unique_name -> handler
+        self._handlers: Dict[str, Dict[str, Callable]] = {}
+
+        # Waits expire after this long even without a timeout (never if None),
+        # so waiters that will never be signaled don't hold their registrations forever
+        self.registration_ttl_seconds = registration_ttl_seconds
 
     async def cleanup(self, signal_name: str | None = None):
         """Clean up handlers and registrations for a signal or all signals."""
-        async with self._lock:
-            if signal_name:
-                if signal_name in self._handlers:
-                    del self._handlers[signal_name]
-                if signal_name in self._pending_signals:
-                    del self._pending_signals[signal_name]
-            else:
-                self._handlers.clear()
-                self._pending_signals.clear()
+        if signal_name:
+            self._handlers.pop(signal_name, None)
+            self._pending_signals.pop(signal_name, None)
+        else:
+            self._handlers.clear()
+            self._pending_signals.clear()
 
     def validate_signal(self, signal: Signal[SignalValueT]):
         """Validate signal properties."""
@@ -96,6 +106,38 @@ class BaseSignalHandler(ABC, Generic[SignalValueT]):
             raise ValueError("Signal name is required")
         # Subclasses can override to add more validation
 
+    def get_wait_timeout(self, timeout_seconds: float | None) -> float | None:
+        """Return the timeout of a wait: the requested one, bounded by the registration TTL."""
+        if self.registration_ttl_seconds is None:
+            return timeout_seconds
+        if timeout_seconds is None:
+            return self.registration_ttl_seconds
+        return min(timeout_seconds, self.registration_ttl_seconds)
+
+    def _add_pending(self, pending_signal: PendingSignal):
+        registration = pending_signal.registration
+        self._pending_signals.setdefault(registration.signal_name, {})[
+            registration.unique_name
+        ] = pending_signal
+
+    def _remove_pending(self, signal_name: str, unique_name: str):
+        pending = self._pending_signals.get(signal_name)
+        if pending is None:
+            return
+        pending.pop(unique_name, None)
+        if not pending:
+            del self._pending_signals[signal_name]
+
+    def _get_pending(self, signal_name: str) -> List[PendingSignal]:
+        # Copy, since waiters remove themselves once they are notified
+        return list(self._pending_signals.get(signal_name, {}).values())
+
+    def _add_handler(self, signal_name: str, unique_name: str, handler: Callable):
+        self._handlers.setdefault(signal_name, {})[unique_name] = handler
+
+    def _get_handlers(self, signal_name: str) -> List[tuple[str, Callable]]:
+        return list(self._handlers.get(signal_name, {}).items())
+
     def on_signal(self, signal_name: str) -> Callable:
         """Register a handler for a signal."""
 
@@ -112,14 +154,17 @@ class BaseSignalHandler(ABC, Generic[SignalValueT]):
                     # Log the error but don't fail the entire signal handling
                     print(f"Error in signal handler {signal_name}: {str(e)}")
 
-            self._handlers.setdefault(signal_name, []).append((unique_name, wrapped))
+            self._add_handler(signal_name, unique_name, wrapped)
             return wrapped
 
         return decorator
 
     @abstractmethod
-    async def signal(self, signal: Signal[SignalValueT]) -> None:
-        """Emit a signal to all waiting handlers and registered callbacks."""
+    async def signal(self, signal: Signal[SignalValueT]) -> int | None:
+        """
+        Emit a signal to all waiting handlers and registered callbacks.
+        Returns the number of waiters it reached, if the handler can tell.
+        """
 
     @abstractmethod
     async def wait_for_signal(
@@ -191,13 +236,13 @@ class ConsoleSignalHandler(SignalHandler[str]):
 
 class AsyncioSignalHandler(BaseSignalHandler[SignalValueT]):
     """
-    Asyncio-based signal handling using an internal dictionary of asyncio Events.
+    Asyncio-based signal handling, resolving a future for each waiting coroutine.
     """
 
     async def wait_for_signal(
         self, signal, timeout_seconds: int | None = None
     ) -> SignalValueT:
-        event = asyncio.Event()
+        future = asyncio.get_running_loop().create_future()
         unique_name = str(uuid.uuid4())
 
         registration = SignalRegistration(
@@ -206,33 +251,19 @@ class AsyncioSignalHandler(BaseSignalHandler[SignalValueT]):
             workflow_id=signal.workflow_id,
         )
 
-        pending_signal = PendingSignal(registration=registration, event=event)
-
-        async with self._lock:
-            # Add to pending signals
-            self._pending_signals.setdefault(signal.name, []).append(pending_signal)
+        self._add_pending(PendingSignal(registration=registration, future=future))
 
+        timeout_seconds = self.get_wait_timeout(timeout_seconds)
         try:
             # Wait for signal
             if timeout_seconds is not None:
-                await asyncio.wait_for(event.wait(), timeout_seconds)
+                return await asyncio.wait_for(future, timeout_seconds)
             else:
-                await event.wait()
-
-            return pending_signal.value
+                return await future
         except asyncio.TimeoutError as e:
             raise TimeoutError(f"Timeout waiting for signal {signal.name}") from e
         finally:
-            async with self._lock:
-                # Remove from pending signals
-                if signal.name in self._pending_signals:
-                    self._pending_signals[signal.name] = [
-                        ps
-                        for ps in self._pending_signals[signal.name]
-                        if ps.registration.unique_name != unique_name
-                    ]
-                    if not self._pending_signals[signal.name]:
-                        del self._pending_signals[signal.name]
+            self._remove_pending(signal.name, unique_name)
 
     def on_signal(self, signal_name):
         def decorator(func):
@@ -242,27 +273,31 @@ class AsyncioSignalHandler(BaseSignalHandler[SignalValueT]):
                 else:
                     func(value)
 
-            self._handlers.setdefault(signal_name, []).append(wrapped)
+            self._add_handler(signal_name, f"{signal_name}_{uuid.uuid4()}", wrapped)
             return wrapped
 
         return decorator
 
-    async def signal(self, signal):
-        async with self._lock:
-            # Notify any waiting coroutines
-            if signal.name in self._pending_signals:
-                pending = self._pending_signals[signal.name]
-                for ps in pending:
-                    ps.value = signal.payload
-                    ps.event.set()
+    async def signal(self, signal) -> int:
+        # Notify any waiting coroutines (of the signal's workflow, if it has one)
+        delivered = 0
+        for pending_signal in self._get_pending(signal.name):
+            workflow_id = pending_signal.registration.workflow_id
+            if signal.workflow_id and workflow_id and workflow_id != signal.workflow_id:
+                continue
+            if not pending_signal.future.done():
+                pending_signal.value = signal.payload
+                pending_signal.future.set_result(signal.payload)
+                delivered += 1
 
         # Notify any registered handler functions
-        tasks = []
-        handlers = self._handlers.get(signal.name, [])
-        for _, handler in handlers:
-            tasks.append(handler(signal))
+        handlers = self._get_handlers(signal.name)
+        if handlers:
+            await asyncio.gather(
+                *(handler(signal) for _, handler in handlers), return_exceptions=True
+            )
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        return delivered
 
 
 # TODO: saqadri - check if we need to do anything to combine this and AsyncioSignalHandler
@@ -4,21 +4,37 @@ Events and event filters for the logger module for the MCP Agent
 
 import logging
 import random
+import threading
+import time
 
+from collections import OrderedDict
 from datetime import datetime
 from typing import (
     Any,
     Dict,
+    List,
     Literal,
     Set,
+    Tuple,
 )
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from mcp_agent.config import LogRateLimitSettings
 
 
 EventType = Literal["debug", "info", "warning", "error", "progress"]
 """Broad categories for events (severity or role)."""
 
+EVENT_LEVELS: Dict[EventType, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "progress": logging.DEBUG,
+}
+"""Severity of each event type, as Python logging levels."""
+
 
 class EventContext(BaseModel):
     """
@@ -93,20 +109,35 @@ class EventFilter(BaseModel):
 
         # 4) Minimum severity
         if self.min_level:
-            level_map: Dict[EventType, int] = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-            }
-
-            min_val = level_map.get(self.min_level, logging.DEBUG)
-            event_val = level_map.get(event.type, logging.DEBUG)
+            min_val = EVENT_LEVELS.get(self.min_level, logging.DEBUG)
+            event_val = EVENT_LEVELS.get(event.type, logging.DEBUG)
             if event_val < min_val:
                 return False
 
         return True
 
+    def min_level_for(self, namespace: str) -> int | None:
+        """
+        Return the lowest severity of events from the namespace that may match this
+        filter, or None if none can (ignoring the event name criteria).
+        """
+        if self.namespaces and not any(
+            namespace.startswith(ns) for ns in self.namespaces
+        ):
+            return None
+
+        min_val = (
+            EVENT_LEVELS.get(self.min_level, logging.DEBUG)
+            if self.min_level
+            else logging.DEBUG
+        )
+        levels = [
+            EVENT_LEVELS[event_type]
+            for event_type in (self.types or EVENT_LEVELS.keys())
+            if EVENT_LEVELS[event_type] >= min_val
+        ]
+        return min(levels) if levels else None
+
 
 class SamplingFilter(EventFilter):
     """
@@ -121,3 +152,125 @@ class SamplingFilter(EventFilter):
         if not super().matches(event):
             return False
         return random.random() < self.sample_rate
+
+
+class _RateLimitState:
+    """Sampling and rate limiting state for one rule, namespace and event name."""
+
+    __slots__ = (
+        "count",
+        "tokens",
+        "refilled_at",
+        "last_message",
+        "last_passed_at",
+        "repeats",
+    )
+
+    def __init__(self, tokens: float):
+        self.count = 0
+        self.tokens = tokens
+        self.refilled_at = time.monotonic()
+        self.last_message: str | None = None
+        self.last_passed_at = 0.0
+        self.repeats = 0
+
+
+class RateLimitFilter(EventFilter):
+    """
+    Per-namespace and per-event-name sampling and rate limiting on top of base filter.
+    The first rule that matches an event decides whether it passes:
+      - the first `first_n` events always pass (repeats aside)
+      - the rest pass with probability `sample_rate`
+      - and only while the token bucket (`rate` per second, up to `burst`) has tokens
+      - repeats of the same message within `dedup_seconds` are suppressed, and
+        counted on the next event that passes ("suppressed_repeats" in its data)
+    Events matching no rule pass. Unlike other filters, this one is stateful, so use
+    it in one place (the event bus applies it once per event, before queueing).
+    """
+
+    rules: List[LogRateLimitSettings] = Field(default_factory=list)
+
+    max_states: int = 4096
+    """
+    Maximum number of (rule, namespace, event name) states kept. The least recently
+    used are dropped first, which starts them afresh (e.g. first_n passes again).
+    """
+
+    suppressed: int = 0
+    """Number of events suppressed so far"""
+
+    _states: OrderedDict[Tuple[int, str, str | None], _RateLimitState] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _find_rule(self, event: Event) -> int | None:
+        for index, rule in enumerate(self.rules):
+            if rule.namespace and not event.namespace.startswith(rule.namespace):
+                continue
+            if rule.name and event.name != rule.name:
+                continue
+            if rule.types and event.type not in rule.types:
+                continue
+            return index
+        return None
+
+    def matches(self, event: Event) -> bool:
+        if not super().matches(event):
+            return False
+
+        index = self._find_rule(event)
+        if index is None:
+            return True
+
+        rule = self.rules[index]
+        with self._lock:
+            passed = self._admit(rule, index, event)
+            if not passed:
+                self.suppressed += 1
+            return passed
+
+    def _admit(self, rule: LogRateLimitSettings, index: int, event: Event) -> bool:
+        burst = rule.burst or max(1.0, rule.rate or 1.0)
+        key = (index, event.namespace, event.name)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _RateLimitState(tokens=burst)
+            while len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(key)
+        now = time.monotonic()
+
+        if rule.dedup_seconds:
+            if (
+                event.message == state.last_message
+                and now - state.last_passed_at < rule.dedup_seconds
+            ):
+                state.repeats += 1
+                return False
+
+        state.count += 1
+        if state.count > rule.first_n:
+            if rule.sample_rate < 1.0 and random.random() >= rule.sample_rate:
+                return False
+
+            if rule.rate is not None:
+                state.tokens = min(
+                    burst, state.tokens + (now - state.refilled_at) * rule.rate
+                )
+                state.refilled_at = now
+                if state.tokens < 1.0:
+                    return False
+                state.tokens -= 1.0
+
+        if state.repeats:
+            event.data = {
+                **event.data,
+                "suppressed_repeats": state.repeats,
+                "suppressed_message": state.last_message,
+            }
+            state.repeats = 0
+        state.last_message = event.message
+        state.last_passed_at = now
+        return True
@@ -1,110 +1,244 @@
-from typing import Any, Dict, Iterable, Set
+from typing import Any, Callable, Dict, Iterable, Mapping, Set
 from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
 from uuid import UUID
 from enum import Enum
 import dataclasses
-import inspect
+import itertools
+import json
 import httpx
 
+try:
+    import orjson
+except ImportError:  # Optional, used for faster encoding when installed
+    orjson = None
+
+
+Handler = Callable[[Any, int, Set[int]], Any]
+
 
 class JSONSerializer:
     """
     A robust JSON serializer that handles various Python objects by attempting
     different serialization strategies recursively.
+
+    The strategy for each type is resolved once and cached, so serializing a value
+    costs a dict lookup per node. Output size is bounded: nesting deeper than
+    `max_depth`, strings longer than `max_string_length` and collections with more
+    than `max_items` items are truncated, so logging a huge payload stays cheap.
     """
 
-    def __init__(self):
-        # Set of already processed objects to prevent infinite recursion
-        self._processed_objects: Set[int] = set()
+    def __init__(
+        self,
+        max_depth: int = 20,
+        max_string_length: int = 10_000,
+        max_items: int = 1_000,
+        use_orjson: bool | None = None,
+    ):
+        """
+        Args:
+            max_depth: Maximum nesting depth of containers to serialize
+            max_string_length: Maximum length of strings, longer strings are truncated
+            max_items: Maximum number of items of lists and dicts, the rest are omitted
+            use_orjson: Whether to encode with orjson. Defaults to using it if installed
+        """
+        self.max_depth = max_depth
+        self.max_string_length = max_string_length
+        self.max_items = max_items
+        if use_orjson and orjson is None:
+            raise ImportError("orjson is not installed: pip install orjson")
+        self.use_orjson = orjson is not None if use_orjson is None else use_orjson
+
+        self._handlers: Dict[type, Handler] = {
+            type(None): self._serialize_identity,
+            bool: self._serialize_identity,
+            int: self._serialize_identity,
+            float: self._serialize_identity,
+            str: self._serialize_str,
+            dict: self._serialize_mapping,
+            list: self._serialize_iterable,
+            tuple: self._serialize_iterable,
+        }
 
     def serialize(self, obj: Any) -> Any:
         """Main entry point for serialization."""
-        # Reset processed objects for new serialization
-        self._processed_objects.clear()
-        return self._serialize_object(obj)
-
-    def _serialize_object(self, obj: Any) -> Any:
-        """Recursively serialize an object using various strategies."""
-        # Handle None
-        if obj is None:
-            return None
-
-        # Prevent infinite recursion
-        obj_id = id(obj)
-        if obj_id in self._processed_objects:
-            return str(obj)
-        self._processed_objects.add(obj_id)
+        return self._serialize_object(obj, 0, set())
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize an object and encode it as compact JSON."""
+        if self.use_orjson:
+            return orjson.dumps(self.serialize(obj)).decode("utf-8")
+        return json.dumps(
+            self.serialize(obj), separators=(",", ":"), ensure_ascii=False
+        )
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize an object and encode it as compact UTF-8 JSON."""
+        if self.use_orjson:
+            return orjson.dumps(self.serialize(obj))
+        return self.dumps(obj).encode("utf-8")
+
+    def _serialize_object(self, obj: Any, depth: int, path: Set[int]) -> Any:
+        """Recursively serialize an object with the strategy for its type."""
+        cls = type(obj)
+        handler = self._handlers.get(cls)
+        if handler is None:
+            handler = self._handlers[cls] = self._resolve_handler(cls)
 
-        # Try different serialization strategies in order
         try:
-            if isinstance(obj, httpx.Response):
-                return f"<httpx.Response [{obj.status_code}] {obj.url}>"
-
-            # Basic JSON-serializable types
-            if isinstance(obj, (str, int, float, bool)):
-                return obj
-
-            # Handle common built-in types
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, (Decimal, UUID)):
-                return str(obj)
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-
-            # Handle callables
-            if callable(obj):
-                return f"<callable: {obj.__name__}>"
-
-            # Handle Pydantic models
-            if hasattr(obj, "model_dump"):  # Pydantic v2
-                return self._serialize_object(obj.model_dump())
-            if hasattr(obj, "dict"):  # Pydantic v1
-                return self._serialize_object(obj.dict())
-
-            # Handle dataclasses
-            if dataclasses.is_dataclass(obj):
-                return self._serialize_object(dataclasses.asdict(obj))
-
-            # Handle objects with custom serialization method
-            if hasattr(obj, "to_json"):
-                return self._serialize_object(obj.to_json())
-            if hasattr(obj, "to_dict"):
-                return self._serialize_object(obj.to_dict())
-
-            # Handle dictionaries
-            if isinstance(obj, Dict):
-                return {
-                    str(key): self._serialize_object(value)
-                    for key, value in obj.items()
+            return handler(obj, depth, path)
+        except Exception as e:
+            # If all serialization attempts fail, return string representation
+            return f"<unserializable: {cls.__name__}, error: {str(e)}>"
+
+    def _resolve_handler(self, cls: type) -> Handler:
+        """Pick the serialization strategy for a type."""
+        if issubclass(cls, httpx.Response):
+            return lambda obj, depth, path: (
+                f"<httpx.Response [{obj.status_code}] {obj.url}>"
+            )
+
+        # Basic JSON-serializable types (and their subclasses)
+        if issubclass(cls, Enum):
+            return self._serialize_enum
+        if issubclass(cls, str):
+            return self._serialize_str
+        if issubclass(cls, (bool, int, float)):
+            return self._serialize_identity
+
+        # Handle common built-in types
+        if issubclass(cls, (datetime, date)):
+            return lambda obj, depth, path: obj.isoformat()
+        if issubclass(cls, (Decimal, UUID, Path)):
+            return lambda obj, depth, path: str(obj)
+        if issubclass(cls, (bytes, bytearray)):
+            return lambda obj, depth, path: f"<{cls.__name__}: {len(obj)} bytes>"
+
+        # Handle Pydantic models
+        if hasattr(cls, "model_dump"):  # Pydantic v2
+            return self._serialize_pydantic
+        if hasattr(cls, "dict") and callable(cls.dict):  # Pydantic v1
+            return self._converter(lambda obj: obj.dict())
+
+        # Handle dataclasses
+        if dataclasses.is_dataclass(cls):
+            return self._converter(
+                lambda obj: {
+                    field.name: getattr(obj, field.name)
+                    for field in dataclasses.fields(obj)
                 }
+            )
 
-            # Handle iterables (lists, tuples, sets)
-            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-                return [self._serialize_object(item) for item in obj]
+        # Handle objects with custom serialization method
+        if hasattr(cls, "to_json"):
+            return self._converter(lambda obj: obj.to_json())
+        if hasattr(cls, "to_dict"):
+            return self._converter(lambda obj: obj.to_dict())
 
-            # Handle objects with __dict__
-            if hasattr(obj, "__dict__"):
-                return self._serialize_object(obj.__dict__)
+        # Handle dictionaries
+        if issubclass(cls, Mapping):
+            return self._serialize_mapping
 
-            # Handle objects with attributes
-            if inspect.getmembers(obj):
-                return {
-                    name: self._serialize_object(value)
-                    for name, value in inspect.getmembers(obj)
-                    if not name.startswith("_") and not inspect.ismethod(value)
-                }
+        # Handle callables (functions, classes, objects defining __call__)
+        if any("__call__" in vars(base) for base in cls.__mro__):
+            return self._serialize_callable
 
-            # Fallback: convert to string
+        # Handle iterables (lists, tuples, sets)
+        if issubclass(cls, Iterable):
+            return self._serialize_iterable
+
+        # Handle objects with __dict__, falling back to the string representation
+        return self._serialize_attributes
+
+    def _converter(self, convert: Callable[[Any], Any]) -> Handler:
+        """Strategy that converts an object to simpler values, then serializes those."""
+
+        def handler(obj: Any, depth: int, path: Set[int]) -> Any:
+            return self._serialize_object(convert(obj), depth, path)
+
+        return handler
+
+    @staticmethod
+    def _serialize_identity(obj: Any, depth: int, path: Set[int]) -> Any:
+        return obj
+
+    def _serialize_str(self, obj: str, depth: int, path: Set[int]) -> str:
+        if len(obj) <= self.max_string_length:
             return str(obj)
+        omitted = len(obj) - self.max_string_length
+        return f"{obj[: self.max_string_length]}...<{omitted} more characters>"
 
-        except Exception as e:
-            # If all serialization attempts fail, return string representation
-            return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
+    def _serialize_enum(self, obj: Enum, depth: int, path: Set[int]) -> Any:
+        return self._serialize_object(obj.value, depth, path)
+
+    @staticmethod
+    def _serialize_callable(obj: Any, depth: int, path: Set[int]) -> str:
+        name = getattr(obj, "__name__", type(obj).__name__)
+        return f"<callable: {name}>"
+
+    def _serialize_pydantic(self, obj: Any, depth: int, path: Set[int]) -> Any:
+        try:
+            data = obj.model_dump(mode="json")
+        except Exception:
+            # Fields of arbitrary types that pydantic can't serialize to JSON
+            data = obj.model_dump()
+        return self._serialize_object(data, depth, path)
+
+    def _serialize_attributes(self, obj: Any, depth: int, path: Set[int]) -> Any:
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is None:
+            # Fallback: convert to string
+            return self._serialize_str(str(obj), depth, path)
+        return self._serialize_mapping(attributes, depth, path)
+
+    def _enter(self, obj: Any, depth: int, path: Set[int]) -> str | None:
+        """Return a placeholder if a container shouldn't be serialized further."""
+        if id(obj) in path:
+            return f"<circular reference: {type(obj).__name__}>"
+        if depth >= self.max_depth:
+            return f"<{type(obj).__name__}: max depth reached>"
+        return None
+
+    def _serialize_mapping(self, obj: Mapping, depth: int, path: Set[int]) -> Any:
+        placeholder = self._enter(obj, depth, path)
+        if placeholder is not None:
+            return placeholder
+
+        path.add(id(obj))
+        try:
+            result = {
+                str(key): self._serialize_object(value, depth + 1, path)
+                for key, value in itertools.islice(obj.items(), self.max_items)
+            }
+            if len(obj) > self.max_items:
+                result["..."] = f"<{len(obj) - self.max_items} more items>"
+            return result
+        finally:
+            path.discard(id(obj))
+
+    def _serialize_iterable(self, obj: Iterable, depth: int, path: Set[int]) -> Any:
+        placeholder = self._enter(obj, depth, path)
+        if placeholder is not None:
+            return placeholder
+
+        path.add(id(obj))
+        try:
+            result = [
+                self._serialize_object(item, depth + 1, path)
+                for item in itertools.islice(obj, self.max_items + 1)
+            ]
+            if len(result) > self.max_items:
+                result.pop()
+                omitted = (
+                    f"{len(obj) - self.max_items} more items"
+                    if hasattr(obj, "__len__")
+                    else "more items"
+                )
+                result.append(f"<{omitted}>")
+            return result
+        finally:
+            path.discard(id(obj))
 
     def __call__(self, obj: Any) -> Any:
         """Make the serializer callable."""
@@ -11,6 +11,13 @@ from typing import Dict, List
 
 from mcp_agent.logging.events import Event, EventFilter, EventType
 
+_LEVEL_MAP: Dict[EventType, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
 
 class EventListener(ABC):
     """Base async listener that processes events."""
@@ -19,6 +26,14 @@ class EventListener(ABC):
     async def handle_event(self, event: Event):
         """Process an incoming event."""
 
+    async def handle_events(self, events: List[Event]):
+        """
+        Process a batch of incoming events, in order.
+        Override to handle a batch at once rather than event by event.
+        """
+        for event in events:
+            await self.handle_event(event)
+
 
 class LifecycleAwareListener(EventListener):
     """
@@ -53,10 +68,24 @@ class FilteredListener(LifecycleAwareListener):
         if not self.filter or self.filter.matches(event):
             await self.handle_matched_event(event)
 
+    async def handle_events(self, events):
+        await self.handle_matched_events(self.filter_events(events))
+
+    def filter_events(self, events: List[Event]) -> List[Event]:
+        """Return the events that match the filter."""
+        if not self.filter:
+            return events
+        return [event for event in events if self.filter.matches(event)]
+
     async def handle_matched_event(self, event: Event):
         """Process an event that matches the filter."""
         pass
 
+    async def handle_matched_events(self, events: List[Event]):
+        """Process a batch of events that match the filter."""
+        for event in events:
+            await self.handle_matched_event(event)
+
 
 class LoggingListener(FilteredListener):
     """
@@ -77,13 +106,14 @@ class LoggingListener(FilteredListener):
         self.logger = logger or logging.getLogger("mcp_agent")
 
     async def handle_matched_event(self, event):
-        level_map: Dict[EventType, int] = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-        }
-        level = level_map.get(event.type, logging.INFO)
+        self._log(event)
+
+    async def handle_matched_events(self, events):
+        for event in events:
+            self._log(event)
+
+    def _log(self, event: Event):
+        level = _LEVEL_MAP.get(event.type, logging.INFO)
 
         self.logger.log(
             level,
@@ -163,6 +193,11 @@ class BatchingListener(FilteredListener):
         if len(self.batch) >= self.batch_size:
             await self.flush()
 
+    async def handle_matched_events(self, events):
+        self.batch.extend(events)
+        if len(self.batch) >= self.batch_size:
+            await self.flush()
+
     async def flush(self):
         """Flush the current batch of events."""
         if not self.batch:
@@ -7,17 +7,40 @@ Logger module for the MCP Agent, which provides:
 - Developer-friendly Logger that can be used anywhere
 """
 
-import asyncio
+import logging
 import threading
 import time
+import weakref
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from contextlib import asynccontextmanager, contextmanager
 
-from mcp_agent.logging.events import Event, EventContext, EventFilter, EventType
+from mcp_agent.config import LogRateLimitSettings
+from mcp_agent.logging.events import (
+    EVENT_LEVELS,
+    Event,
+    EventContext,
+    EventFilter,
+    EventType,
+    RateLimitFilter,
+)
 from mcp_agent.logging.listeners import BatchingListener, LoggingListener
-from mcp_agent.logging.transport import AsyncEventBus, EventTransport
+from mcp_agent.logging.transport import (
+    AsyncEventBus,
+    EventTransport,
+    OverflowPolicy,
+)
+
+
+# Level of loggers whose events no transport or listener accepts
+_DISABLED = logging.CRITICAL + 1
+
+_DEBUG = EVENT_LEVELS["debug"]
+_INFO = EVENT_LEVELS["info"]
+_WARNING = EVENT_LEVELS["warning"]
+_ERROR = EVENT_LEVELS["error"]
+_PROGRESS = EVENT_LEVELS["progress"]
 
 
 class Logger:
@@ -25,31 +48,33 @@ class Logger:
     Developer-friendly logger that sends events to the AsyncEventBus.
     - `type` is a broad category (INFO, ERROR, etc.).
     - `name` can be a custom domain-specific event name, e.g. "ORDER_PLACED".
+
+    Each logger caches the lowest level of events from its namespace that the event
+    bus's transport or listeners accept, so that disabled calls return after a single
+    integer comparison, before any event is built.
     """
 
     def __init__(self, namespace: str):
         self.namespace = namespace
         self.event_bus = AsyncEventBus.get()
+        self._level = _DISABLED
+        self._refresh_level()
+        _all_loggers.add(self)
 
-    def _ensure_event_loop(self):
-        """Ensure we have an event loop we can use."""
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            # If no loop is running, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop
+    def _refresh_level(self):
+        level = self.event_bus.min_level_for(self.namespace)
+        self._level = _DISABLED if level is None else level
+
+    def is_enabled_for(self, etype: EventType) -> bool:
+        """
+        Return whether events of this type would be processed.
+        Use it to skip building expensive log data for disabled events.
+        """
+        return EVENT_LEVELS.get(etype, _DEBUG) >= self._level
 
     def _emit_event(self, event: Event):
-        """Emit an event by running it in the event loop."""
-        loop = self._ensure_event_loop()
-        if loop.is_running():
-            # If we're in a thread with a running loop, schedule the coroutine
-            asyncio.create_task(self.event_bus.emit(event))
-        else:
-            # If no loop is running, run it until the emit completes
-            loop.run_until_complete(self.event_bus.emit(event))
+        """Queue an event on the event bus (without scheduling a task per event)."""
+        self.event_bus.emit_nowait(event)
 
     def event(
         self,
@@ -60,6 +85,9 @@ class Logger:
         data: dict,
     ):
         """Create and emit an event."""
+        if EVENT_LEVELS.get(etype, _DEBUG) < self._level:
+            return
+
         evt = Event(
             type=etype,
             name=ename,
@@ -78,6 +106,8 @@ class Logger:
         **data,
     ):
         """Log a debug message."""
+        if _DEBUG < self._level:
+            return
         self.event("debug", name, message, context, data)
 
     def info(
@@ -88,6 +118,8 @@ class Logger:
         **data,
     ):
         """Log an info message."""
+        if _INFO < self._level:
+            return
         self.event("info", name, message, context, data)
 
     def warning(
@@ -98,6 +130,8 @@ class Logger:
         **data,
     ):
         """Log a warning message."""
+        if _WARNING < self._level:
+            return
         self.event("warning", name, message, context, data)
 
     def error(
@@ -108,6 +142,8 @@ class Logger:
         **data,
     ):
         """Log an error message."""
+        if _ERROR < self._level:
+            return
         self.event("error", name, message, context, data)
 
     def progress(
@@ -119,6 +155,8 @@ class Logger:
         **data,
     ):
         """Log a progress message."""
+        if _PROGRESS < self._level:
+            return
         merged_data = dict(percentage=percentage, **data)
         self.event("progress", name, message, context, merged_data)
 
@@ -189,6 +227,9 @@ class LoggingConfig:
         transport: EventTransport | None = None,
         batch_size: int = 100,
         flush_interval: float = 2.0,
+        max_queue_size: int = 2048,
+        overflow_policy: OverflowPolicy = "drop_oldest",
+        rate_limits: List[LogRateLimitSettings] | None = None,
         **kwargs: Any,
     ):
         """
@@ -197,14 +238,23 @@ class LoggingConfig:
         Args:
             event_filter: Default filter for all loggers
             transport: Transport for sending events to external systems
-            batch_size: Default batch size for batching listener
+            batch_size: Default batch size for the event bus and batching listener
             flush_interval: Default flush interval for batching listener
+            max_queue_size: Maximum number of events queued for processing
+            overflow_policy: What to do with new events when the queue is full
+                ("block" only applies to awaited emits and to other threads)
+            rate_limits: Sampling and rate limiting rules for noisy namespaces or events
             **kwargs: Additional configuration options
         """
         if cls._initialized:
             return
 
         bus = AsyncEventBus.get(transport=transport)
+        bus.configure_queue(max_queue_size, overflow_policy)
+        bus.max_batch_size = batch_size
+        bus.rate_limit_filter = (
+            RateLimitFilter(min_level=None, rules=rate_limits) if rate_limits else None
+        )
 
         # Add standard listeners
         if "logging" not in bus.listeners:
@@ -245,6 +295,17 @@ class LoggingConfig:
 
 _logger_lock = threading.Lock()
 _loggers: Dict[str, Logger] = {}
+# All Logger instances, including those not created through get_logger
+_all_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+
+
+def refresh_logger_levels():
+    """Recompute the cached level of every logger (e.g. after changing a filter)."""
+    for logger in list(_all_loggers):
+        logger._refresh_level()
+
+
+AsyncEventBus.get().add_sinks_changed_callback(refresh_logger_levels)
 
 
 def get_logger(namespace: str) -> Logger:
@@ -5,8 +5,10 @@ for the Logger module for MCP Agent
 
 import asyncio
 import functools
-from typing import Any, Dict, Callable, Optional, Tuple, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Any, Dict, Callable, Iterator, Optional, Tuple, TYPE_CHECKING
 
+from opentelemetry import context as otel_context
 from opentelemetry import trace
 from opentelemetry.context import Context as OtelContext
 from opentelemetry.propagate import extract as otel_extract
@@ -16,6 +18,7 @@ from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapProp
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.telemetry.token_usage import TokenUsage
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -98,6 +101,63 @@ class TelemetryManager(ContextDependent):
                 span.set_attribute(k, str(v))
 
 
+def span_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the attributes that can be set on a span (OpenTelemetry rejects None values)."""
+    return {k: v for k, v in attributes.items() if v is not None}
+
+
+def provider_span_attributes(
+    provider: str | None,
+    model: str | None,
+    max_tokens: int | None = None,
+    temperature: float | None = None,
+    agent_name: str | None = None,
+) -> Dict[str, Any]:
+    """Return the GenAI semantic convention attributes of a provider request span."""
+    return span_attributes(
+        {
+            "gen_ai.operation.name": "chat",
+            "gen_ai.system": provider.lower() if provider else None,
+            "gen_ai.request.model": model,
+            "gen_ai.request.max_tokens": max_tokens,
+            "gen_ai.request.temperature": temperature,
+            "gen_ai.agent.name": agent_name,
+        }
+    )
+
+
+def set_genai_response_attributes(
+    span: trace.Span, response: Any, usage: TokenUsage | None = None
+) -> None:
+    """
+    Set the GenAI semantic convention attributes of a provider response on a span:
+    response id and model, finish reasons and the token usage (as accounted with
+    TokenUsage.from_response). Supports Anthropic and OpenAI style responses.
+    """
+    if not span.is_recording():
+        return
+
+    finish_reasons = []
+    stop_reason = getattr(response, "stop_reason", None)
+    if stop_reason:
+        finish_reasons.append(stop_reason)
+    for choice in getattr(response, "choices", None) or []:
+        if getattr(choice, "finish_reason", None):
+            finish_reasons.append(choice.finish_reason)
+
+    span.set_attributes(
+        span_attributes(
+            {
+                "gen_ai.response.id": getattr(response, "id", None),
+                "gen_ai.response.model": getattr(response, "model", None),
+                "gen_ai.response.finish_reasons": finish_reasons or None,
+                "gen_ai.usage.input_tokens": usage.input_tokens if usage else None,
+                "gen_ai.usage.output_tokens": usage.output_tokens if usage else None,
+            }
+        )
+    )
+
+
 class MCPRequestTrace:
     """Helper class for trace context propagation in MCP"""
 
@@ -120,6 +180,27 @@ class MCPRequestTrace:
         span = tracer.start_span(method, context=ctx, kind=SpanKind.SERVER)
         return span, set_span_in_context(span)
 
+    @staticmethod
+    @contextmanager
+    def server_span(method: str, meta: Dict[str, Any] | None) -> Iterator[trace.Span]:
+        """
+        Handle an incoming MCP request within a span that continues the caller's trace
+        (from the request's _meta), recording exceptions raised while handling it.
+        """
+        span, ctx = MCPRequestTrace.start_span_from_mcp_request(
+            method, {"_meta": meta or {}}
+        )
+        token = otel_context.attach(ctx)
+        try:
+            yield span
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            raise
+        finally:
+            otel_context.detach(token)
+            span.end()
+
     @staticmethod
     def inject_trace_context(arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Inject current trace context into outgoing MCP request arguments"""
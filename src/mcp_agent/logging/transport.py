@@ -5,9 +5,16 @@ Transports for the Logger module for MCP Agent, including:
 """
 
 import asyncio
-import json
+import gzip
+import logging
+import os
+import random
+import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Protocol
+from collections import deque
+from typing import Callable, Deque, Dict, List, Literal, Protocol, Tuple
 from pathlib import Path
 
 import aiohttp
@@ -17,9 +24,15 @@ from rich.json import JSON
 from rich.text import Text
 
 from mcp_agent.config import LoggerSettings
-from mcp_agent.logging.events import Event, EventFilter
+from mcp_agent.executor.storage import atomic_write_bytes
+from mcp_agent.logging.events import Event, EventFilter, RateLimitFilter
 from mcp_agent.logging.json_serializer import JSONSerializer
-from mcp_agent.logging.listeners import EventListener, LifecycleAwareListener
+from mcp_agent.telemetry.metrics import metrics
+from mcp_agent.logging.listeners import (
+    EventListener,
+    FilteredListener,
+    LifecycleAwareListener,
+)
 
 
 class EventTransport(Protocol):
@@ -49,10 +62,22 @@ class FilteredEventTransport(EventTransport, ABC):
         if not self.filter or self.filter.matches(event):
             await self.send_matched_event(event)
 
+    async def send_events(self, events: List[Event]):
+        """Send a batch of events to the external system."""
+        if self.filter:
+            events = [event for event in events if self.filter.matches(event)]
+        if events:
+            await self.send_matched_events(events)
+
     @abstractmethod
     async def send_matched_event(self, event: Event):
         """Send an event to the external system."""
 
+    async def send_matched_events(self, events: List[Event]):
+        """Send a batch of events to the external system."""
+        for event in events:
+            await self.send_matched_event(event)
+
 
 class NoOpTransport(FilteredEventTransport):
     """Default transport that does nothing (purely local)."""
@@ -65,7 +90,11 @@ class NoOpTransport(FilteredEventTransport):
 class ConsoleTransport(FilteredEventTransport):
     """Simple transport that prints events to console."""
 
-    def __init__(self, event_filter: EventFilter | None = None):
+    def __init__(
+        self,
+        event_filter: EventFilter | None = None,
+        serializer: JSONSerializer | None = None,
+    ):
         super().__init__(event_filter=event_filter)
         self.console = Console()
         self.log_level_styles: Dict[str, str] = {
@@ -74,7 +103,7 @@ class ConsoleTransport(FilteredEventTransport):
             "warning": "bold yellow",
             "error": "bold red",
         }
-        self._serializer = JSONSerializer()
+        self._serializer = serializer or JSONSerializer()
 
     async def send_matched_event(self, event: Event):
         # Map log levels to styles
@@ -100,7 +129,16 @@ class ConsoleTransport(FilteredEventTransport):
 
 
 class FileTransport(FilteredEventTransport):
-    """Transport that writes events to a file with proper formatting."""
+    """
+    Transport that writes events to a file as newline-delimited JSON.
+
+    Events are handed to a background writer thread, which formats them and writes them
+    to a persistent buffered file handle, flushing (and optionally fsyncing) it every
+    `flush_interval` seconds, so file I/O never blocks the event loop.
+    The file is rotated once it exceeds `max_bytes` or is older than `rotate_interval`
+    seconds: the current file becomes `<path>.1` (`<path>.1.gz` if compressed), older
+    backups shift up by one, and backups beyond `backup_count` are deleted.
+    """
 
     def __init__(
         self,
@@ -108,6 +146,13 @@ class FileTransport(FilteredEventTransport):
         event_filter: EventFilter | None = None,
         mode: str = "a",
         encoding: str = "utf-8",
+        flush_interval: float = 2.0,
+        fsync: bool = False,
+        max_bytes: int | None = None,
+        rotate_interval: float | None = None,
+        backup_count: int = 5,
+        compress: bool = False,
+        serializer: JSONSerializer | None = None,
     ):
         """Initialize FileTransport.
 
@@ -116,22 +161,68 @@ class FileTransport(FilteredEventTransport):
             event_filter: Optional filter for events
             mode: File open mode ('a' for append, 'w' for write)
             encoding: File encoding to use
+            flush_interval: Seconds between flushes of the buffered file handle
+            fsync: Whether to fsync the file after each flush
+            max_bytes: Rotate the file once it exceeds this size
+            rotate_interval: Rotate the file once it is older than this many seconds
+            backup_count: Number of rotated files to keep
+            compress: Whether to gzip rotated files
+            serializer: Serializer for event data, with its size limits
         """
         super().__init__(event_filter=event_filter)
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
-        self._serializer = JSONSerializer()
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._serializer = serializer or JSONSerializer()
+
+        self._pending: List[Event] = []
+        self._condition = threading.Condition()
+        self._closing = False
+        self._thread: threading.Thread | None = None
+        self._file = None
+        self._opened_at = 0.0
+        self._size = 0
 
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    async def start(self):
+        """Start the writer thread."""
+        self._ensure_writer()
+
+    async def stop(self):
+        """Write out all pending events, then stop the writer thread and close the file."""
+        await self.close()
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._closing = False
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-agent-file-transport", daemon=True
+            )
+            self._thread.start()
+
     async def send_matched_event(self, event: Event) -> None:
-        """Write matched event to log file asynchronously.
+        """Queue a matched event for the writer thread.
 
         Args:
             event: Event to write to file
         """
+        await self.send_matched_events([event])
+
+    async def send_matched_events(self, events: List[Event]) -> None:
+        self._ensure_writer()
+        with self._condition:
+            self._pending.extend(events)
+            self._condition.notify()
+
+    def _format(self, event: Event) -> str:
         # Format the log entry
         namespace = event.namespace
         if event.name:
@@ -146,31 +237,148 @@ class FileTransport(FilteredEventTransport):
 
         # Add event data if present
         if event.data:
-            log_entry["data"] = self._serializer(event.data)
+            log_entry["data"] = event.data
 
-        try:
-            with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-                # Write the log entry as JSON with newline
-                f.write(json.dumps(log_entry, indent=2) + "\n")
-                f.flush()  # Ensure writing to disk
-        except IOError as e:
-            # Log error without recursion
-            print(f"Error writing to log file {self.filepath}: {e}")
+        return self._serializer.dumps(log_entry)
+
+    def _run(self):
+        """Writer thread: write pending events, flushing and rotating as configured."""
+        last_flush = time.monotonic()
+        while True:
+            with self._condition:
+                if not self._pending and not self._closing:
+                    self._condition.wait(self.flush_interval)
+                events, self._pending = self._pending, []
+                closing = self._closing
+
+            try:
+                if events:
+                    self._write(events)
+                if self._file and (
+                    closing or time.monotonic() - last_flush >= self.flush_interval
+                ):
+                    self._flush()
+                    last_flush = time.monotonic()
+            except Exception as e:
+                # Log error without recursion
+                print(f"Error writing to log file {self.filepath}: {e}")
+
+            if closing:
+                with self._condition:
+                    if self._pending:
+                        continue
+                self._close_file()
+                return
+
+    def _open(self):
+        mode = self.mode
+        # Truncate once on the first open only, append after rotations
+        self.mode = "a"
+        self._file = open(
+            self.filepath, mode=mode, encoding=self.encoding, buffering=1 << 16
+        )
+        self._opened_at = time.time()
+        self._size = self._file.tell()
+
+    def _write(self, events: List[Event]):
+        if self._file is None:
+            self._open()
+
+        for event in events:
+            try:
+                line = self._format(event) + "\n"
+            except Exception as e:
+                print(f"Error formatting log event: {e}")
+                continue
+
+            self._file.write(line)
+            # Track the size in characters, which is exact for ASCII output and
+            # avoids encoding every line again just to measure it
+            self._size += len(line)
+            if self._should_rotate():
+                self._rotate()
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        if (
+            self.rotate_interval
+            and time.time() - self._opened_at >= self.rotate_interval
+        ):
+            return True
+        return False
+
+    def _flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _close_file(self):
+        if self._file:
+            try:
+                self._flush()
+                self._file.close()
+            except Exception as e:
+                print(f"Error closing log file {self.filepath}: {e}")
+            self._file = None
+
+    def _backup_path(self, index: int) -> Path:
+        suffix = f".{index}.gz" if self.compress else f".{index}"
+        return self.filepath.with_name(self.filepath.name + suffix)
+
+    def _rotate(self):
+        self._close_file()
+
+        if self.backup_count > 0:
+            self._backup_path(self.backup_count).unlink(missing_ok=True)
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_path(index)
+                if source.exists():
+                    os.replace(source, self._backup_path(index + 1))
+
+            if self.compress:
+                with (
+                    open(self.filepath, "rb") as source,
+                    gzip.open(self._backup_path(1), "wb") as target,
+                ):
+                    shutil.copyfileobj(source, target)
+                self.filepath.unlink()
+            else:
+                os.replace(self.filepath, self._backup_path(1))
+        else:
+            self.filepath.unlink(missing_ok=True)
+
+        self._open()
 
     async def close(self) -> None:
-        """Clean up resources if needed."""
-        pass  # File handles are automatically closed after each write
+        """Write out all pending events and close the file."""
+        thread = self._thread
+        if thread is None:
+            return
+
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        await asyncio.to_thread(thread.join)
+        self._thread = None
 
     @property
     def is_closed(self) -> bool:
         """Check if transport is closed."""
-        return False  # Since we open/close per write
+        return self._file is None
 
 
 class HTTPTransport(FilteredEventTransport):
     """
     Sends events to an HTTP endpoint in batches.
     Useful for sending to remote logging services like Elasticsearch, etc.
+
+    Events are sent by a background task once `batch_size` events are buffered, or every
+    `flush_interval` seconds. Producers only append to the current buffer, which the
+    flusher swaps for an empty one before sending, so they never wait on the network.
+    Batches are sent as JSON (gzip-compressed if `compress`), and failed sends are retried
+    with exponential backoff. Batches that still fail are spilled to files in `spill_path`
+    (if set), and resent after the next successful send.
     """
 
     def __init__(
@@ -180,100 +388,407 @@ class HTTPTransport(FilteredEventTransport):
         batch_size: int = 100,
         timeout: float = 5.0,
         event_filter: EventFilter | None = None,
+        flush_interval: float = 2.0,
+        compress: bool = True,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        spill_path: str | Path | None = None,
+        serializer: JSONSerializer | None = None,
     ):
         super().__init__(event_filter=event_filter)
         self.endpoint = endpoint
         self.headers = headers or {}
         self.batch_size = batch_size
         self.timeout = timeout
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.spill_path = Path(spill_path) if spill_path else None
 
         self.batch: List[Event] = []
-        self.lock = asyncio.Lock()
         self._session: aiohttp.ClientSession | None = None
-        self._serializer = JSONSerializer()
+        self._serializer = serializer or JSONSerializer()
+        self._send_lock = asyncio.Lock()
+        self._flush_requested: asyncio.Event | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._stopping = False
 
-    async def start(self):
-        """Initialize HTTP session."""
+    def _ensure_session(self):
         if not self._session:
             self._session = aiohttp.ClientSession(
                 headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
             )
 
+    async def start(self):
+        """Initialize HTTP session and start the background flusher."""
+        self._ensure_session()
+        if self._flush_task is None or self._flush_task.done():
+            self._stopping = False
+            self._flush_requested = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._run_flusher())
+
     async def stop(self):
-        """Close HTTP session and flush any remaining events."""
-        if self.batch:
-            await self._flush()
+        """Stop the flusher, send any remaining events and close the HTTP session."""
+        if self._flush_task:
+            # Let the flusher finish the batch it may be sending (rather than cancel
+            # it mid-send, which would lose the batch), then exit
+            self._stopping = True
+            self._flush_requested.set()
+            await self._flush_task
+            self._flush_task = None
+
+        await self._flush()
         if self._session:
             await self._session.close()
             self._session = None
 
     async def send_matched_event(self, event: Event):
         """Add event to batch, flush if batch is full."""
-        async with self.lock:
-            self.batch.append(event)
-            if len(self.batch) >= self.batch_size:
+        await self.send_matched_events([event])
+
+    async def send_matched_events(self, events: List[Event]):
+        if self._flush_task is None:
+            await self.start()
+
+        self.batch.extend(events)
+        if len(self.batch) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def _run_flusher(self):
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._stopping:
+                # stop() sends the remaining events
+                return
+
+            try:
                 await self._flush()
+            except Exception as e:
+                print(f"Error sending log events to {self.endpoint}: {e}")
 
     async def _flush(self):
-        """Send batch of events to HTTP endpoint."""
-        if not self.batch:
-            return
+        """Send the buffered events (and previously spilled batches) to the endpoint."""
+        async with self._send_lock:
+            # Swap buffers, so that events emitted while sending go into a new batch
+            batch, self.batch = self.batch, []
+            if batch:
+                try:
+                    payload = await asyncio.to_thread(self._encode, batch)
+                    sent = await self._send(payload)
+                except asyncio.CancelledError:
+                    # Put the batch back, so it's sent by the next flush
+                    self.batch[:0] = batch
+                    raise
+                if not sent:
+                    await asyncio.to_thread(self._spill, payload, len(batch))
+                    return
+
+            if self.spill_path:
+                await self._resend_spilled()
+
+    def _encode(self, events: List[Event]) -> bytes:
+        # Convert events to JSON-serializable dicts
+        events_data = [
+            {
+                "timestamp": event.timestamp.isoformat(),
+                "type": event.type,
+                "name": event.name,
+                "namespace": event.namespace,
+                "message": event.message,
+                "data": event.data,
+                "trace_id": event.trace_id,
+                "span_id": event.span_id,
+                "context": event.context,
+            }
+            for event in events
+        ]
+        data = self._serializer.dumps_bytes(events_data)
+        return gzip.compress(data, compresslevel=6) if self.compress else data
+
+    async def _send(self, payload: bytes) -> bool:
+        """
+        Send an encoded batch, retrying failures with exponential backoff.
+        Returns False if the batch should be retried later. Batches the endpoint
+        rejects as invalid (4xx other than 429) are dropped, since resending can't help.
+        """
+        # Only the session: the flusher is started (and stopped) by start/stop
+        self._ensure_session()
 
-        if not self._session:
-            await self.start()
+        headers = {"Content-Type": "application/json"}
+        if self.compress:
+            headers["Content-Encoding"] = "gzip"
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                # Exponential backoff with jitter
+                delay = self.retry_backoff * 2 ** (attempt - 1)
+                await asyncio.sleep(delay * (0.5 + random.random()))
+
+            try:
+                async with self._session.post(
+                    self.endpoint, data=payload, headers=headers
+                ) as response:
+                    if response.status < 400:
+                        return True
 
-        try:
-            # Convert events to JSON-serializable dicts
-            events_data = [
-                {
-                    "timestamp": event.timestamp.isoformat(),
-                    "type": event.type,
-                    "name": event.name,
-                    "namespace": event.namespace,
-                    "message": event.message,
-                    "data": self._serializer(event.data),
-                    "trace_id": event.trace_id,
-                    "span_id": event.span_id,
-                    "context": event.context.dict() if event.context else None,
-                }
-                for event in self.batch
-            ]
-
-            async with self._session.post(self.endpoint, json=events_data) as response:
-                if response.status >= 400:
                     text = await response.text()
                     print(
                         f"Error sending log events to {self.endpoint}. "
                         f"Status: {response.status}, Response: {text}"
                     )
-        except Exception as e:
-            print(f"Error sending log events to {self.endpoint}: {e}")
-        finally:
-            self.batch.clear()
+                    if response.status < 500 and response.status != 429:
+                        return True
+            except Exception as e:
+                print(f"Error sending log events to {self.endpoint}: {e}")
+
+        return False
+
+    def _spill(self, payload: bytes, count: int):
+        if not self.spill_path:
+            print(
+                f"Dropping {count} log events that couldn't be sent to {self.endpoint}"
+            )
+            return
+
+        self.spill_path.mkdir(parents=True, exist_ok=True)
+        suffix = ".json.gz" if self.compress else ".json"
+        atomic_write_bytes(self.spill_path / f"{time.time_ns()}{suffix}", payload)
+
+    async def _resend_spilled(self):
+        suffix = ".json.gz" if self.compress else ".json"
+        paths = await asyncio.to_thread(
+            lambda: sorted(self.spill_path.glob(f"*{suffix}"))
+        )
+        for path in paths:
+            payload = await asyncio.to_thread(path.read_bytes)
+            if not await self._send(payload):
+                # Still failing, keep the rest for later
+                return
+            await asyncio.to_thread(path.unlink, True)
+
+
+OverflowPolicy = Literal["drop_oldest", "drop_debug_first", "block"]
+"""What an EventQueue does with new events when it is full."""
+
+
+class EventQueue:
+    """
+    Bounded FIFO queue of events, consumed by a single AsyncEventBus task.
+    Debug events and other events are kept in separate ring buffers, merged back into
+    emission order by sequence number, so that every overflow policy runs in constant time:
+        - drop_oldest: drop the oldest queued event
+        - drop_debug_first: drop the oldest queued debug event, or the oldest event
+          if no debug events are queued (new debug events are dropped instead of
+          displacing more important events)
+        - block: refuse the event, so that producers wait for room (see `put`);
+          producers that can't wait push out the oldest event instead (see `push`)
+    Dropped events are counted in `dropped` and `dropped_by_type`.
+
+    put_nowait is synchronous and thread-safe, so emitting an event allocates no task.
+    A maxsize of 0 or less makes the queue unbounded. Closing the queue makes its
+    consumer stop once it has drained the queue, without polling for a stop flag.
+    """
+
+    def __init__(
+        self, maxsize: int = 2048, overflow_policy: OverflowPolicy = "drop_oldest"
+    ):
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self.dropped_by_type: Dict[str, int] = {}
+
+        self._debug: Deque[Tuple[int, Event]] = deque()
+        self._other: Deque[Tuple[int, Event]] = deque()
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._getter: asyncio.Future | None = None
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        return len(self._debug) + len(self._other)
+
+    def empty(self) -> bool:
+        return not self._debug and not self._other
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self)
+
+    def put_nowait(self, event: Event) -> bool:
+        """
+        Queue an event, applying the overflow policy if the queue is full.
+        Returns False if the queue is full and the policy is "block".
+        """
+        with self._lock:
+            if self.full():
+                if self.overflow_policy == "block":
+                    return False
+                if not self._make_room(event):
+                    self._count_dropped(event)
+                    return True
+
+            self._sequence += 1
+            buffer = self._debug if event.type == "debug" else self._other
+            buffer.append((self._sequence, event))
+
+        self._wake(self._getter)
+        return True
+
+    def push(self, event: Event):
+        """Queue an event, dropping the oldest queued event if the queue is full."""
+        with self._lock:
+            if self.full():
+                self._count_dropped(self._pop_oldest())
+
+            self._sequence += 1
+            buffer = self._debug if event.type == "debug" else self._other
+            buffer.append((self._sequence, event))
+
+        self._wake(self._getter)
+
+    async def put(self, event: Event):
+        """Queue an event, waiting for room if the queue is full."""
+        while not self.put_nowait(event):
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            finally:
+                if putter in self._putters:
+                    self._putters.remove(putter)
+
+    def get_nowait(self) -> Event:
+        """Remove and return the oldest event. Raises asyncio.QueueEmpty if empty."""
+        with self._lock:
+            if self.empty():
+                raise asyncio.QueueEmpty
+            event = self._pop_oldest()
+
+        if self._putters:
+            self._wake(self._putters.popleft())
+        return event
+
+    async def get(self) -> Event | None:
+        """
+        Remove and return the oldest event, waiting for one if the queue is empty.
+        Returns None (the stop sentinel) once the queue is closed and drained.
+        """
+        while True:
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                if self._closed:
+                    return None
+
+            self._getter = asyncio.get_running_loop().create_future()
+            try:
+                # Re-check, in case another thread queued an event before the
+                # getter was visible to it
+                if self.empty() and not self._closed:
+                    await self._getter
+            finally:
+                self._getter = None
+
+    def close(self):
+        """Make `get` return the stop sentinel once the queued events are consumed."""
+        self._closed = True
+        self._wake(self._getter)
+
+    def reopen(self):
+        self._closed = False
+
+    def drop(self, event: Event):
+        """Count an event that couldn't be queued as dropped."""
+        with self._lock:
+            self._count_dropped(event)
+
+    def _make_room(self, event: Event) -> bool:
+        """Drop a queued event per the overflow policy, or return False to drop `event`."""
+        if self.overflow_policy == "drop_debug_first":
+            if self._debug:
+                dropped = self._debug.popleft()[1]
+            elif event.type == "debug":
+                return False
+            else:
+                dropped = self._other.popleft()[1]
+        else:
+            dropped = self._pop_oldest()
+
+        self._count_dropped(dropped)
+        return True
+
+    def _pop_oldest(self) -> Event:
+        if not self._other or (self._debug and self._debug[0][0] < self._other[0][0]):
+            return self._debug.popleft()[1]
+        return self._other.popleft()[1]
+
+    def _count_dropped(self, event: Event):
+        self.dropped += 1
+        self.dropped_by_type[event.type] = self.dropped_by_type.get(event.type, 0) + 1
+        _events_dropped.add(1, type=event.type)
+
+    @staticmethod
+    def _wake(waiter: asyncio.Future | None):
+        if waiter is None or waiter.done():
+            return
+
+        loop = waiter.get_loop()
+        try:
+            same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            same_loop = False
+
+        if same_loop:
+            waiter.set_result(None)
+        else:
+            # Woken from another thread
+            loop.call_soon_threadsafe(EventQueue._set_done, waiter)
+
+    @staticmethod
+    def _set_done(waiter: asyncio.Future):
+        if not waiter.done():
+            waiter.set_result(None)
+
+
+def _min_level_for(event_filter: EventFilter | None, namespace: str) -> int | None:
+    if event_filter is None:
+        return logging.DEBUG
+    return event_filter.min_level_for(namespace)
 
 
 class AsyncEventBus:
     """
     Async event bus with local in-process listeners + optional remote transport.
     Also injects distributed tracing (trace_id, span_id) if there's a current span.
+    Events are buffered in a bounded EventQueue and forwarded to the transport and
+    listeners in batches (of up to `max_batch_size` events) by a single background task.
     """
 
     _instance = None
 
-    def __init__(self, transport: EventTransport | None = None):
-        self.transport: EventTransport = transport or NoOpTransport()
+    def __init__(
+        self,
+        transport: EventTransport | None = None,
+        max_queue_size: int = 2048,
+        overflow_policy: OverflowPolicy = "drop_oldest",
+    ):
+        self._transport: EventTransport = transport or NoOpTransport()
         self.listeners: Dict[str, EventListener] = {}
-        self._queue = asyncio.Queue()
+        self._sinks_changed_callbacks: List[Callable[[], None]] = []
+        self._queue = EventQueue(max_queue_size, overflow_policy)
+        self.max_batch_size = 100
+        # Sampling/rate limiting applied once per event, before it is queued
+        self.rate_limit_filter: RateLimitFilter | None = None
         self._task: asyncio.Task | None = None
         self._running = False
-        self._stop_event = asyncio.Event()
-
-        # Store the loop we're created on
-        try:
-            self._loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     @classmethod
     def get(cls, transport: EventTransport | None = None) -> "AsyncEventBus":
@@ -285,18 +800,77 @@ class AsyncEventBus:
             cls._instance.transport = transport
         return cls._instance
 
+    @property
+    def transport(self) -> EventTransport:
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: EventTransport):
+        self._transport = transport
+        self.notify_sinks_changed()
+
+    def min_level_for(self, namespace: str) -> int | None:
+        """
+        Return the lowest severity (as a Python logging level) of events from the
+        namespace that the transport or any listener may accept, or None if none can.
+        Until a transport or listener is set up, events of all levels are accepted
+        (and queued for when they are).
+        """
+        levels = []
+        if not isinstance(self._transport, NoOpTransport):
+            levels.append(
+                _min_level_for(getattr(self._transport, "filter", None), namespace)
+            )
+        for listener in self.listeners.values():
+            event_filter = (
+                listener.filter if isinstance(listener, FilteredListener) else None
+            )
+            levels.append(_min_level_for(event_filter, namespace))
+
+        if not levels:
+            return logging.DEBUG
+        levels = [level for level in levels if level is not None]
+        return min(levels) if levels else None
+
+    def add_sinks_changed_callback(self, callback: Callable[[], None]):
+        """Call `callback` whenever the transport or listeners change."""
+        self._sinks_changed_callbacks.append(callback)
+
+    def notify_sinks_changed(self):
+        """
+        Let loggers recompute their levels.
+        Call this after changing the filter of the transport or a listener in place.
+        """
+        for callback in self._sinks_changed_callbacks:
+            callback()
+
+    @property
+    def queue(self) -> EventQueue:
+        """The queue of events waiting to be processed, with its drop counters."""
+        return self._queue
+
+    def configure_queue(
+        self, max_queue_size: int, overflow_policy: OverflowPolicy = "drop_oldest"
+    ):
+        """Set the queue's capacity and overflow policy."""
+        self._queue.maxsize = max_queue_size
+        self._queue.overflow_policy = overflow_policy
+
     async def start(self):
         """Start the event bus and all lifecycle-aware listeners."""
         if self._running:
             return
 
-        # Start each lifecycle-aware listener
+        # Start the transport (if it has a lifecycle) and each lifecycle-aware listener
+        transport_start = getattr(self._transport, "start", None)
+        if transport_start is not None:
+            await transport_start()
         for listener in self.listeners.values():
             if isinstance(listener, LifecycleAwareListener):
                 await listener.start()
 
-        # Clear stop event and start processing
-        self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self._queue.reopen()
         self._running = True
         self._task = asyncio.create_task(self._process_events())
 
@@ -305,38 +879,36 @@ class AsyncEventBus:
         if not self._running:
             return
 
-        # Signal processing to stop
+        # Signal processing to stop once the queued events are processed
         self._running = False
-        self._stop_event.set()
+        self._queue.close()
 
-        # Try to process remaining items with a timeout
-        if not self._queue.empty():
-            try:
-                # Give some time for remaining items to be processed
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # If we timeout, drain the queue to prevent deadlock
-                while not self._queue.empty():
-                    try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-            except Exception as e:
-                print(f"Error during queue cleanup: {e}")
-
-        # Cancel and wait for task with timeout
+        # Give the processing task some time to process the remaining events
         if self._task and not self._task.done():
-            self._task.cancel()
             try:
-                # Wait for task to complete with timeout
                 await asyncio.wait_for(self._task, timeout=5.0)
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass  # Task was cancelled or timed out
             except Exception as e:
-                print(f"Error cancelling process task: {e}")
-            finally:
-                self._task = None
+                print(f"Error stopping event processing: {e}")
+        self._task = None
+        self._loop = None
+
+        if self._queue.dropped:
+            print(
+                f"Event queue overflowed, dropped {self._queue.dropped} events: "
+                f"{self._queue.dropped_by_type}"
+            )
+
+        # Stop the transport, which flushes any events it has buffered
+        transport_stop = getattr(self._transport, "stop", None)
+        if transport_stop is not None:
+            try:
+                await asyncio.wait_for(transport_stop(), timeout=5.0)
+            except asyncio.TimeoutError:
+                print(f"Timeout stopping transport: {self._transport}")
+            except Exception as e:
+                print(f"Error stopping transport: {e}")
 
         # Stop each lifecycle-aware listener
         for listener in self.listeners.values():
@@ -348,8 +920,7 @@ class AsyncEventBus:
                 except Exception as e:
                     print(f"Error stopping listener: {e}")
 
-    async def emit(self, event: Event):
-        """Emit an event to all listeners and transport."""
+    def _inject_trace(self, event: Event):
         # Inject current tracing info if available
         span = trace.get_current_span()
         if span.is_recording():
@@ -357,86 +928,162 @@ class AsyncEventBus:
             event.trace_id = f"{ctx.trace_id:032x}"
             event.span_id = f"{ctx.span_id:016x}"
 
-        # Forward to transport first (immediate processing)
+    async def emit(self, event: Event):
+        """Emit an event to all listeners and transport, waiting for room if needed."""
+        if self.rate_limit_filter and not self.rate_limit_filter.matches(event):
+            return
+        self._inject_trace(event)
+        if self._running:
+            await self._queue.put(event)
+        elif not self._queue.put_nowait(event):
+            # Nothing will make room until the bus is started
+            self._queue.drop(event)
+
+    def emit_nowait(self, event: Event):
+        """
+        Emit an event from synchronous code.
+        With the "block" overflow policy, a full queue blocks callers in other threads
+        until there is room. Callers on the bus's own event loop can't block without
+        stalling the bus (nor queue a task per event without unbounded memory), so for
+        them a full queue drops its oldest event, as with the "drop_oldest" policy.
+        """
+        if self.rate_limit_filter and not self.rate_limit_filter.matches(event):
+            return
+        self._inject_trace(event)
+        if self._queue.put_nowait(event):
+            return
+
+        loop = self._loop
+        if not self._running or loop is None or loop.is_closed():
+            self._queue.drop(event)
+            return
+
         try:
-            await self.transport.send_event(event)
-        except Exception as e:
-            print(f"Error in transport.send_event: {e}")
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
 
-        # Then queue for listeners
-        await self._queue.put(event)
+        if running_loop is loop:
+            self._queue.push(event)
+        else:
+            asyncio.run_coroutine_threadsafe(self._queue.put(event), loop).result()
 
     def add_listener(self, name: str, listener: EventListener):
         """Add a listener to the event bus."""
         self.listeners[name] = listener
+        self.notify_sinks_changed()
 
     def remove_listener(self, name: str):
         """Remove a listener from the event bus."""
         self.listeners.pop(name, None)
+        self.notify_sinks_changed()
 
-    async def _process_events(self):
-        """Process events from the queue until stopped."""
-        while self._running:
+    async def _dispatch(self, events: List[Event]):
+        """Forward a batch of events to the transport and the listeners."""
+        transport = self.transport
+        try:
+            send_events = getattr(transport, "send_events", None)
+            if send_events is not None:
+                await send_events(events)
+            else:
+                for event in events:
+                    await transport.send_event(event)
+        except Exception as e:
+            print(f"Error in transport.send_event: {e}")
+
+        # Filter for each listener up front, so that listeners
+        # with nothing to handle don't cost a coroutine
+        tasks = []
+        for listener in self.listeners.values():
             try:
-                # Use wait_for with a timeout to allow checking running state
-                try:
-                    event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    continue
+                if isinstance(listener, FilteredListener):
+                    matched = listener.filter_events(events)
+                    if matched:
+                        tasks.append(listener.handle_matched_events(matched))
+                else:
+                    tasks.append(listener.handle_events(events))
+            except Exception as e:
+                print(f"Error creating listener task: {e}")
 
-                # Process the event through all listeners
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception as e:
-                        print(f"Error creating listener task: {e}")
+        if len(tasks) == 1:
+            try:
+                await tasks[0]
+            except Exception as e:
+                print(f"Error in listener: {e}")
+        elif tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for r in results:
+                if isinstance(r, Exception):
+                    print(f"Error in listener: {r}")
 
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for r in results:
-                        if isinstance(r, Exception):
-                            print(f"Error in listener: {r}")
+    async def _process_events(self):
+        """Process events from the queue in batches until the queue is closed."""
+        queue = self._queue
+        while True:
+            event = await queue.get()
+            if event is None:
+                # Stop sentinel: the queue is closed and drained
+                break
 
-                self._queue.task_done()
+            # Take whatever else is already queued along with it
+            batch = [event]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
-            except asyncio.CancelledError:
-                break
+            try:
+                await self._dispatch(batch)
             except Exception as e:
                 print(f"Error in event processing loop: {e}")
-                continue
+            _events_processed.add(len(batch))
 
-        # Process remaining events in queue
-        while not self._queue.empty():
-            try:
-                event = self._queue.get_nowait()
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception:
-                        pass
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                self._queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+
+def _queue_depth() -> int:
+    bus = AsyncEventBus._instance
+    return len(bus.queue) if bus is not None else 0
+
+
+_events_processed = metrics.counter(
+    "mcp_agent.logger.events", "Log events dispatched to the transport and listeners"
+)
+_events_dropped = metrics.counter(
+    "mcp_agent.logger.events_dropped", "Log events dropped because the queue was full"
+)
+metrics.gauge(
+    "mcp_agent.logger.queue_depth",
+    "Log events waiting in the event bus queue",
+    callback=_queue_depth,
+)
 
 
 def create_transport(
     settings: LoggerSettings, event_filter: EventFilter | None = None
 ) -> EventTransport:
     """Create event transport based on settings."""
+    serializer = JSONSerializer(
+        max_depth=settings.serializer_max_depth,
+        max_string_length=settings.serializer_max_string_length,
+        max_items=settings.serializer_max_items,
+    )
     if settings.type == "none":
         return NoOpTransport(event_filter=event_filter)
     elif settings.type == "console":
-        return ConsoleTransport(event_filter=event_filter)
+        return ConsoleTransport(event_filter=event_filter, serializer=serializer)
     elif settings.type == "file":
         if not settings.path:
             raise ValueError("File path required for file transport")
         return FileTransport(
             filepath=settings.path,
             event_filter=event_filter,
+            flush_interval=settings.flush_interval,
+            fsync=settings.file_fsync,
+            max_bytes=settings.file_max_bytes,
+            rotate_interval=settings.file_rotate_interval,
+            backup_count=settings.file_backup_count,
+            compress=settings.file_compress,
+            serializer=serializer,
         )
     elif settings.type == "http":
         if not settings.http_endpoint:
@@ -447,6 +1094,12 @@ def create_transport(
             batch_size=settings.batch_size,
             timeout=settings.http_timeout,
             event_filter=event_filter,
+            flush_interval=settings.flush_interval,
+            compress=settings.http_compress,
+            max_retries=settings.http_max_retries,
+            retry_backoff=settings.http_retry_backoff,
+            spill_path=settings.http_spill_path,
+            serializer=serializer,
         )
     else:
         raise ValueError(f"Unsupported transport type: {settings.type}")
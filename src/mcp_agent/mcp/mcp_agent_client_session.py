@@ -3,6 +3,10 @@ A derived client session for the MCP Agent framework.
 It adds logging and supports sampling requests.
 """
 
+from opentelemetry import trace
+from opentelemetry.propagate import inject
+from opentelemetry.trace import SpanKind
+
 from mcp import ClientSession
 from mcp.shared.session import (
     RequestResponder,
@@ -20,6 +24,7 @@ from mcp.types import (
     ErrorData,
     JSONRPCNotification,
     JSONRPCRequest,
+    RequestParams,
     ServerRequest,
     TextContent,
 )
@@ -29,6 +34,8 @@ from mcp_agent.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+tracer = trace.get_tracer(__name__)
+
 
 class MCPAgentClientSession(ClientSession, ContextDependent):
     """
@@ -79,13 +86,35 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         result_type: type[ReceiveResultT],
     ) -> ReceiveResultT:
         logger.debug("send_request: request=", data=request.model_dump())
-        try:
-            result = await super().send_request(request, result_type)
-            logger.debug("send_request: response=", data=result.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"send_request failed: {e}")
-            raise
+        method = request.root.method
+        params = getattr(request.root, "params", None)
+        target = getattr(params, "name", None) or getattr(params, "uri", None)
+        with tracer.start_as_current_span(
+            f"{method} {target}" if target else method,
+            kind=SpanKind.CLIENT,
+            attributes={"mcp.method.name": method},
+        ):
+            if params is not None:
+                # Propagate the trace context to the server through the request's _meta
+                self._inject_trace_context(params)
+            try:
+                result = await super().send_request(request, result_type)
+                logger.debug("send_request: response=", data=result.model_dump())
+                return result
+            except Exception as e:
+                logger.error(f"send_request failed: {e}")
+                raise
+
+    @staticmethod
+    def _inject_trace_context(params: RequestParams) -> None:
+        carrier = {}
+        inject(carrier)
+        if not carrier:
+            return
+        if params.meta is None:
+            params.meta = RequestParams.Meta()
+        for key, value in carrier.items():
+            setattr(params.meta, key, value)
 
     async def send_notification(self, notification: SendNotificationT) -> None:
         logger.debug("send_notification:", data=notification.model_dump())
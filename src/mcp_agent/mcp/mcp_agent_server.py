@@ -1,56 +1,249 @@
+"""
+MCP server that exposes the workflows of an MCPApp as asynchronous jobs.
+
+`run_workflow` starts a run in the background and returns its run id right away, so long
+agent runs never block the calling client's request. Clients then poll the run with
+`get_workflow_status`, or wait on it with `wait_for_workflow`, which streams progress
+notifications (through the MCP progress API) until the run finishes or the wait times out.
+
+With the asyncio engine, runs are managed by the app's WorkflowRunManager.
+With the Temporal engine, runs are started and signaled through the Temporal client.
+
+Example:
+    app = MCPApp(name="my_agents")
+
+    @app.workflow
+    class ResearchWorkflow(Workflow[str]):
+        ...
+
+    if __name__ == "__main__":
+        asyncio.run(run(app))
+"""
+
 import asyncio
+import inspect
+import time
+from typing import Any, Dict, List, Type
+
 from mcp.server import NotificationOptions
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.stdio import stdio_server
-from mcp_agent.executor.temporal import get_temporal_client
-from mcp_agent.telemetry.tracing import setup_tracing
+from pydantic_core import to_jsonable_python
+
+from mcp_agent.app import MCPApp
+from mcp_agent.executor.workflow import Workflow
+from mcp_agent.executor.workflow_manager import WorkflowRunStatus
+from mcp_agent.logging.tracing import MCPRequestTrace
 
-app = FastMCP("mcp-agent-server")
+# How often waiting clients get a progress notification
+PROGRESS_INTERVAL_SECONDS = 1.0
 
-setup_tracing("mcp-agent-server")
 
+def _to_json(status: WorkflowRunStatus) -> Dict[str, Any]:
+    # Workflow results can hold arbitrary values, fall back to their string form
+    return to_jsonable_python(status, fallback=str)
 
-async def run():
-    async with stdio_server() as (read_stream, write_stream):
-        await app._mcp_server.run(
-            read_stream,
-            write_stream,
-            app._mcp_server.create_initialization_options(
-                notification_options=NotificationOptions(
-                    tools_changed=True, resources_changed=True
-                )
-            ),
+
+async def _report_progress(ctx: Context, status: WorkflowRunStatus):
+    state = status.state
+    if state is not None and state.progress is not None:
+        await ctx.report_progress(state.progress, state.progress_total)
+    elif status.started_at is not None:
+        # No progress reported by the workflow, report time spent as a heartbeat
+        await ctx.report_progress(time.time() - status.started_at)
+
+
+def get_run_arguments(
+    workflow_cls: Type[Workflow], args: Dict[str, Any] | None
+) -> List[Any]:
+    """
+    Bind the `args` of a run_workflow call to the parameters of the workflow's run
+    method, returning them as positional arguments in parameter order. `args` are
+    keyword arguments of run with either engine (Temporal only passes positional
+    arguments to a workflow). Raises TypeError if they don't match run's signature.
+    """
+    signature = inspect.signature(workflow_cls.run)
+    bound = signature.bind(None, **(args or {}))
+    bound.apply_defaults()
+    if bound.kwargs:
+        raise TypeError(
+            f"{workflow_cls.__name__}.run has keyword-only arguments {list(bound.kwargs)}"
         )
+    return list(bound.args[1:])
+
+
+def _request_meta(ctx: Context) -> Dict[str, Any]:
+    meta = ctx.request_context.meta
+    return meta.model_dump(exclude_none=True) if meta is not None else {}
+
+
+def create_mcp_server_for_app(mcp_app: MCPApp) -> FastMCP:
+    """Create an MCP server whose tools run and control the workflows of the app."""
+    mcp = FastMCP(f"mcp-agent-server-{mcp_app.name}")
+
+    def is_temporal() -> bool:
+        return mcp_app.engine == "temporal"
+
+    async def get_temporal_handle(run_id: str):
+        executor = mcp_app.executor
+        await executor.ensure_client()
+        return executor.client.get_workflow_handle(run_id)
+
+    async def send_signal(run_id: str, signal_name: str, payload: Any = None):
+        # Temporal only: asyncio runs are controlled through the run manager
+        handle = await get_temporal_handle(run_id)
+        await handle.signal(signal_name, payload)
+
+    @mcp.tool()
+    async def list_workflows() -> List[str]:
+        """List the names of the workflows that can be run."""
+        return list(mcp_app.workflows.keys())
+
+    @mcp.tool()
+    async def list_workflow_runs(status: str | None = None) -> List[Dict[str, Any]]:
+        """
+        List workflow runs of this server, optionally filtered by status
+        (pending, running, completed, failed or cancelled).
+        """
+        return [_to_json(s) for s in mcp_app.run_manager.list_runs(status)]
+
+    @mcp.tool()
+    async def run_workflow(
+        workflow_name: str,
+        ctx: Context,
+        args: Dict[str, Any] | None = None,
+        run_id: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Start a workflow run in the background and return its run id immediately.
+        Use get_workflow_status or wait_for_workflow to follow the run.
+        """
+        if workflow_name not in mcp_app.workflows:
+            raise ValueError(f"Workflow {workflow_name} not found")
+
+        # The run continues the caller's trace (propagated in the request's _meta)
+        with MCPRequestTrace.server_span(
+            f"run_workflow {workflow_name}", _request_meta(ctx)
+        ):
+            return await start_run(workflow_name, args, run_id)
+
+    async def start_run(
+        workflow_name: str, args: Dict[str, Any] | None, run_id: str | None
+    ) -> Dict[str, Any]:
+        # Both engines call run with the same arguments: args as keyword arguments
+        workflow_cls = mcp_app.workflows[workflow_name]
+        run_args = get_run_arguments(workflow_cls, args)
+
+        if is_temporal():
+            executor = mcp_app.executor
+            await executor.ensure_client()
+            handle = await executor.client.start_workflow(
+                workflow_cls.run,
+                args=run_args,
+                id=run_id or f"{workflow_name}-{time.time_ns()}",
+                task_queue=executor.config.task_queue,
+            )
+            return {"run_id": handle.id, "status": "running"}
+
+        run_id = await mcp_app.start_workflow(workflow_name, *run_args, run_id=run_id)
+        return _to_json(mcp_app.run_manager.get_status(run_id))
+
+    @mcp.tool()
+    async def get_workflow_status(run_id: str) -> Dict[str, Any]:
+        """Get the status, state and (once finished) result of a workflow run."""
+        if is_temporal():
+            handle = await get_temporal_handle(run_id)
+            description = await handle.describe()
+            return {"run_id": run_id, "status": description.status.name.lower()}
+
+        return _to_json(mcp_app.run_manager.get_status(run_id))
+
+    @mcp.tool()
+    async def wait_for_workflow(
+        run_id: str, ctx: Context, timeout_seconds: float = 60
+    ) -> Dict[str, Any]:
+        """
+        Wait for a workflow run to finish, sending progress notifications meanwhile.
+        Returns the run's status when it finishes or the timeout passes,
+        whichever comes first; call again to keep waiting.
+        """
+        if is_temporal():
+            handle = await get_temporal_handle(run_id)
+            try:
+                result = await asyncio.wait_for(handle.result(), timeout_seconds)
+            except asyncio.TimeoutError:
+                return await get_workflow_status(run_id)
+            return {
+                "run_id": run_id,
+                "status": "completed",
+                "result": to_jsonable_python(result, fallback=str),
+            }
+
+        run_manager = mcp_app.run_manager
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            status = await run_manager.wait(
+                run_id,
+                timeout_seconds=max(0, min(PROGRESS_INTERVAL_SECONDS, remaining)),
+            )
+            if status.finished_at is not None or remaining <= 0:
+                return _to_json(status)
+            await _report_progress(ctx, status)
 
+    @mcp.tool()
+    async def cancel_workflow(run_id: str) -> bool:
+        """Cancel a workflow run. Returns False if it had already finished."""
+        if is_temporal():
+            handle = await get_temporal_handle(run_id)
+            await handle.cancel()
+            return True
 
-@app.tool
-async def run_workflow(query: str):
-    """Run the workflow given its name or id"""
-    pass
+        return await mcp_app.run_manager.cancel(run_id)
 
+    if is_temporal():
+        # Only Temporal workflows can handle pause/resume signals,
+        # asyncio runs can't be suspended from outside
+        @mcp.tool()
+        async def pause_workflow(run_id: str):
+            """Pause a running workflow."""
+            await send_signal(run_id, "pause")
 
-@app.tool
-async def pause_workflow(workflow_id: str):
-    """Pause a running workflow."""
-    temporal_client = await get_temporal_client()
-    handle = temporal_client.get_workflow_handle(workflow_id)
-    await handle.signal("pause")
+        @mcp.tool()
+        async def resume_workflow(run_id: str):
+            """Resume a paused workflow."""
+            await send_signal(run_id, "resume")
 
+    @mcp.tool()
+    async def provide_user_input(run_id: str, input_data: str):
+        """
+        Provide user/human input to a workflow run. If the run isn't waiting for input
+        yet, the input is kept for its next input step.
+        """
+        if is_temporal():
+            # Temporal buffers signals until the workflow handles them
+            await send_signal(run_id, "human_input", input_data)
+        else:
+            await mcp_app.run_manager.provide_input(run_id, input_data)
 
-@app.tool
-async def resume_workflow(workflow_id: str):
-    """Resume a paused workflow."""
-    temporal_client = await get_temporal_client()
-    handle = temporal_client.get_workflow_handle(workflow_id)
-    await handle.signal("resume")
+    return mcp
 
 
-async def provide_user_input(workflow_id: str, input_data: str):
-    """Provide user/human input to a waiting workflow step."""
-    temporal_client = await get_temporal_client()
-    handle = temporal_client.get_workflow_handle(workflow_id)
-    await handle.signal("human_input", input_data)
+async def run(mcp_app: MCPApp):
+    """Run the app and serve its workflows over stdio."""
+    async with mcp_app.run():
+        mcp = create_mcp_server_for_app(mcp_app)
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp._mcp_server.run(
+                read_stream,
+                write_stream,
+                mcp._mcp_server.create_initialization_options(
+                    notification_options=NotificationOptions(
+                        tools_changed=True, resources_changed=True
+                    )
+                ),
+            )
 
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    asyncio.run(run(MCPApp(name="mcp_agent_server")))
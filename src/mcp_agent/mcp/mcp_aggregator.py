@@ -1,6 +1,9 @@
+import time
 from asyncio import Lock, gather
 from typing import List, Dict, Optional, TYPE_CHECKING
 
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
 from pydantic import BaseModel, ConfigDict
 from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
@@ -17,6 +20,7 @@ from mcp_agent.mcp.gen_client import gen_client
 from mcp_agent.context_dependent import ContextDependent
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
 from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+from mcp_agent.telemetry.metrics import metrics
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -24,6 +28,11 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_tool_calls = metrics.counter("mcp_agent.tool.calls", "MCP tool calls")
+_tool_call_duration = metrics.histogram(
+    "mcp_agent.tool.call_duration", "Duration of MCP tool calls", unit="s"
+)
+
 SEP = "-"
 
 
@@ -224,6 +233,10 @@ class MCPAggregator(ContextDependent):
         """
         :return: Tools from all servers aggregated, and renamed to be dot-namespaced by server name.
         """
+        executor = self.context.executor
+        if executor and executor.in_workflow():
+            return await executor.execute_list_tools(self.server_names)
+
         if not self.initialized:
             await self.load_servers()
 
@@ -240,6 +253,11 @@ class MCPAggregator(ContextDependent):
         """
         Call a namespaced tool, e.g., 'server_name.tool_name'.
         """
+        executor = self.context.executor
+        if executor and executor.in_workflow():
+            # Durable executors run the call (including server discovery) as an activity
+            return await executor.execute_tool_call(self.server_names, name, arguments)
+
         if not self.initialized:
             await self.load_servers()
 
@@ -274,16 +292,45 @@ class MCPAggregator(ContextDependent):
                     message=f"Failed to call tool '{local_tool_name}' on server '{server_name}': {e}",
                 )
 
-        if self.connection_persistence:
-            server_connection = await self._persistent_connection_manager.get_server(
-                server_name, client_session_factory=MCPAgentClientSession
-            )
-            return await try_call_tool(server_connection.session)
-        else:
-            async with gen_client(
-                server_name, server_registry=self.context.server_registry
-            ) as client:
-                return await try_call_tool(client)
+        tracer = self.context.tracer or trace.get_tracer(__name__)
+        start = time.perf_counter()
+        status = "cancelled"
+        with tracer.start_as_current_span(
+            f"execute_tool {local_tool_name}",
+            attributes={
+                "gen_ai.operation.name": "execute_tool",
+                "gen_ai.tool.name": local_tool_name,
+                "mcp.server.name": server_name,
+            },
+        ) as span:
+            try:
+                if self.connection_persistence:
+                    server_connection = (
+                        await self._persistent_connection_manager.get_server(
+                            server_name, client_session_factory=MCPAgentClientSession
+                        )
+                    )
+                    result = await try_call_tool(server_connection.session)
+                else:
+                    async with gen_client(
+                        server_name, server_registry=self.context.server_registry
+                    ) as client:
+                        result = await try_call_tool(client)
+                status = "error" if result.isError else "ok"
+                if result.isError:
+                    span.set_status(Status(StatusCode.ERROR))
+                return result
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                labels = {
+                    "server": server_name,
+                    "tool": local_tool_name,
+                    "status": status,
+                }
+                _tool_calls.add(1, **labels)
+                _tool_call_duration.record(time.perf_counter() - start, **labels)
 
 
 class MCPCompoundServer(Server):
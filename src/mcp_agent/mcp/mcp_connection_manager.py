@@ -15,6 +15,8 @@ from anyio import Event, create_task_group, Lock
 from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
+from opentelemetry import trace
+
 from mcp import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.client.sse import sse_client
@@ -28,6 +30,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+tracer = trace.get_tracer(__name__)
+
 
 class ServerConnection:
     """
@@ -208,7 +212,10 @@ class MCPConnectionManager:
         )
 
         def transport_context_factory():
-            if config.transport == "stdio":
+            custom_transport = self.server_registry.transports.get(server_name)
+            if custom_transport is not None:
+                return custom_transport()
+            elif config.transport == "stdio":
                 server_params = StdioServerParameters(
                     command=config.command,
                     args=config.args,
@@ -253,15 +260,18 @@ class MCPConnectionManager:
             if server_conn:
                 return server_conn
 
-        # Launch the connection
-        server_conn = await self.launch_server(
-            server_name=server_name,
-            client_session_factory=client_session_factory,
-            init_hook=init_hook,
-        )
+        with tracer.start_as_current_span(
+            f"connect {server_name}", attributes={"mcp.server.name": server_name}
+        ):
+            # Launch the connection
+            server_conn = await self.launch_server(
+                server_name=server_name,
+                client_session_factory=client_session_factory,
+                init_hook=init_hook,
+            )
 
-        # Wait until it's fully initialized, or an error occurs
-        await server_conn.wait_for_initialized()
+            # Wait until it's fully initialized, or an error occurs
+            await server_conn.wait_for_initialized()
 
         # If the session is still None, it means the lifecycle task crashed
         if not server_conn or not server_conn.session:
@@ -7,9 +7,9 @@ supports dynamic registration of initialization hooks, and provides methods for
 server initialization.
 """
 
-from contextlib import asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import timedelta
-from typing import Callable, Dict, AsyncGenerator
+from typing import Callable, Dict, AsyncGenerator, Tuple
 
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp import ClientSession
@@ -39,6 +39,18 @@ Returns:
     bool: Result of the post-init hook (false indicates failure).
 """
 
+TransportContextFactory = Callable[
+    [],
+    AbstractAsyncContextManager[
+        Tuple[MemoryObjectReceiveStream, MemoryObjectSendStream]
+    ],
+]
+"""
+A type alias for a function that opens a connection to an MCP server, returning an
+async context manager that yields its (read stream, write stream) pair,
+like `stdio_client(...)` and `sse_client(...)` do.
+"""
+
 
 class ServerRegistry:
     """
@@ -52,6 +64,7 @@ class ServerRegistry:
         config_path (str): Path to the YAML configuration file.
         registry (Dict[str, MCPServerSettings]): Loaded server configurations.
         init_hooks (Dict[str, InitHookCallable]): Registered initialization hooks.
+        transports (Dict[str, TransportContextFactory]): Registered custom transports.
     """
 
     def __init__(self, config: Settings | None = None, config_path: str | None = None):
@@ -68,6 +81,7 @@ class ServerRegistry:
             else config.mcp.servers
         )
         self.init_hooks: Dict[str, InitHookCallable] = {}
+        self.transports: Dict[str, TransportContextFactory] = {}
         self.connection_manager = MCPConnectionManager(self)
 
     def load_registry_from_file(
@@ -118,7 +132,24 @@ class ServerRegistry:
             else None
         )
 
-        if config.transport == "stdio":
+        transport_context_factory = self.transports.get(server_name)
+        if transport_context_factory is not None:
+            async with transport_context_factory() as (read_stream, write_stream):
+                session = client_session_factory(
+                    read_stream,
+                    write_stream,
+                    read_timeout_seconds,
+                )
+                async with session:
+                    logger.info(
+                        f"{server_name}: Connected to server using a custom transport."
+                    )
+                    try:
+                        yield session
+                    finally:
+                        logger.debug(f"{server_name}: Closed session to server")
+
+        elif config.transport == "stdio":
             if not config.command or not config.args:
                 raise ValueError(
                     f"Command and args are required for stdio transport: {server_name}"
@@ -234,6 +265,22 @@ class ServerRegistry:
 
         self.init_hooks[server_name] = hook
 
+    def register_transport(
+        self, server_name: str, transport_context_factory: TransportContextFactory
+    ) -> None:
+        """
+        Register a custom transport for a specific server, used to connect to it instead
+        of the transport in its configuration (e.g. to a server running in-process).
+
+        Args:
+            server_name (str): The name of the server.
+            transport_context_factory (TransportContextFactory): The function that opens a connection to the server.
+        """
+        if server_name not in self.registry:
+            raise ValueError(f"Server '{server_name}' not found in registry.")
+
+        self.transports[server_name] = transport_context_factory
+
     def execute_init_hook(self, server_name: str, session=None) -> bool:
         """
         Execute the initialization hook for a specific server.
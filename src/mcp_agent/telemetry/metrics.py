@@ -0,0 +1,497 @@
+"""
+Metrics for the MCP Agent: counters, gauges and histograms kept alongside the event logger.
+
+Instruments are created once (usually at module level) from the global `metrics` registry
+and updated on hot paths, so updates are kept cheap:
+    - no locks: counters and histograms write to a per-thread shard, which is merged
+      when metrics are collected
+    - label values are passed as keyword arguments and stored as a sorted tuple
+
+Metrics can be exported in the Prometheus text format (see `MetricsRegistry.to_prometheus`
+and `start_prometheus_server`), and through OpenTelemetry metrics (see `bind_otel`).
+
+Example:
+    tool_calls = metrics.counter("mcp_agent.tool.calls", "MCP tool calls")
+    tool_calls.add(1, server="fetch", status="ok")
+"""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from pydantic import BaseModel
+
+LabelKey = Tuple[Tuple[str, Any], ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+"""Default histogram buckets, suited to durations in seconds."""
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+class HistogramValue(BaseModel):
+    """Aggregated observations of one histogram series."""
+
+    buckets: List[float]
+    """Upper bounds of the buckets (excluding the implicit +Inf bucket)"""
+
+    counts: List[int]
+    """Number of observations in each bucket (not cumulative), +Inf bucket last"""
+
+    sum: float
+    count: int
+
+
+class MetricSeries(BaseModel):
+    """The value of a metric for one set of labels."""
+
+    labels: Dict[str, Any]
+    value: float | HistogramValue
+
+
+class MetricData(BaseModel):
+    """A snapshot of a metric and all of its series."""
+
+    name: str
+    kind: str
+    description: str
+    unit: str
+    series: List[MetricSeries]
+
+
+class Instrument(ABC):
+    """Base class of metric instruments."""
+
+    kind: str = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        description: str = "",
+        unit: str = "",
+    ):
+        self.registry = registry
+        self.name = name
+        self.description = description
+        self.unit = unit
+
+    @abstractmethod
+    def collect(self) -> List[MetricSeries]:
+        """Return the current value of every series."""
+
+    @abstractmethod
+    def bind_otel(self, meter: Any) -> None:
+        """Export this instrument through an OpenTelemetry meter."""
+
+    def _observe_otel(self, _options: Any) -> Iterable[Any]:
+        from opentelemetry.metrics import Observation
+
+        for series in self.collect():
+            yield Observation(series.value, attributes=_otel_attributes(series.labels))
+
+
+class _Sharded:
+    """Per-thread dicts of values, so that updates need no lock."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict[LabelKey, Any]] = []
+
+    def shard(self) -> Dict[LabelKey, Any]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            # list.append is atomic, and shards are never removed, so values
+            # recorded by threads that have since exited are kept
+            self._shards.append(values)
+            return values
+
+    def snapshots(self) -> List[Dict[LabelKey, Any]]:
+        # dict.copy is atomic under the GIL, so a shard can't change while it's copied
+        return [shard.copy() for shard in list(self._shards)]
+
+
+class Counter(Instrument):
+    """A monotonically increasing count, e.g. of requests or tokens."""
+
+    kind = "counter"
+
+    def __init__(self, registry, name, description="", unit=""):
+        super().__init__(registry, name, description, unit)
+        self._values = _Sharded()
+
+    def add(self, value: float = 1, **labels: Any) -> None:
+        """Increase the count of the series with the given labels."""
+        if not self.registry.enabled:
+            return
+        shard = self._values.shard()
+        key = _label_key(labels)
+        shard[key] = shard.get(key, 0) + value
+
+    def get(self, **labels: Any) -> float:
+        """Return the count of the series with the given labels."""
+        key = _label_key(labels)
+        return sum(shard.get(key, 0) for shard in self._values.snapshots())
+
+    def collect(self) -> List[MetricSeries]:
+        totals: Dict[LabelKey, float] = {}
+        for shard in self._values.snapshots():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+        return [
+            MetricSeries(labels=dict(key), value=value) for key, value in totals.items()
+        ]
+
+    def bind_otel(self, meter: Any) -> None:
+        meter.create_observable_counter(
+            self.name,
+            callbacks=[self._observe_otel],
+            unit=self.unit,
+            description=self.description,
+        )
+
+
+class Gauge(Instrument):
+    """
+    A value that goes up and down, e.g. a queue depth or the number of requests in flight.
+    Either set it (with `set`/`add`), or give it a callback that is called at collection
+    time and returns the value, or a list of (labels, value) pairs.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        registry,
+        name,
+        description="",
+        unit="",
+        callback: Callable[[], float | Sequence[Tuple[Dict[str, Any], float]]]
+        | None = None,
+    ):
+        super().__init__(registry, name, description, unit)
+        self.callback = callback
+        self._values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value of the series with the given labels."""
+        if not self.registry.enabled:
+            return
+        self._values[_label_key(labels)] = value
+
+    def add(self, value: float, **labels: Any) -> None:
+        """
+        Add to the value of the series with the given labels.
+        Meant for the event loop thread: concurrent adds from other threads may race.
+        """
+        if not self.registry.enabled:
+            return
+        key = _label_key(labels)
+        self._values[key] = self._values.get(key, 0) + value
+
+    def get(self, **labels: Any) -> float:
+        """Return the value of the series with the given labels."""
+        return self._values.get(_label_key(labels), 0)
+
+    def collect(self) -> List[MetricSeries]:
+        series = [
+            MetricSeries(labels=dict(key), value=value)
+            for key, value in self._values.copy().items()
+        ]
+        if self.callback is not None:
+            try:
+                observed = self.callback()
+            except Exception:
+                observed = []
+            if isinstance(observed, (int, float)):
+                series.append(MetricSeries(labels={}, value=observed))
+            else:
+                series.extend(
+                    MetricSeries(labels=labels, value=value)
+                    for labels, value in observed
+                )
+        return series
+
+    def bind_otel(self, meter: Any) -> None:
+        meter.create_observable_gauge(
+            self.name,
+            callbacks=[self._observe_otel],
+            unit=self.unit,
+            description=self.description,
+        )
+
+
+class Histogram(Instrument):
+    """A distribution of values, e.g. of request durations, counted in buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry,
+        name,
+        description="",
+        unit="",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(registry, name, description, unit)
+        self.buckets = tuple(sorted(buckets))
+        self._values = _Sharded()
+        self._otel_histogram = None
+
+    def record(self, value: float, **labels: Any) -> None:
+        """Record an observation in the series with the given labels."""
+        if not self.registry.enabled:
+            return
+        shard = self._values.shard()
+        key = _label_key(labels)
+        entry = shard.get(key)
+        if entry is None:
+            # [bucket counts, sum, count]
+            entry = shard[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+        if self._otel_histogram is not None:
+            self._otel_histogram.record(value, attributes=_otel_attributes(labels))
+
+    def collect(self) -> List[MetricSeries]:
+        totals: Dict[LabelKey, HistogramValue] = {}
+        for shard in self._values.snapshots():
+            for key, (counts, total, count) in shard.items():
+                value = totals.get(key)
+                if value is None:
+                    value = totals[key] = HistogramValue(
+                        buckets=list(self.buckets),
+                        counts=[0] * (len(self.buckets) + 1),
+                        sum=0.0,
+                        count=0,
+                    )
+                value.counts = [a + b for a, b in zip(value.counts, counts)]
+                value.sum += total
+                value.count += count
+        return [
+            MetricSeries(labels=dict(key), value=value) for key, value in totals.items()
+        ]
+
+    def bind_otel(self, meter: Any) -> None:
+        # OpenTelemetry has no observable histograms, so forward new observations
+        self._otel_histogram = meter.create_histogram(
+            self.name, unit=self.unit, description=self.description
+        )
+
+
+def _otel_attributes(labels: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in labels.items()
+    }
+
+
+class MetricsRegistry:
+    """Creates and holds metric instruments, and exports their values."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._instruments: Dict[str, Instrument] = {}
+        self._lock = threading.Lock()
+        self._meter = None
+
+    def _get_or_create(self, cls, name: str, **kwargs: Any) -> Any:
+        with self._lock:
+            instrument = self._instruments.get(name)
+            if instrument is None:
+                instrument = self._instruments[name] = cls(self, name, **kwargs)
+                if self._meter is not None:
+                    instrument.bind_otel(self._meter)
+            elif not isinstance(instrument, cls):
+                raise ValueError(
+                    f"Metric {name} is already registered as a {instrument.kind}"
+                )
+            return instrument
+
+    def counter(self, name: str, description: str = "", unit: str = "") -> Counter:
+        """Return the counter with the given name, creating it if needed."""
+        return self._get_or_create(Counter, name, description=description, unit=unit)
+
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+        unit: str = "",
+        callback: Callable[[], Any] | None = None,
+    ) -> Gauge:
+        """Return the gauge with the given name, creating it if needed."""
+        gauge = self._get_or_create(
+            Gauge, name, description=description, unit=unit, callback=callback
+        )
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        unit: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with the given name, creating it if needed."""
+        return self._get_or_create(
+            Histogram, name, description=description, unit=unit, buckets=buckets
+        )
+
+    def collect(self) -> List[MetricData]:
+        """Return a snapshot of all metrics."""
+        with self._lock:
+            instruments = list(self._instruments.values())
+        return [
+            MetricData(
+                name=instrument.name,
+                kind=instrument.kind,
+                description=instrument.description,
+                unit=instrument.unit,
+                series=instrument.collect(),
+            )
+            for instrument in instruments
+        ]
+
+    def bind_otel(self, meter: Any) -> None:
+        """
+        Export all metrics (including those created later) through an OpenTelemetry meter,
+        e.g. `metrics_api.get_meter("mcp_agent")` once a MeterProvider is configured.
+        """
+        with self._lock:
+            self._meter = meter
+            instruments = list(self._instruments.values())
+        for instrument in instruments:
+            instrument.bind_otel(meter)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self.collect():
+            name = _prometheus_name(metric.name, metric.unit)
+            if metric.kind == "counter" and not name.endswith("_total"):
+                name = f"{name}_total"
+
+            if metric.description:
+                lines.append(f"# HELP {name} {_escape_help(metric.description)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+
+            for series in metric.series:
+                if isinstance(series.value, HistogramValue):
+                    lines.extend(_prometheus_histogram(name, series))
+                else:
+                    labels = _prometheus_labels(series.labels)
+                    lines.append(f"{name}{labels} {_format_value(series.value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+_PROMETHEUS_UNITS = {"s": "seconds", "ms": "milliseconds", "By": "bytes"}
+
+
+def _prometheus_name(name: str, unit: str) -> str:
+    sanitized = "".join(c if c.isalnum() or c in "_:" else "_" for c in name)
+    suffix = _PROMETHEUS_UNITS.get(unit)
+    if suffix and not sanitized.endswith(f"_{suffix}"):
+        sanitized = f"{sanitized}_{suffix}"
+    return sanitized
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _prometheus_labels(labels: Dict[str, Any], **extra: Any) -> str:
+    items = {**labels, **extra}
+    if not items:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for key, value in items.items()
+    )
+    return f"{{{rendered}}}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _prometheus_histogram(name: str, series: MetricSeries) -> List[str]:
+    value: HistogramValue = series.value
+    lines = []
+    cumulative = 0
+    for bound, count in zip(value.buckets + [math.inf], value.counts):
+        cumulative += count
+        labels = _prometheus_labels(series.labels, le=_format_value(float(bound)))
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+    labels = _prometheus_labels(series.labels)
+    lines.append(f"{name}_sum{labels} {_format_value(value.sum)}")
+    lines.append(f"{name}_count{labels} {value.count}")
+    return lines
+
+
+def start_prometheus_server(
+    registry: MetricsRegistry, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve the registry's metrics at http://<host>:<port>/metrics from a background thread.
+    Call `shutdown()` on the returned server to stop it.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Don't log every scrape to stderr
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="mcp-agent-metrics", daemon=True
+    ).start()
+    return server
+
+
+metrics = MetricsRegistry()
+"""The global metrics registry."""
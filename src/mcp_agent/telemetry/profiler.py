@@ -0,0 +1,441 @@
+"""
+Opt-in profiler for agent runs.
+
+While active, the Profiler records:
+    - a timeline of the OpenTelemetry spans of the run (provider calls, tool calls,
+      MCP requests, workflow and orchestrator steps, scheduler and rate limiter waits),
+      with the wall time of each span and the CPU time spent on its thread meanwhile
+    - event loop stalls: periods longer than a threshold in which the event loop didn't
+      run, with the stack of the code that was blocking it
+
+The resulting Profile can be written as Chrome trace JSON (open in chrome://tracing or
+https://ui.perfetto.dev) or as folded stacks for flame graph tools (flamegraph.pl,
+speedscope, inferno).
+
+Enable it for an app run with `app.run(profile=True)` or the `profiling` settings.
+
+Example:
+    async with app.run(profile=True) as running_app:
+        ...
+    print(app.profile.summary())
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Literal
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
+from pydantic import BaseModel, Field
+
+ProfileFormat = Literal["chrome", "folded"]
+
+
+class ProfiledSpan(BaseModel):
+    """A span recorded by the profiler."""
+
+    span_id: int
+    parent_id: int | None = None
+    name: str
+    start_ns: int
+    """Start time, in nanoseconds since the epoch"""
+
+    end_ns: int
+    cpu_ns: int | None = None
+    """
+    CPU time of the span's thread while the span was open. On the event loop thread,
+    this includes the CPU time of other tasks that ran concurrently.
+    """
+
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+class LoopStall(BaseModel):
+    """A period in which the event loop was blocked."""
+
+    start_ns: int
+    """Start time, in nanoseconds since the epoch"""
+
+    duration_ns: int
+    stack: List[str] = Field(default_factory=list)
+    """Frames (file:line in function) of the blocking code, outermost first"""
+
+
+class SpanStats(BaseModel):
+    """Aggregated wall and CPU time of the spans with the same name."""
+
+    count: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+
+class Profile(BaseModel):
+    """The spans and event loop stalls recorded during a profiled run."""
+
+    start_ns: int
+    end_ns: int
+    spans: List[ProfiledSpan] = Field(default_factory=list)
+    stalls: List[LoopStall] = Field(default_factory=list)
+
+    def summary(self) -> Dict[str, SpanStats]:
+        """Return the wall and CPU time of spans by span name, slowest first."""
+        stats: Dict[str, SpanStats] = {}
+        for span in self.spans:
+            entry = stats.setdefault(span.name, SpanStats())
+            entry.count += 1
+            entry.wall_seconds += span.duration_ns / 1e9
+            entry.cpu_seconds += (span.cpu_ns or 0) / 1e9
+        if self.stalls:
+            stalls = stats.setdefault("event loop stall", SpanStats())
+            for stall in self.stalls:
+                stalls.count += 1
+                stalls.wall_seconds += stall.duration_ns / 1e9
+        return dict(
+            sorted(stats.items(), key=lambda item: item[1].wall_seconds, reverse=True)
+        )
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Return the profile in the Chrome trace event format.
+        Concurrent spans are laid out on separate tracks, so each track nests properly.
+        """
+        events: List[Dict[str, Any]] = []
+        lanes = _assign_lanes(self.spans)
+        for span in self.spans:
+            args = {k: _jsonable(v) for k, v in span.attributes.items()}
+            if span.cpu_ns is not None:
+                args["cpu_ms"] = span.cpu_ns / 1e6
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "span",
+                    "ph": "X",
+                    "ts": (span.start_ns - self.start_ns) / 1e3,
+                    "dur": span.duration_ns / 1e3,
+                    "pid": 1,
+                    "tid": lanes[span.span_id],
+                    "args": args,
+                }
+            )
+
+        stall_tid = max(lanes.values(), default=0) + 1
+        for stall in self.stalls:
+            events.append(
+                {
+                    "name": "event loop stall",
+                    "cat": "stall",
+                    "ph": "X",
+                    "ts": (stall.start_ns - self.start_ns) / 1e3,
+                    "dur": stall.duration_ns / 1e3,
+                    "pid": 1,
+                    "tid": stall_tid,
+                    "args": {"stack": stall.stack},
+                }
+            )
+
+        events.append(_thread_name_event(stall_tid, "event loop stalls"))
+        for lane in sorted(set(lanes.values())):
+            events.append(_thread_name_event(lane, f"spans {lane}"))
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_folded(self) -> str:
+        """
+        Return the profile as folded stacks (one "frame;frame;... microseconds" line per
+        span path), weighted by the self time of the spans.
+        """
+        by_id = {span.span_id: span for span in self.spans}
+        child_time: Dict[int, int] = {}
+        for span in self.spans:
+            if span.parent_id in by_id:
+                child_time[span.parent_id] = (
+                    child_time.get(span.parent_id, 0) + span.duration_ns
+                )
+
+        weights: Dict[str, int] = {}
+        for span in self.spans:
+            path = []
+            current: ProfiledSpan | None = span
+            while current is not None:
+                path.append(_folded_frame(current.name))
+                current = by_id.get(current.parent_id)
+            # Concurrent children can add up to more than their parent's duration
+            self_ns = max(span.duration_ns - child_time.get(span.span_id, 0), 0)
+            key = ";".join(reversed(path))
+            weights[key] = weights.get(key, 0) + self_ns
+
+        for stall in self.stalls:
+            frames = ["event loop stall"] + [_folded_frame(f) for f in stall.stack]
+            key = ";".join(frames)
+            weights[key] = weights.get(key, 0) + stall.duration_ns
+
+        return "".join(
+            f"{key} {ns // 1000}\n" for key, ns in weights.items() if ns >= 1000
+        )
+
+    def write(self, path: str | Path, format: ProfileFormat = "chrome") -> Path:
+        """Write the profile to a file, as Chrome trace JSON or folded stacks."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if format == "chrome":
+            path.write_text(json.dumps(self.to_chrome_trace()))
+        elif format == "folded":
+            path.write_text(self.to_folded())
+        else:
+            raise ValueError(f"Unsupported profile format: {format}")
+        return path
+
+
+def _thread_name_event(tid: int, name: str) -> Dict[str, Any]:
+    return {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": 1,
+        "tid": tid,
+        "args": {"name": name},
+    }
+
+
+def _folded_frame(name: str) -> str:
+    # Frames are separated by ";" and the weight by the last space
+    return name.replace(";", ",").replace("\n", " ")
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return str(value)
+
+
+def _assign_lanes(spans: List[ProfiledSpan]) -> Dict[int, int]:
+    """
+    Assign spans to tracks such that spans on a track are either nested or disjoint,
+    preferring the track of the span's parent.
+    """
+    lanes: Dict[int, int] = {}
+    # Per track, the end times of the spans open at the current start time
+    open_spans: List[List[int]] = []
+    for span in sorted(spans, key=lambda s: (s.start_ns, -s.end_ns)):
+        candidates = list(range(len(open_spans)))
+        parent_lane = lanes.get(span.parent_id)
+        if parent_lane is not None:
+            candidates.insert(0, parent_lane)
+
+        for lane in candidates:
+            stack = open_spans[lane]
+            while stack and stack[-1] <= span.start_ns:
+                stack.pop()
+            if not stack or stack[-1] >= span.end_ns:
+                break
+        else:
+            lane = len(open_spans)
+            open_spans.append([])
+
+        open_spans[lane].append(span.end_ns)
+        lanes[span.span_id] = lane
+    return lanes
+
+
+class _SpanRecorder(SpanProcessor):
+    """
+    Span processor that records the spans ended while profiling is active, into the
+    span list of each active profiler (profilers of concurrent runs may overlap).
+    """
+
+    def __init__(self):
+        self.sessions: List[List[ProfiledSpan]] = []
+        self._cpu_start: Dict[int, int] = {}
+
+    def on_start(self, span: Span, parent_context=None) -> None:
+        if self.sessions:
+            self._cpu_start[span.context.span_id] = time.thread_time_ns()
+
+    def on_end(self, span: ReadableSpan) -> None:
+        cpu_start = self._cpu_start.pop(span.context.span_id, None)
+        sessions = tuple(self.sessions)
+        if not sessions or cpu_start is None:
+            return
+
+        profiled_span = ProfiledSpan(
+            span_id=span.context.span_id,
+            parent_id=span.parent.span_id if span.parent else None,
+            name=span.name,
+            start_ns=span.start_time,
+            end_ns=span.end_time,
+            cpu_ns=time.thread_time_ns() - cpu_start,
+            attributes=dict(span.attributes or {}),
+        )
+        for spans in sessions:
+            spans.append(profiled_span)
+
+    def shutdown(self) -> None:
+        self.sessions = []
+        self._cpu_start.clear()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+class LoopStallDetector:
+    """
+    Detects event loop stalls: a callback on the loop records a heartbeat at a short
+    interval, and a watchdog thread captures the loop thread's stack when the heartbeat
+    is late by more than the threshold.
+    """
+
+    def __init__(self, threshold_seconds: float = 0.1):
+        self.threshold_seconds = threshold_seconds
+        self.interval_seconds = min(threshold_seconds / 4, 0.05)
+        self.stalls: List[LoopStall] = []
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_beat = 0.0
+        # The stall currently in progress, once the watchdog has captured its stack
+        self._current: LoopStall | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._handle = self._loop.call_later(self.interval_seconds, self._beat)
+        self._watchdog = threading.Thread(
+            target=self._watch, name="mcp-agent-stall-detector", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        if self._watchdog:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def _beat(self):
+        now = time.monotonic()
+        lag = now - self._last_beat - self.interval_seconds
+        current, self._current = self._current, None
+        if current is not None:
+            current.duration_ns = max(current.duration_ns, int(lag * 1e9))
+        elif lag > self.threshold_seconds:
+            # Too short for the watchdog to catch, record it without a stack
+            self.stalls.append(
+                LoopStall(
+                    start_ns=time.time_ns() - int(lag * 1e9), duration_ns=int(lag * 1e9)
+                )
+            )
+
+        self._last_beat = now
+        if not self._stop.is_set():
+            self._handle = self._loop.call_later(self.interval_seconds, self._beat)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval_seconds):
+            last_beat = self._last_beat
+            lag = time.monotonic() - last_beat - self.interval_seconds
+            if lag <= self.threshold_seconds or self._current is not None:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = [
+                f"{f.filename}:{f.lineno} in {f.name}"
+                for f in (traceback.extract_stack(frame) if frame else [])
+            ]
+            stall = LoopStall(
+                start_ns=time.time_ns() - int(lag * 1e9),
+                duration_ns=int(lag * 1e9),
+                stack=stack,
+            )
+            # The loop may have resumed while the stack was captured
+            if self._last_beat == last_beat:
+                self._current = stall
+                self.stalls.append(stall)
+
+
+_recorder = _SpanRecorder()
+_recorder_provider: TracerProvider | None = None
+_recorder_lock = threading.Lock()
+
+
+def _register_recorder() -> _SpanRecorder:
+    """
+    Register the span recorder on the global tracer provider, once: span processors
+    can't be removed from a provider, so the recorder stays registered and records
+    only while a profiler is active.
+    """
+    global _recorder_provider
+    with _recorder_lock:
+        provider = trace.get_tracer_provider()
+        if not isinstance(provider, TracerProvider):
+            # Tracing isn't configured: record spans without exporting them
+            provider = TracerProvider()
+            trace.set_tracer_provider(provider)
+            # The global provider can only be set once, use the one that won
+            provider = trace.get_tracer_provider()
+        if provider is not _recorder_provider and isinstance(provider, TracerProvider):
+            provider.add_span_processor(_recorder)
+            _recorder_provider = provider
+    return _recorder
+
+
+class Profiler:
+    """
+    Records the spans of a run and the event loop stalls during it.
+    Must be started and stopped on the event loop of the run.
+    """
+
+    def __init__(self, stall_threshold_seconds: float = 0.1):
+        self.stall_detector = LoopStallDetector(stall_threshold_seconds)
+        self._spans: List[ProfiledSpan] = []
+        self._start_ns: int | None = None
+
+    def start(self):
+        recorder = _register_recorder()
+        self._start_ns = time.time_ns()
+        self._spans = []
+        recorder.sessions.append(self._spans)
+        self.stall_detector.stalls = []
+        self.stall_detector.start()
+
+    def stop(self) -> Profile:
+        _recorder.sessions = [s for s in _recorder.sessions if s is not self._spans]
+        self.stall_detector.stop()
+        return Profile(
+            start_ns=self._start_ns,
+            end_ns=time.time_ns(),
+            spans=sorted(self._spans, key=lambda s: s.start_ns),
+            stalls=list(self.stall_detector.stalls),
+        )
+
+
+def format_summary(profile: Profile, limit: int = 10) -> str:
+    """Format the slowest span names (and event loop stalls) of a profile as a table."""
+    lines = [f"{'span':<50} {'count':>7} {'wall (s)':>10} {'cpu (s)':>10}"]
+    for name, stats in list(profile.summary().items())[:limit]:
+        lines.append(
+            f"{name[:50]:<50} {stats.count:>7} {stats.wall_seconds:>10.3f} {stats.cpu_seconds:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def default_profile_path(name: str, format: ProfileFormat) -> Path:
+    """Return the default file a run's profile is written to."""
+    suffix = "json" if format == "chrome" else "folded"
+    return Path(f"{name}-profile-{time.strftime('%Y%m%d-%H%M%S')}.{suffix}")
@@ -0,0 +1,200 @@
+"""
+Token usage and cost accounting for LLM requests.
+
+Every provider request made through an AugmentedLLM reports the tokens it used (and its
+estimated cost, from the model's pricing in the ModelSelector) to the context's
+UsageTracker, which accumulates them per model, agent and workflow run.
+
+Usage is attributed to the workflow run in whose `usage_scope` the request is made.
+The WorkflowRunManager opens a scope for each run it executes, so usage of a run is
+available on its WorkflowResult, and so does the asyncio engine's @workflow_run decorator.
+
+Example:
+    result = await app.run_manager.wait(run_id)
+    print(result.result.usage.cost)
+    print(app.usage.by_agent["researcher"].total_tokens)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class TokenUsage(BaseModel):
+    """Tokens used (and their estimated cost) by one or more LLM requests."""
+
+    requests: int = 0
+    """Number of requests"""
+
+    input_tokens: int = 0
+    """Input (prompt) tokens, including the tokens read from and written to the prompt cache"""
+
+    output_tokens: int = 0
+    """Output (completion) tokens"""
+
+    cache_read_tokens: int = 0
+    """Input tokens read from the provider's prompt cache"""
+
+    cache_write_tokens: int = 0
+    """Input tokens written to the provider's prompt cache"""
+
+    cost: float = 0.0
+    """Estimated cost in USD, of the requests to models with known pricing"""
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Input tokens neither read from nor written to the prompt cache."""
+        return max(
+            0, self.input_tokens - self.cache_read_tokens - self.cache_write_tokens
+        )
+
+    def add(self, other: "TokenUsage") -> None:
+        """Add the usage of other requests to this one."""
+        self.requests += other.requests
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.cost += other.cost
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        total = self.model_copy()
+        total.add(other)
+        return total
+
+    @classmethod
+    def from_response(cls, response: Any) -> "TokenUsage | None":
+        """
+        Return the usage reported in a provider response, or None if it reports none.
+        Supports Anthropic (input_tokens/output_tokens) and OpenAI
+        (prompt_tokens/completion_tokens) style usage objects.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+
+        input_tokens = getattr(usage, "input_tokens", None)
+        if input_tokens is None:
+            input_tokens = getattr(usage, "prompt_tokens", None)
+        output_tokens = getattr(usage, "output_tokens", None)
+        if output_tokens is None:
+            output_tokens = getattr(usage, "completion_tokens", None)
+        if input_tokens is None and output_tokens is None:
+            return None
+
+        # Anthropic reports cache reads and writes separately from input tokens,
+        # OpenAI includes cached tokens in the prompt tokens
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        openai_cache_read = getattr(prompt_details, "cached_tokens", None) or 0
+
+        return cls(
+            requests=1,
+            input_tokens=(input_tokens or 0) + cache_read + cache_write,
+            output_tokens=output_tokens or 0,
+            cache_read_tokens=cache_read or openai_cache_read,
+            cache_write_tokens=cache_write,
+        )
+
+
+class UsageSummary(BaseModel):
+    """Accumulated usage, in total and broken down by model, agent and workflow run."""
+
+    total: TokenUsage = Field(default_factory=TokenUsage)
+    by_model: Dict[str, TokenUsage] = Field(default_factory=dict)
+    by_agent: Dict[str, TokenUsage] = Field(default_factory=dict)
+    by_workflow: Dict[str, TokenUsage] = Field(default_factory=dict)
+
+
+_current_workflow_id: ContextVar[str | None] = ContextVar(
+    "mcp_agent_usage_workflow_id", default=None
+)
+
+
+@contextmanager
+def usage_scope(workflow_id: str):
+    """Attribute the usage of LLM requests made within the scope to a workflow run."""
+    token = _current_workflow_id.set(workflow_id)
+    try:
+        yield
+    finally:
+        _current_workflow_id.reset(token)
+
+
+def get_usage_workflow_id() -> str | None:
+    """Return the id of the workflow run that usage is currently attributed to."""
+    return _current_workflow_id.get()
+
+
+class UsageTracker:
+    """Accumulates the usage of LLM requests per model, agent and workflow run."""
+
+    def __init__(self):
+        self._summary = UsageSummary()
+
+    @property
+    def total(self) -> TokenUsage:
+        return self._summary.total
+
+    @property
+    def by_model(self) -> Dict[str, TokenUsage]:
+        return self._summary.by_model
+
+    @property
+    def by_agent(self) -> Dict[str, TokenUsage]:
+        return self._summary.by_agent
+
+    @property
+    def by_workflow(self) -> Dict[str, TokenUsage]:
+        return self._summary.by_workflow
+
+    def record(
+        self,
+        usage: TokenUsage,
+        model: str,
+        agent: str | None = None,
+        workflow_id: str | None = None,
+    ) -> None:
+        """
+        Record the usage of a request. The workflow run defaults to
+        the one of the current usage scope.
+        """
+        workflow_id = workflow_id or get_usage_workflow_id()
+
+        self._summary.total.add(usage)
+        self._summary.by_model.setdefault(model, TokenUsage()).add(usage)
+        if agent:
+            self._summary.by_agent.setdefault(agent, TokenUsage()).add(usage)
+        if workflow_id:
+            self._summary.by_workflow.setdefault(workflow_id, TokenUsage()).add(usage)
+
+    def get_workflow_usage(self, workflow_id: str) -> TokenUsage:
+        """Return the usage of a workflow run."""
+        return self._summary.by_workflow.get(workflow_id, TokenUsage()).model_copy()
+
+    def get_agent_usage(self, agent: str) -> TokenUsage:
+        """Return the usage of the LLMs of an agent."""
+        return self._summary.by_agent.get(agent, TokenUsage()).model_copy()
+
+    def get_model_usage(self, model: str) -> TokenUsage:
+        """Return the usage of a model."""
+        return self._summary.by_model.get(model, TokenUsage()).model_copy()
+
+    def forget_workflow(self, workflow_id: str) -> None:
+        """Drop the usage of a workflow run (it stays counted in the other breakdowns)."""
+        self._summary.by_workflow.pop(workflow_id, None)
+
+    def summary(self) -> UsageSummary:
+        """Return a snapshot of the accumulated usage."""
+        return self._summary.model_copy(deep=True)
+
+    def reset(self) -> None:
+        """Clear all accumulated usage."""
+        self._summary = UsageSummary()
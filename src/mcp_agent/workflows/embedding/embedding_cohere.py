@@ -34,7 +34,10 @@ class CohereEmbeddingModel(EmbeddingModel):
         }[model]
 
     async def embed(self, data: List[str]) -> FloatArray:
-        response = self.client.embed(
+        response = await self.context.executor.execute_provider_call(
+            "Cohere",
+            self.model,
+            self.client.embed,
             texts=data,
             model=self.model,
             input_type="classification",
@@ -25,8 +25,13 @@ class OpenAIEmbeddingModel(EmbeddingModel):
         }[model]
 
     async def embed(self, data: List[str]) -> FloatArray:
-        response = self.client.embeddings.create(
-            model=self.model, input=data, encoding_format="float"
+        response = await self.context.executor.execute_provider_call(
+            "OpenAI",
+            self.model,
+            self.client.embeddings.create,
+            model=self.model,
+            input=data,
+            encoding_format="float",
         )
 
         # Sort the embeddings by their index to ensure correct order
@@ -1,8 +1,23 @@
 from abc import abstractmethod
+from contextlib import nullcontext
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
-from typing import Generic, List, Optional, Protocol, Type, TypeVar, TYPE_CHECKING
-
-from pydantic import Field
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+from pydantic import BaseModel, Field
 
 from mcp.types import (
     CallToolRequest,
@@ -14,13 +29,40 @@ from mcp.types import (
 )
 
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.executor.scheduler import scheduling_context
+from mcp_agent.workflows.llm.batch import BatchBackend, LocalBatchBackend
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.tracing import (
+    provider_span_attributes,
+    set_genai_response_attributes,
+)
 from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+from mcp_agent.telemetry.metrics import metrics
+from mcp_agent.telemetry.token_usage import TokenUsage
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
 
 if TYPE_CHECKING:
     from mcp_agent.agents.agent import Agent
     from mcp_agent.context import Context
 
+logger = get_logger(__name__)
+
+_llm_requests = metrics.counter("mcp_agent.llm.requests", "LLM provider requests")
+_llm_request_duration = metrics.histogram(
+    "mcp_agent.llm.request_duration", "Duration of LLM provider requests", unit="s"
+)
+_llm_tokens = metrics.counter(
+    "mcp_agent.llm.tokens", "Tokens used by LLM provider requests"
+)
+_llm_cost = metrics.counter(
+    "mcp_agent.llm.cost", "Estimated cost of LLM provider requests in USD"
+)
+llm_iterations = metrics.histogram(
+    "mcp_agent.llm.iterations",
+    "LLM calls made per generate request (including tool use turns)",
+    buckets=(1, 2, 3, 5, 8, 10, 15, 20, 30, 50),
+)
+
 MessageParamT = TypeVar("MessageParamT")
 """A type representing an input message to an LLM."""
 
@@ -35,6 +77,38 @@ MCPMessageParam = SamplingMessage
 MCPMessageResult = CreateMessageResult
 
 
+ProviderRequestFactory = Callable[["Context"], Callable[..., Any]]
+"""Creates the provider SDK function for LLM requests (e.g. client.messages.create) from a context."""
+
+_provider_requests: Dict[str, Tuple[ProviderRequestFactory, Type[BaseModel]]] = {}
+
+
+def register_provider_request(
+    provider: str,
+    request_factory: ProviderRequestFactory,
+    response_type: Type[BaseModel],
+):
+    """
+    Register how to make requests to an LLM provider outside of an AugmentedLLM instance,
+    e.g. from a Temporal activity running on a worker.
+    """
+    _provider_requests[provider] = (request_factory, response_type)
+
+
+def get_provider_request(
+    provider: str,
+) -> Tuple[ProviderRequestFactory, Type[BaseModel]]:
+    """Return the request factory and response type registered for a provider."""
+    if provider not in _provider_requests:
+        raise KeyError(f"No request registered for provider '{provider}'")
+    return _provider_requests[provider]
+
+
+def get_request_payload(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the parts of a provider request that count towards its input tokens."""
+    return {k: arguments.get(k) for k in ("system", "messages", "tools")}
+
+
 class Memory(Protocol, Generic[MessageParamT]):
     """
     Simple memory management for storing past interactions in-memory.
@@ -115,6 +189,25 @@ class RequestParams(CreateMessageRequestParams):
     Also known as multi-step tool use.
     """
 
+    priority: str | None = None
+    """
+    Executor priority class for the LLM and tool calls made by this request
+    (e.g. "interactive", "default", "batch").
+    """
+
+    fairness_key: str | None = None
+    """
+    Key (e.g. a workflow id or tenant) used to share executor capacity fairly
+    between requests of the same priority class.
+    """
+
+    use_batch_api: bool = False
+    """
+    Submit the request through the provider's batch API, which is cheaper but can
+    take much longer to complete. Only applies to single-iteration requests;
+    requests that may run a multi-iteration tool loop use interactive calls.
+    """
+
 
 class AugmentedLLMProtocol(Protocol, Generic[MessageParamT, MessageT]):
     """Protocol defining the interface for augmented LLMs"""
@@ -194,7 +287,9 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
         super().__init__(context=context, **kwargs)
         self.executor = self.context.executor
         self.aggregator = (
-            agent if agent is not None else MCPAggregator(server_names or [])
+            agent
+            if agent is not None
+            else MCPAggregator(server_names or [], context=context)
         )
         self.name = name or (agent.name if agent else None)
         self.instruction = instruction or (
@@ -211,6 +306,10 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
         self.model_selector = self.context.model_selector
         self.type_converter = type_converter
 
+        # Token usage (and estimated cost) of this LLM's requests, and the last request
+        self.usage = TokenUsage()
+        self.last_usage: TokenUsage | None = None
+
     @abstractmethod
     async def generate(
         self,
@@ -259,6 +358,190 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
 
         return model_info.name
 
+    def get_batch_backend(self) -> BatchBackend | None:
+        """
+        Return the backend used to submit requests through the provider's batch API,
+        or None if the provider doesn't support batching.
+        """
+        return None
+
+    def should_use_batch_api(
+        self, request_params: RequestParams, has_tools: bool
+    ) -> bool:
+        """
+        Check whether a generate request should go through the batch API.
+        Batching only pays off for single-iteration requests: with tools available,
+        the LLM may start a tool loop, and each of its iterations would have to wait
+        for a whole batch to complete.
+        """
+        if not request_params.use_batch_api:
+            return False
+
+        if has_tools and request_params.max_iterations > 1:
+            logger.debug(
+                "Request may run a multi-iteration tool loop, falling back to interactive calls"
+            )
+            return False
+
+        return True
+
+    async def call_provider(
+        self,
+        model: str,
+        request: Callable[..., Any],
+        request_params: RequestParams,
+        use_batch_api: bool = False,
+        **arguments: Any,
+    ) -> Any:
+        """
+        Make a single request to the LLM provider through the executor.
+        The request runs under the priority and fairness key of the request params,
+        and is admitted against the context's token budget for the provider/model (if any).
+        Args:
+            model: The model being called.
+            request: The provider SDK function to call (e.g. client.messages.create).
+            request_params: The request parameters for the current generation.
+            use_batch_api: Submit the request through the provider's batch API (if supported).
+            arguments: The arguments to pass to the provider SDK function.
+        """
+        in_workflow = self.executor.in_workflow()
+        tracer = self.context.tracer or trace.get_tracer(__name__)
+        with (
+            # Durable executors run the request as an activity, which is traced
+            # and applies the token budget on the worker
+            nullcontext(trace.INVALID_SPAN)
+            if in_workflow
+            else tracer.start_as_current_span(
+                f"chat {model}",
+                kind=SpanKind.CLIENT,
+                attributes=provider_span_attributes(
+                    self.provider,
+                    model,
+                    request_params.maxTokens,
+                    arguments.get("temperature"),
+                    self.name,
+                ),
+            )
+        ) as span:
+            start = self.executor.clock()
+            status = "cancelled"
+            try:
+                if in_workflow:
+                    response = await self.executor.execute_provider_call(
+                        self.provider, model, request, **arguments
+                    )
+                else:
+                    response = await self._send_provider_request(
+                        model, request, request_params, use_batch_api, **arguments
+                    )
+                status = "ok"
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                if not self.executor.is_replaying():
+                    labels = {
+                        "provider": self.provider,
+                        "model": model,
+                        "status": status,
+                    }
+                    _llm_requests.add(1, **labels)
+                    _llm_request_duration.record(
+                        self.executor.clock() - start, **labels
+                    )
+
+            usage = self.record_usage(model, response)
+            set_genai_response_attributes(span, response, usage)
+            if usage and usage.cost:
+                span.set_attribute("mcp_agent.llm.cost", usage.cost)
+            return response
+
+    def record_usage(self, model: str, response: Any) -> TokenUsage | None:
+        """
+        Account the token usage reported in a provider response (and its estimated cost)
+        to this LLM, the context's usage tracker and the token/cost metrics.
+        """
+        usage = TokenUsage.from_response(response)
+        if usage is None:
+            return None
+
+        if not self.model_selector:
+            self.model_selector = ModelSelector()
+        cost = self.model_selector.estimate_cost(
+            model,
+            usage.input_tokens,
+            usage.output_tokens,
+            provider=self.provider,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+        if cost is not None:
+            usage.cost = cost
+
+        self.last_usage = usage
+        self.usage.add(usage)
+        if self.executor.is_replaying():
+            # Already accounted when the request was made
+            return usage
+
+        if self.context.usage_tracker:
+            self.context.usage_tracker.record(usage, model=model, agent=self.name)
+
+        labels = {"provider": self.provider, "model": model, "agent": self.name or ""}
+        _llm_tokens.add(usage.input_tokens, type="input", **labels)
+        _llm_tokens.add(usage.output_tokens, type="output", **labels)
+        if usage.cache_read_tokens:
+            _llm_tokens.add(usage.cache_read_tokens, type="cache_read", **labels)
+        if usage.cache_write_tokens:
+            _llm_tokens.add(usage.cache_write_tokens, type="cache_write", **labels)
+        if cost is not None:
+            _llm_cost.add(cost, **labels)
+        return usage
+
+    async def _send_provider_request(
+        self,
+        model: str,
+        request: Callable[..., Any],
+        request_params: RequestParams,
+        use_batch_api: bool,
+        **arguments: Any,
+    ) -> Any:
+        batch_processor = self.context.batch_processor
+        if use_batch_api and batch_processor:
+            backend = (
+                LocalBatchBackend(request)
+                if batch_processor.settings.backend == "local"
+                else self.get_batch_backend()
+            )
+            if backend:
+                return await batch_processor.submit(
+                    f"{self.provider}/{model}", backend, arguments
+                )
+
+            logger.warning(
+                f"{self.provider} doesn't support the batch API, using interactive calls"
+            )
+
+        async def call():
+            with scheduling_context(
+                request_params.priority, request_params.fairness_key
+            ):
+                return await self.executor.execute_provider_call(
+                    self.provider, model, request, **arguments
+                )
+
+        token_limiter = self.context.token_limiter
+        if not token_limiter:
+            return await call()
+
+        return await token_limiter.run(
+            self.provider,
+            model,
+            get_request_payload(arguments),
+            request_params.maxTokens,
+            call,
+        )
+
     def get_request_params(
         self,
         request_params: RequestParams | None = None,
@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import Iterable, List, Type
+from typing import Any, Dict, Iterable, List, Type
 
 from pydantic import BaseModel
 
@@ -35,12 +36,57 @@ from mcp_agent.workflows.llm.augmented_llm import (
     MCPMessageResult,
     ProviderToMCPConverter,
     RequestParams,
+    llm_iterations,
+    register_provider_request,
 )
+from mcp_agent.workflows.llm.batch import BatchBackend, BatchRequestError
 from mcp_agent.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class AnthropicBatchBackend(BatchBackend):
+    """Submits requests through the Anthropic Message Batches API."""
+
+    def __init__(self, client: Anthropic):
+        self.client = client
+
+    async def submit(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        batch = await asyncio.to_thread(
+            self.client.messages.batches.create,
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {k: v for k, v in arguments.items() if v is not None},
+                }
+                for custom_id, arguments in requests.items()
+            ],
+        )
+        return batch.id
+
+    async def is_complete(self, batch_id: str) -> bool:
+        batch = await asyncio.to_thread(self.client.messages.batches.retrieve, batch_id)
+        return batch.processing_status == "ended"
+
+    async def get_results(self, batch_id: str) -> Dict[str, Any]:
+        def read_results():
+            results: Dict[str, Any] = {}
+            for entry in self.client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    results[entry.custom_id] = entry.result.message
+                elif entry.result.type == "errored":
+                    results[entry.custom_id] = BatchRequestError(
+                        f"Batch request failed: {entry.result.error.error.message}"
+                    )
+                else:
+                    results[entry.custom_id] = BatchRequestError(
+                        f"Batch request was {entry.result.type}"
+                    )
+            return results
+
+        return await asyncio.to_thread(read_results)
+
+
 class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     """
     The basic building block of agentic systems is an LLM enhanced with augmentations
@@ -110,6 +156,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         responses: List[Message] = []
         model = await self.select_model(params)
+        use_batch_api = self.should_use_batch_api(params, bool(available_tools))
 
         for i in range(params.max_iterations):
             arguments = {
@@ -129,12 +176,14 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 data=messages,
             )
 
-            executor_result = await self.executor.execute(
-                anthropic.messages.create, **arguments
+            response = await self.call_provider(
+                model,
+                anthropic.messages.create,
+                params,
+                use_batch_api=use_batch_api,
+                **arguments,
             )
 
-            response = executor_result[0]
-
             logger.debug(
                 f"Iteration {i}: {model} response:",
                 data=response,
@@ -199,8 +248,14 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         logger.debug("Final response:", data=responses)
 
+        llm_iterations.record(len(responses), provider=self.provider)
         return responses
 
+    def get_batch_backend(self) -> BatchBackend | None:
+        return AnthropicBatchBackend(
+            Anthropic(api_key=self.context.config.anthropic.api_key)
+        )
+
     async def generate_str(
         self,
         message,
@@ -506,3 +561,11 @@ def to_string(obj: BaseModel | dict) -> str:
 def typed_dict_extras(d: dict, exclude: List[str]):
     extras = {k: v for k, v in d.items() if k not in exclude}
     return extras
+
+
+# Lets durable executors (e.g. Temporal workers) make Anthropic requests outside of an LLM instance
+register_provider_request(
+    "Anthropic",
+    lambda context: Anthropic(api_key=context.config.anthropic.api_key).messages.create,
+    Message,
+)
@@ -1,9 +1,11 @@
+import asyncio
 import json
-from typing import Iterable, List, Type
+from typing import Any, Dict, Iterable, List, Type
 
 import instructor
 from openai import OpenAI
 from openai.types.chat import (
+    ChatCompletion,
     ChatCompletionAssistantMessageParam,
     ChatCompletionContentPartParam,
     ChatCompletionContentPartTextParam,
@@ -26,6 +28,7 @@ from mcp.types import (
     TextResourceContents,
 )
 
+from mcp_agent.executor.scheduler import scheduling_context
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     ModelT,
@@ -33,12 +36,90 @@ from mcp_agent.workflows.llm.augmented_llm import (
     MCPMessageResult,
     ProviderToMCPConverter,
     RequestParams,
+    llm_iterations,
+    register_provider_request,
 )
+from mcp_agent.workflows.llm.batch import BatchBackend, BatchRequestError
 from mcp_agent.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class OpenAIBatchBackend(BatchBackend):
+    """Submits chat completion requests through the OpenAI Batch API."""
+
+    ENDPOINT = "/v1/chat/completions"
+
+    def __init__(self, client: OpenAI):
+        self.client = client
+
+    async def submit(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        def to_json(obj: Any):
+            # Messages returned by the API (e.g. ChatCompletionMessage) are pydantic models
+            if hasattr(obj, "model_dump"):
+                return obj.model_dump(exclude_none=True)
+            return str(obj)
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self.ENDPOINT,
+                    "body": {k: v for k, v in arguments.items() if v is not None},
+                },
+                default=to_json,
+            )
+            for custom_id, arguments in requests.items()
+        ]
+
+        input_file = await asyncio.to_thread(
+            self.client.files.create,
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await asyncio.to_thread(
+            self.client.batches.create,
+            input_file_id=input_file.id,
+            endpoint=self.ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def is_complete(self, batch_id: str) -> bool:
+        batch = await asyncio.to_thread(self.client.batches.retrieve, batch_id)
+        return batch.status in ("completed", "failed", "expired", "cancelled")
+
+    async def get_results(self, batch_id: str) -> Dict[str, Any]:
+        batch = await asyncio.to_thread(self.client.batches.retrieve, batch_id)
+        if batch.status == "failed":
+            raise BatchRequestError(f"Batch {batch_id} failed: {batch.errors}")
+
+        results: Dict[str, Any] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+
+            content = await asyncio.to_thread(self.client.files.content, file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[entry["custom_id"]] = ChatCompletion.model_validate(
+                        response["body"]
+                    )
+                else:
+                    error = entry.get("error") or response.get("body")
+                    results[entry["custom_id"]] = BatchRequestError(
+                        f"Batch request failed: {error}"
+                    )
+
+        return results
+
+
 class OpenAIAugmentedLLM(
     AugmentedLLM[ChatCompletionMessageParam, ChatCompletionMessage]
 ):
@@ -129,6 +210,7 @@ class OpenAIAugmentedLLM(
 
         responses: List[ChatCompletionMessage] = []
         model = await self.select_model(params)
+        use_batch_api = self.should_use_batch_api(params, bool(available_tools))
 
         for i in range(params.max_iterations):
             arguments = {
@@ -151,12 +233,14 @@ class OpenAIAugmentedLLM(
                 data=messages,
             )
 
-            executor_result = await self.executor.execute(
-                openai_client.chat.completions.create, **arguments
+            response = await self.call_provider(
+                model,
+                openai_client.chat.completions.create,
+                params,
+                use_batch_api=use_batch_api,
+                **arguments,
             )
 
-            response = executor_result[0]
-
             logger.debug(
                 f"Iteration {i}: OpenAI ChatCompletion response:",
                 data=response,
@@ -206,10 +290,12 @@ class OpenAIAugmentedLLM(
                     ]
 
                     # Wait for all tool calls to complete
-                    tool_results = await self.executor.execute(*tool_tasks)
-                    logger.debug(
-                        f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
-                    )
+                    with scheduling_context(params.priority, params.fairness_key):
+                        tool_results = await self.executor.execute(*tool_tasks)
+                    if logger.is_enabled_for("debug"):
+                        logger.debug(
+                            f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
+                        )
 
                     # Add non-None results to messages
                     for result in tool_results:
@@ -224,8 +310,12 @@ class OpenAIAugmentedLLM(
         if params.use_history:
             self.history.set(messages)
 
+        llm_iterations.record(len(responses), provider=self.provider)
         return responses
 
+    def get_batch_backend(self) -> BatchBackend | None:
+        return OpenAIBatchBackend(OpenAI(api_key=self.context.config.openai.api_key))
+
     async def generate_str(
         self,
         message,
@@ -548,3 +638,13 @@ def openai_content_to_mcp_content(
 def typed_dict_extras(d: dict, exclude: List[str]):
     extras = {k: v for k, v in d.items() if k not in exclude}
     return extras
+
+
+# Lets durable executors (e.g. Temporal workers) make OpenAI requests outside of an LLM instance
+register_provider_request(
+    "OpenAI",
+    lambda context: (
+        OpenAI(api_key=context.config.openai.api_key).chat.completions.create
+    ),
+    ChatCompletion,
+)
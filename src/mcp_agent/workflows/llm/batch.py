@@ -0,0 +1,210 @@
+"""
+Batch-API execution for offline LLM workloads (evaluations, bulk classification, ...).
+
+Requests made with `RequestParams(use_batch_api=True)` are collected per provider/model
+by the context's BatchProcessor, submitted together through the provider's batch
+endpoint (e.g. Anthropic Message Batches, OpenAI Batch), and the original awaitables
+are resolved once the batch has been processed. Batch endpoints are slower but cheaper
+than interactive calls, so only single-iteration requests are batched; multi-iteration
+tool loops fall back to interactive calls.
+
+The LocalBatchBackend runs each request through the interactive API instead of a
+batch endpoint, which makes it a stand-in for tests and local development.
+"""
+
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Tuple
+
+from mcp_agent.config import BatchSettings
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchRequestError(Exception):
+    """Raised for a request that the provider failed to process as part of a batch."""
+
+
+class BatchBackend(ABC):
+    """Submits requests through a provider's batch endpoint."""
+
+    @abstractmethod
+    async def submit(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Submit a batch of requests, keyed by custom id.
+        Each request holds the arguments of the equivalent interactive call.
+        Returns the id of the batch.
+        """
+
+    @abstractmethod
+    async def is_complete(self, batch_id: str) -> bool:
+        """Check whether the provider has finished processing the batch."""
+
+    @abstractmethod
+    async def get_results(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Get the results of a completed batch, keyed by custom id.
+        Failed requests map to an exception instead of a response.
+        """
+
+
+class LocalBatchBackend(BatchBackend):
+    """
+    Stand-in for a provider batch endpoint that runs every request through
+    the given (interactive) request function when the batch is submitted.
+    """
+
+    def __init__(self, request: Callable[..., Any]):
+        self.request = request
+        self._batches: Dict[str, Dict[str, Any]] = {}
+
+    async def submit(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        async def run(arguments: Dict[str, Any]) -> Any:
+            try:
+                if asyncio.iscoroutinefunction(self.request):
+                    return await self.request(**arguments)
+                result = await asyncio.to_thread(self.request, **arguments)
+                if asyncio.iscoroutine(result):
+                    return await result
+                return result
+            except Exception as e:
+                return e
+
+        results = await asyncio.gather(*(run(args) for args in requests.values()))
+
+        batch_id = f"local_batch_{uuid.uuid4().hex}"
+        self._batches[batch_id] = dict(zip(requests.keys(), results))
+        return batch_id
+
+    async def is_complete(self, batch_id: str) -> bool:
+        return batch_id in self._batches
+
+    async def get_results(self, batch_id: str) -> Dict[str, Any]:
+        return self._batches.pop(batch_id)
+
+
+class _BatchQueue:
+    """Requests waiting to be submitted together to one provider/model."""
+
+    def __init__(self, backend: BatchBackend):
+        self.backend = backend
+        self.pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self.flush_handle: asyncio.TimerHandle | None = None
+
+
+class BatchProcessor:
+    """
+    Collects requests per provider/model and submits them through batch endpoints.
+    A batch is submitted once it reaches `max_batch_size` requests, or `max_wait_seconds`
+    after its first request was queued, whichever comes first.
+
+    Example:
+        response = await processor.submit(
+            "Anthropic/claude-3-5-sonnet-latest",
+            AnthropicBatchBackend(client),
+            arguments,
+        )
+    """
+
+    def __init__(self, settings: BatchSettings | None = None):
+        self.settings = settings or BatchSettings()
+        self._queues: Dict[str, _BatchQueue] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(
+        self, key: str, backend: BatchBackend, arguments: Dict[str, Any]
+    ) -> Any:
+        """
+        Queue a request for the batch identified by `key` (e.g. provider/model),
+        and wait for its response.
+        """
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = _BatchQueue(backend)
+            self._queues[key] = queue
+
+        future = asyncio.get_running_loop().create_future()
+        queue.pending.append((f"req_{uuid.uuid4().hex}", arguments, future))
+
+        if len(queue.pending) >= self.settings.max_batch_size:
+            self._flush(key)
+        elif queue.flush_handle is None:
+            queue.flush_handle = asyncio.get_running_loop().call_later(
+                self.settings.max_wait_seconds, self._flush, key
+            )
+
+        return await future
+
+    async def flush(self):
+        """Submit all queued requests and wait for every in-progress batch to complete."""
+        for key in list(self._queues.keys()):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def close(self):
+        """Cancel all queued and in-progress batches."""
+        for queue in self._queues.values():
+            if queue.flush_handle:
+                queue.flush_handle.cancel()
+            for _, _, future in queue.pending:
+                future.cancel()
+        self._queues.clear()
+
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self, key: str):
+        queue = self._queues.pop(key, None)
+        if queue is None:
+            return
+        if queue.flush_handle:
+            queue.flush_handle.cancel()
+
+        task = asyncio.create_task(self._run_batch(key, queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, key: str, queue: _BatchQueue):
+        futures = {custom_id: future for custom_id, _, future in queue.pending}
+        try:
+            batch_id = await queue.backend.submit(
+                {custom_id: arguments for custom_id, arguments, _ in queue.pending}
+            )
+            logger.info(
+                f"Submitted batch {batch_id} for {key}",
+                data={"requests": len(futures)},
+            )
+
+            while not await queue.backend.is_complete(batch_id):
+                await asyncio.sleep(self.settings.poll_interval_seconds)
+
+            results = await queue.backend.get_results(batch_id)
+            logger.info(f"Batch {batch_id} for {key} completed")
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Batch for {key} failed: {e}")
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for custom_id, future in futures.items():
+            if future.done():
+                continue
+            result = results.get(custom_id)
+            if result is None:
+                future.set_exception(
+                    BatchRequestError(f"No result for request {custom_id} in batch")
+                )
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,4 +1,6 @@
+import functools
 import json
+import re
 from difflib import SequenceMatcher
 from importlib import resources
 from typing import Dict, List
@@ -8,6 +10,12 @@ from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from mcp.types import ModelHint, ModelPreferences
 
+CACHE_READ_COST_FACTOR = 0.1
+"""Cost of prompt cache reads relative to input tokens, for models without cache pricing"""
+
+CACHE_WRITE_COST_FACTOR = 1.25
+"""Cost of prompt cache writes relative to input tokens, for models without cache pricing"""
+
 
 class ModelBenchmarks(BaseModel):
     """
@@ -64,6 +72,54 @@ class ModelCost(BaseModel):
     Cost per 1M output tokens.
     """
 
+    cache_read_cost_per_1m: float | None = None
+    """
+    Cost per 1M input tokens read from the prompt cache
+    (CACHE_READ_COST_FACTOR times the input cost if unknown).
+    """
+
+    cache_write_cost_per_1m: float | None = None
+    """
+    Cost per 1M input tokens written to the prompt cache
+    (CACHE_WRITE_COST_FACTOR times the input cost if unknown).
+    """
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float | None:
+        """
+        Estimate the cost of a request from its token usage, where `input_tokens`
+        includes the tokens read from and written to the prompt cache.
+        Uses the input/output costs if known, otherwise the blended cost.
+        """
+        if self.input_cost_per_1m is not None and self.output_cost_per_1m is not None:
+            input_cost, output_cost = self.input_cost_per_1m, self.output_cost_per_1m
+        elif self.blended_cost_per_1m is not None:
+            input_cost = output_cost = self.blended_cost_per_1m
+        else:
+            return None
+
+        cache_read_cost = self.cache_read_cost_per_1m
+        if cache_read_cost is None:
+            cache_read_cost = input_cost * CACHE_READ_COST_FACTOR
+        cache_write_cost = self.cache_write_cost_per_1m
+        if cache_write_cost is None:
+            cache_write_cost = input_cost * CACHE_WRITE_COST_FACTOR
+
+        uncached_input_tokens = max(
+            0, input_tokens - cache_read_tokens - cache_write_tokens
+        )
+        return (
+            uncached_input_tokens * input_cost
+            + cache_read_tokens * cache_read_cost
+            + cache_write_tokens * cache_write_cost
+            + output_tokens * output_cost
+        ) / 1_000_000
+
 
 class ModelMetrics(BaseModel):
     """
@@ -120,6 +176,38 @@ class ModelSelector:
 
         self.max_values = self._calculate_max_scores(self.models)
         self.models_by_provider = self._models_by_provider(self.models)
+        self._model_lookup_cache: Dict[tuple[str, str | None], ModelInfo | None] = {}
+
+    def find_model(self, name: str, provider: str | None = None) -> ModelInfo | None:
+        """
+        Find the info of a model by the name used in provider requests.
+        Names are matched exactly first, then ignoring punctuation and version suffixes
+        (e.g. "claude-3-5-sonnet-20241022" matches "claude-35-sonnet").
+        """
+        key = (name, provider)
+        if key not in self._model_lookup_cache:
+            models = self.models_by_provider.get(provider, []) if provider else []
+            self._model_lookup_cache[key] = _find_model(name, models) or _find_model(
+                name, self.models
+            )
+        return self._model_lookup_cache[key]
+
+    def estimate_cost(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        provider: str | None = None,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float | None:
+        """Estimate the cost of a request to a model, or None if its pricing is unknown."""
+        model_info = self.find_model(model, provider)
+        if model_info is None:
+            return None
+        return model_info.metrics.cost.estimate_cost(
+            input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+        )
 
     def select_best_model(
         self, model_preferences: ModelPreferences, provider: str | None = None
@@ -319,6 +407,12 @@ def load_default_models() -> List[ModelInfo]:
     """
     We use ArtificialAnalysis benchmarks for determining the best model.
     """
+    return list(_load_default_models())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_models() -> tuple[ModelInfo, ...]:
+    # Parsed once per process: every LLM without a context model selector creates one
     with (
         resources.files("mcp_agent.data")
         .joinpath("artificial_analysis_llm_benchmarks.json")
@@ -326,7 +420,25 @@ def load_default_models() -> List[ModelInfo]:
     ):
         data = json.load(file)  # Array of ModelInfo objects
         adapter = TypeAdapter(List[ModelInfo])
-        return adapter.validate_python(data)
+        return tuple(adapter.validate_python(data))
+
+
+def _normalize_model_name(name: str) -> str:
+    # Drop date/version suffixes (e.g. -20241022, -2024-08-06, -latest) and punctuation
+    name = re.sub(r"-(\d{8}|\d{4}-\d{2}-\d{2}|latest)$", "", name.lower())
+    return re.sub(r"[^a-z0-9]", "", name)
+
+
+def _find_model(name: str, models: List[ModelInfo]) -> ModelInfo | None:
+    for model in models:
+        if model.name == name:
+            return model
+
+    normalized = _normalize_model_name(name)
+    for model in models:
+        if _normalize_model_name(model.name) == normalized:
+            return model
+    return None
 
 
 def _fuzzy_match(str1: str, str2: str, threshold: float = 0.8) -> bool:
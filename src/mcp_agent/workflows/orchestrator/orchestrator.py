@@ -10,7 +10,14 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from opentelemetry import trace
+
 from mcp_agent.agents.agent import Agent
+from mcp_agent.executor.checkpoint import (
+    get_checkpoint_scope,
+    load_checkpoint,
+    stable_hash,
+)
 from mcp_agent.workflows.llm.augmented_llm import (
     AugmentedLLM,
     MessageParamT,
@@ -22,6 +29,7 @@ from mcp_agent.workflows.orchestrator.orchestrator_models import (
     format_plan_result,
     format_step_result,
     NextStep,
+    OrchestratorCheckpoint,
     Plan,
     PlanResult,
     Step,
@@ -173,19 +181,75 @@ class Orchestrator(AugmentedLLM[MessageParamT, MessageT]):
         )
 
         plan_result = PlanResult(objective=objective, step_results=[])
+        remaining_steps: List[Step] = []
+
+        # With checkpoints enabled, resume from the last completed step of this objective
+        store = self.context.checkpoint_store
+        scope = get_checkpoint_scope()
+        checkpoint_key = None
+        if store and scope:
+            checkpoint_key = scope.next_key(f"orchestrator:{stable_hash(objective)}")
+            try:
+                checkpoint = await load_checkpoint(
+                    store, scope.workflow_id, checkpoint_key, OrchestratorCheckpoint
+                )
+                plan_result = checkpoint.plan_result
+                iterations = checkpoint.iterations
+                remaining_steps = checkpoint.remaining_steps
+                logger.debug(
+                    f"Resuming orchestrator from iteration {iterations}",
+                    data={"workflow_id": scope.workflow_id},
+                )
+            except KeyError:
+                pass
+
+            if plan_result.is_complete and plan_result.result is not None:
+                return plan_result
+
+        async def save_checkpoint():
+            if checkpoint_key:
+                await store.save(
+                    scope.workflow_id,
+                    checkpoint_key,
+                    OrchestratorCheckpoint(
+                        plan_result=plan_result,
+                        iterations=iterations,
+                        remaining_steps=remaining_steps,
+                    ),
+                )
 
+        tracer = self.context.tracer or trace.get_tracer(__name__)
         while iterations < params.max_iterations:
-            if self.plan_type == "iterative":
+            if remaining_steps:
+                # Finish the plan that was interrupted before planning again
+                plan = plan_result.plan
+            elif self.plan_type == "iterative":
                 # Get next plan/step
-                next_step = await self._get_next_step(
-                    objective=objective, plan_result=plan_result, model=params.model
-                )
+                with tracer.start_as_current_span(
+                    "orchestrator plan",
+                    attributes={
+                        "mcp_agent.orchestrator.plan_type": self.plan_type,
+                        "mcp_agent.orchestrator.iteration": iterations,
+                    },
+                ):
+                    next_step = await self._get_next_step(
+                        objective=objective, plan_result=plan_result, model=params.model
+                    )
                 logger.debug(f"Iteration {iterations}: Iterative plan:", data=next_step)
                 plan = Plan(steps=[next_step], is_complete=next_step.is_complete)
             elif self.plan_type == "full":
-                plan = await self._get_full_plan(
-                    objective=objective, plan_result=plan_result, request_params=params
-                )
+                with tracer.start_as_current_span(
+                    "orchestrator plan",
+                    attributes={
+                        "mcp_agent.orchestrator.plan_type": self.plan_type,
+                        "mcp_agent.orchestrator.iteration": iterations,
+                    },
+                ):
+                    plan = await self._get_full_plan(
+                        objective=objective,
+                        plan_result=plan_result,
+                        request_params=params,
+                    )
                 logger.debug(f"Iteration {iterations}: Full Plan:", data=plan)
             else:
                 raise ValueError(f"Invalid plan type {self.plan_type}")
@@ -200,28 +264,45 @@ class Orchestrator(AugmentedLLM[MessageParamT, MessageT]):
                     plan_result=format_plan_result(plan_result)
                 )
 
-                plan_result.result = await self.planner.generate_str(
-                    message=synthesis_prompt,
-                    request_params=params.model_copy(update={"max_iterations": 1}),
-                )
+                with tracer.start_as_current_span("orchestrator synthesize"):
+                    plan_result.result = await self.planner.generate_str(
+                        message=synthesis_prompt,
+                        request_params=params.model_copy(update={"max_iterations": 1}),
+                    )
 
+                await save_checkpoint()
                 return plan_result
 
+            if not remaining_steps:
+                remaining_steps = list(plan.steps)
+
             # Execute each step, collecting results
             # Note that in iterative mode this will only be a single step
-            for step in plan.steps:
-                step_result = await self._execute_step(
-                    step=step,
-                    previous_result=plan_result,
-                    request_params=params,
-                )
+            while remaining_steps:
+                step = remaining_steps[0]
+                with tracer.start_as_current_span(
+                    "orchestrator step",
+                    attributes={
+                        "mcp_agent.orchestrator.iteration": iterations,
+                        "mcp_agent.orchestrator.step": step.description,
+                        "mcp_agent.orchestrator.tasks": len(step.tasks),
+                    },
+                ):
+                    step_result = await self._execute_step(
+                        step=step,
+                        previous_result=plan_result,
+                        request_params=params,
+                    )
 
                 plan_result.add_step_result(step_result)
+                remaining_steps.pop(0)
+                await save_checkpoint()
 
             logger.debug(
                 f"Iteration {iterations}: Intermediate plan result:", data=plan_result
             )
             iterations += 1
+            await save_checkpoint()
 
         raise RuntimeError(
             f"Task failed to complete in {params.max_iterations} iterations"
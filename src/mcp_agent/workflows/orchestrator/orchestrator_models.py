@@ -116,6 +116,19 @@ class NextStep(Step):
     )
 
 
+class OrchestratorCheckpoint(BaseModel):
+    """Progress of an orchestrator run, checkpointed so that it can be resumed"""
+
+    plan_result: PlanResult
+    """Results of the steps completed so far"""
+
+    iterations: int = 0
+    """Number of planning iterations completed"""
+
+    remaining_steps: List[Step] = Field(default_factory=list)
+    """Steps of the current plan that haven't been executed yet"""
+
+
 def format_task_result(task_result: TaskWithResult) -> str:
     """Format a task result for display to planners"""
     return TASK_RESULT_TEMPLATE.format(
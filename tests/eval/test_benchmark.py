@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.eval.benchmark import (
+    BenchmarkReport,
+    BenchmarkResult,
+    LatencyStats,
+    compare,
+    measure,
+)
+
+
+def make_result(
+    name: str = "generate",
+    throughput: float = 100.0,
+    p50: float = 0.01,
+    p99: float = 0.05,
+    errors: int = 0,
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        iterations=100,
+        errors=errors,
+        duration_seconds=1.0,
+        throughput=throughput,
+        latency=LatencyStats(count=100, p50=p50, p99=p99),
+    )
+
+
+def make_report(*results: BenchmarkResult) -> BenchmarkReport:
+    return BenchmarkReport(results={result.name: result for result in results})
+
+
+def test_changes_within_the_tolerance_are_not_regressions():
+    baseline = make_report(make_result())
+    report = make_report(make_result(throughput=80.0, p50=0.012, p99=0.06))
+    assert compare(report, baseline, tolerance=0.25) == []
+
+
+def test_regressions_beyond_the_tolerance_are_reported():
+    baseline = make_report(make_result())
+    report = make_report(make_result(throughput=50.0, p99=0.1, errors=2))
+
+    regressions = compare(report, baseline, tolerance=0.25)
+    assert [(r.metric, r.baseline, r.current) for r in regressions] == [
+        ("errors", 0, 2),
+        ("throughput", 100.0, 50.0),
+        ("latency.p99", 0.05, 0.1),
+    ]
+    assert regressions[1].change == pytest.approx(-0.5)
+    assert regressions[2].change == pytest.approx(1.0)
+
+
+def test_small_absolute_latency_increases_are_ignored_as_noise():
+    baseline = make_report(make_result(p50=0.0001, p99=0.0002))
+    report = make_report(make_result(p50=0.001, p99=0.002))
+    assert compare(report, baseline) == []
+    assert [
+        r.metric for r in compare(report, baseline, min_latency_delta_seconds=0)
+    ] == [
+        "latency.p50",
+        "latency.p99",
+    ]
+
+
+def test_benchmarks_missing_from_either_report_are_skipped():
+    baseline = make_report(make_result("old"), make_result("shared"))
+    report = make_report(make_result("new", throughput=1.0), make_result("shared"))
+    assert compare(report, baseline) == []
+
+
+def test_reports_round_trip_through_files(tmp_path):
+    report = make_report(make_result())
+    report.settings = {"iterations": 100}
+    report.save(tmp_path / "baseline.json")
+    assert BenchmarkReport.load(tmp_path / "baseline.json") == report
+
+
+def test_measure_counts_latencies_errors_and_concurrency():
+    async def main():
+        calls = 0
+        running = peak = 0
+
+        async def operation():
+            nonlocal calls, running, peak
+            calls += 1
+            call = calls
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            if call % 5 == 0:
+                raise RuntimeError("flaky")
+
+        result = await measure("op", operation, iterations=20, concurrency=4, warmup=0)
+
+        assert (result.iterations, result.concurrency) == (20, 4)
+        assert calls == 20
+        assert peak == 4
+        assert result.errors == 4
+        assert result.latency.count == 16
+        assert result.latency.min <= result.latency.p50 <= result.latency.max
+        assert result.throughput == pytest.approx(16 / result.duration_seconds)
+
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+import asyncio
+import functools
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_agent.app import MCPApp
+from mcp_agent.config import (
+    CheckpointSettings,
+    LoggerSettings,
+    OpenTelemetrySettings,
+    Settings,
+)
+from mcp_agent.executor.checkpoint import (
+    CheckpointScope,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    checkpoint_scope,
+    load_checkpoint,
+)
+from mcp_agent.executor.workflow import Workflow, WorkflowResult
+
+
+def create_app(tmp_path) -> MCPApp:
+    return MCPApp(
+        name="test_checkpoint",
+        settings=Settings(
+            logger=LoggerSettings(type="none"),
+            otel=OpenTelemetrySettings(enabled=False),
+            checkpoint=CheckpointSettings(
+                backend="sqlite", path=str(tmp_path / "checkpoints.db")
+            ),
+        ),
+        human_input_callback=None,
+    )
+
+
+def test_method_tasks_are_checkpointed_and_restored_on_resume(tmp_path):
+    async def main():
+        app = create_app(tmp_path)
+        async with app.run():
+            calls = []
+
+            class SummaryWorkflow(Workflow[str]):
+                @app.workflow_task()
+                async def summarize(self, text: str) -> str:
+                    calls.append(text)
+                    return text.upper()
+
+                async def run(self) -> str:
+                    bound, unbound = await self.executor.execute(
+                        functools.partial(self.summarize, "a"),
+                        functools.partial(SummaryWorkflow.summarize, self, "b"),
+                    )
+                    return bound + unbound
+
+            for _ in range(2):
+                # A new instance and scope for the same workflow id, as after a restart
+                workflow = SummaryWorkflow(executor=app.executor, workflow_id="wf-1")
+                with checkpoint_scope("wf-1"):
+                    assert await workflow.run() == "AB"
+
+            assert sorted(calls) == ["a", "b"]
+            assert len(await app.context.checkpoint_store.load_all("wf-1")) == 2
+
+    asyncio.run(main())
+
+
+class Report(BaseModel):
+    title: str
+    pages: int
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    return FileCheckpointStore(tmp_path / "checkpoints")
+
+
+def test_stores_save_load_and_delete_checkpoints_per_workflow(store):
+    async def main():
+        await store.save("wf-1", "step:a:0", {"value": 1})
+        await store.save("wf-1", "step:b:0", [1, 2])
+        await store.save("wf-2", "step:a:0", "other")
+        await store.save("wf-1", "step:a:0", {"value": 2})
+
+        assert await store.load("wf-1", "step:a:0") == {"value": 2}
+        assert await store.load_all("wf-1") == {
+            "step:a:0": {"value": 2},
+            "step:b:0": [1, 2],
+        }
+        with pytest.raises(KeyError):
+            await store.load("wf-1", "step:c:0")
+
+        await store.delete("wf-1")
+        assert await store.load_all("wf-1") == {}
+        assert await store.load("wf-2", "step:a:0") == "other"
+
+    asyncio.run(main())
+
+
+def test_checkpoints_are_restored_as_the_result_type(store):
+    async def main():
+        await store.save("wf-1", "report", Report(title="Sales", pages=3))
+        report = await load_checkpoint(store, "wf-1", "report", Report)
+        assert report == Report(title="Sales", pages=3)
+
+    asyncio.run(main())
+
+
+def test_repeated_keys_get_their_own_occurrence_in_call_order():
+    scope = CheckpointScope("wf-1")
+    assert [scope.next_key("step:a"), scope.next_key("step:a")] == [
+        "step:a:0",
+        "step:a:1",
+    ]
+    assert scope.next_key("step:b") == "step:b:0"
+
+
+def test_a_failed_run_resumes_after_its_completed_steps(tmp_path):
+    async def main():
+        app = create_app(tmp_path)
+        async with app.run():
+            calls = []
+            crash = True
+
+            async def fetch() -> Report:
+                calls.append("fetch")
+                return Report(title="Sales", pages=3)
+
+            async def write(report: Report) -> str:
+                calls.append("write")
+                if crash:
+                    raise RuntimeError("process died")
+                return f"{report.title}: {report.pages} pages"
+
+            class ReportWorkflow(Workflow[str]):
+                async def run(self) -> WorkflowResult[str]:
+                    report = await self.run_step("fetch", fetch, result_type=Report)
+                    return WorkflowResult(
+                        value=await self.run_step("write", write, report)
+                    )
+
+            run_id = await app.run_manager.start(ReportWorkflow, run_id="report-1")
+            status = await app.run_manager.wait(run_id, timeout_seconds=5)
+            assert status.status == "failed"
+
+            crash = False
+            run_id = await app.run_manager.start(ReportWorkflow, run_id="report-1")
+            status = await app.run_manager.wait(run_id, timeout_seconds=5)
+            assert status.status == "completed"
+            assert status.result.value == "Sales: 3 pages"
+            assert calls == ["fetch", "write", "write"]
+
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.config import ProviderConcurrencySettings
+from mcp_agent.executor.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    get_retry_after,
+    is_rate_limit_error,
+)
+
+
+def test_waiters_keep_their_place_when_the_limit_shrinks_after_waking_them():
+    async def main():
+        limiter = AdaptiveConcurrencyLimiter(
+            ProviderConcurrencySettings(initial_limit=2)
+        )
+        await limiter.acquire()
+        await limiter.acquire()
+
+        admitted = []
+
+        async def call(name: str):
+            await limiter.acquire()
+            admitted.append(name)
+
+        tasks = [asyncio.create_task(call(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        assert limiter.stats()["waiting"] == 3
+
+        # Wakes "a", but the limit shrinks before it gets to run
+        limiter.release()
+        limiter.limit = 1.0
+        await asyncio.sleep(0)
+        assert admitted == []
+
+        for _ in range(3):
+            limiter.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert admitted == ["a", "b", "c"]
+
+    asyncio.run(main())
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers=None):
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.headers = headers or {}
+
+
+def test_limit_grows_by_about_one_per_limit_successful_calls_with_stable_latency():
+    limiter = AdaptiveConcurrencyLimiter(ProviderConcurrencySettings(initial_limit=4))
+    # Each success adds increase_step / limit
+    for _ in range(5):
+        limiter.in_flight += 1
+        limiter.release(latency=0.1)
+    assert int(limiter.limit) == 5
+
+    # Latency far above the baseline stops the growth
+    limit = limiter.limit
+    for _ in range(10):
+        limiter.in_flight += 1
+        limiter.release(latency=1.0)
+    assert limiter.limit < limit + 0.5
+
+
+def test_limit_is_cut_once_per_congestion_event():
+    limiter = AdaptiveConcurrencyLimiter(
+        ProviderConcurrencySettings(initial_limit=8, default_retry_after_seconds=10)
+    )
+    for _ in range(3):
+        limiter.in_flight += 1
+        limiter.release(rate_limited=True)
+
+    assert int(limiter.limit) == 4
+    assert limiter.stats()["blocked_for"] > 9
+
+
+def test_limit_never_drops_below_the_minimum():
+    limiter = AdaptiveConcurrencyLimiter(
+        ProviderConcurrencySettings(initial_limit=2, min_limit=2)
+    )
+    limiter.in_flight += 1
+    limiter.release(rate_limited=True, retry_after=0)
+    assert int(limiter.limit) == 2
+
+
+def test_rate_limited_calls_are_retried_after_the_retry_after_period():
+    async def main():
+        limiter = AdaptiveConcurrencyLimiter(ProviderConcurrencySettings())
+        attempts = []
+
+        async def call():
+            attempts.append(asyncio.get_running_loop().time())
+            if len(attempts) == 1:
+                raise RateLimitError({"retry-after-ms": "50"})
+            return "ok"
+
+        assert await limiter.run(call) == "ok"
+        assert attempts[1] - attempts[0] >= 0.04
+        assert limiter.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_calls_that_stay_rate_limited_fail_after_the_retries():
+    async def main():
+        limiter = AdaptiveConcurrencyLimiter(ProviderConcurrencySettings(max_retries=2))
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            raise RateLimitError({"retry-after": "0"})
+
+        with pytest.raises(RateLimitError):
+            await limiter.run(call)
+        assert attempts == 3
+        assert limiter.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_retry_after_is_read_from_the_error_headers():
+    assert get_retry_after(RateLimitError({"retry-after-ms": "1500"})) == 1.5
+    assert get_retry_after(RateLimitError({"retry-after": "3"})) == 3.0
+    assert get_retry_after(RateLimitError({"retry-after": "soon"})) is None
+    assert get_retry_after(RateLimitError()) is None
+    assert is_rate_limit_error(RateLimitError())
+    assert not is_rate_limit_error(ValueError())
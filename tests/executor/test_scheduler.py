@@ -0,0 +1,49 @@
+import asyncio
+
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+
+
+def test_fan_out_from_within_a_slot_respects_the_limit():
+    async def main():
+        executor = AsyncioExecutor(config=ExecutorConfig(max_concurrent_activities=2))
+        running = 0
+        max_running = 0
+
+        async def leaf():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "leaf"
+
+        async def step():
+            # Fan out from within a task that holds a slot
+            return await executor.execute(*(leaf for _ in range(8)))
+
+        results = await asyncio.wait_for(executor.execute(step, step), timeout=5)
+        assert results == [["leaf"] * 8, ["leaf"] * 8]
+        assert max_running == 2
+        assert executor.scheduler.active == 0
+
+    asyncio.run(main())
+
+
+def test_nested_fan_out_does_not_deadlock_with_a_single_slot():
+    async def main():
+        executor = AsyncioExecutor(config=ExecutorConfig(max_concurrent_activities=1))
+
+        async def leaf():
+            await asyncio.sleep(0)
+            return 1
+
+        async def branch():
+            return sum(await executor.execute(leaf, leaf, leaf))
+
+        async def root():
+            return sum(await executor.execute(branch, branch))
+
+        assert await asyncio.wait_for(executor.execute(root), timeout=5) == [6]
+        assert executor.scheduler.active == 0
+
+    asyncio.run(main())
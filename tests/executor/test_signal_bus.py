@@ -0,0 +1,130 @@
+import asyncio
+import os
+import shutil
+import time
+
+import pytest
+
+from mcp_agent.executor.signal_bus import DistributedSignalHandler, FileSignalBackend
+from mcp_agent.executor.workflow_signal import Signal
+
+
+def create_handler(path) -> DistributedSignalHandler:
+    return DistributedSignalHandler(FileSignalBackend(path, poll_interval_seconds=0.01))
+
+
+async def wait_until(condition, timeout: float = 5):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_handlers_receive_broadcast_signals_without_a_waiter(tmp_path):
+    async def main():
+        sender, receiver = create_handler(tmp_path), create_handler(tmp_path)
+        received = []
+
+        @receiver.on_signal("config_changed")
+        async def on_config_changed(signal):
+            received.append(signal.payload)
+
+        await receiver._handler_subscription
+        assert await sender.signal(Signal(name="config_changed", payload="v2")) == 1
+        await wait_until(lambda: received)
+        assert received == ["v2"]
+
+        await sender.close()
+        await receiver.close()
+
+    asyncio.run(main())
+
+
+class ApprovalSignal(Signal[bool]):
+    pass
+
+
+def test_signals_reach_the_waiting_process_of_their_workflow(tmp_path):
+    async def main():
+        sender, receiver = create_handler(tmp_path), create_handler(tmp_path)
+        waiter = asyncio.create_task(
+            receiver.wait_for_signal(
+                ApprovalSignal(name="approval", workflow_id="wf-1"), timeout_seconds=5
+            )
+        )
+        await wait_until(lambda: receiver._subscriptions)
+
+        signal = ApprovalSignal(name="approval", workflow_id="wf-2", payload=False)
+        assert await sender.signal(signal) == 0
+        signal = ApprovalSignal(name="approval", workflow_id="wf-1", payload=True)
+        assert await sender.signal(signal) == 1
+
+        assert await waiter is True
+        assert receiver._subscriptions == {}
+        assert not receiver.backend._channel_path(receiver.get_channel("wf-1")).exists()
+
+        await sender.close()
+        await receiver.close()
+
+    asyncio.run(main())
+
+
+def test_waiting_for_an_unsent_signal_times_out(tmp_path):
+    async def main():
+        handler = create_handler(tmp_path)
+        with pytest.raises(TimeoutError):
+            await handler.wait_for_signal(
+                ApprovalSignal(name="approval", workflow_id="wf-1"),
+                timeout_seconds=0.05,
+            )
+        assert handler._subscriptions == {}
+        await handler.close()
+
+    asyncio.run(main())
+
+
+def test_publishers_remove_inboxes_that_stopped_polling(tmp_path):
+    async def main():
+        backend = FileSignalBackend(tmp_path, stale_after_seconds=30)
+        received = []
+
+        async def on_message(message):
+            received.append(message)
+
+        await backend.subscribe("channel", on_message)
+        await backend.close()
+        # Left behind by a subscriber that crashed a minute ago
+        stale_inbox = backend._inbox_path("channel")
+        stale_inbox.mkdir(parents=True)
+        stale = time.time() - 60
+        os.utime(stale_inbox, (stale, stale))
+
+        assert await backend.publish("channel", {"value": 1}) == 0
+        assert not stale_inbox.exists()
+        assert received == []
+
+    asyncio.run(main())
+
+
+def test_subscribers_recreate_inboxes_removed_as_stale(tmp_path):
+    async def main():
+        subscriber = FileSignalBackend(tmp_path, poll_interval_seconds=0.01)
+        publisher = FileSignalBackend(tmp_path)
+        received = []
+
+        async def on_message(message):
+            received.append(message)
+
+        await subscriber.subscribe("channel", on_message)
+        inbox = subscriber._inbox_path("channel")
+        # As a publisher does after the subscriber paused for too long
+        shutil.rmtree(inbox)
+
+        await wait_until(inbox.exists)
+        assert await publisher.publish("channel", {"value": 2}) == 1
+        await wait_until(lambda: received)
+        assert received == [{"value": 2}]
+
+        await subscriber.close()
+        assert not subscriber._channel_path("channel").exists()
+
+    asyncio.run(main())
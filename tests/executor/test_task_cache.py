@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_agent.config import TaskCacheSettings
+from mcp_agent.executor import task_cache
+from mcp_agent.executor.task_cache import (
+    DiskTaskCache,
+    MemoryTaskCache,
+    SQLiteTaskCache,
+    cached_task,
+    create_task_cache,
+)
+
+
+class Summarizer:
+    def __init__(self):
+        self.calls = 0
+
+    async def summarize(self, text: str) -> str:
+        self.calls += 1
+        return text.upper()
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message, **kwargs):
+        self.warnings.append(message)
+
+    def debug(self, message, **kwargs):
+        pass
+
+
+def test_method_tasks_are_cached_by_their_arguments_without_self():
+    async def main():
+        cache = MemoryTaskCache()
+        summarize = cached_task(Summarizer.summarize, "summarize", lambda: cache)
+        first, second = Summarizer(), Summarizer()
+
+        assert await summarize(first, "doc") == "DOC"
+        assert await summarize(second, "doc") == "DOC"
+        assert await summarize(second, "other") == "OTHER"
+        assert (first.calls, second.calls) == (1, 1)
+
+    asyncio.run(main())
+
+
+def test_unhashable_arguments_bypass_the_cache_with_one_warning(monkeypatch):
+    logger = RecordingLogger()
+    monkeypatch.setattr(task_cache, "logger", logger)
+
+    async def main():
+        calls = 0
+
+        async def describe(value: object) -> str:
+            nonlocal calls
+            calls += 1
+            return "described"
+
+        cache = MemoryTaskCache()
+        cached_describe = cached_task(describe, "describe", lambda: cache)
+        for _ in range(3):
+            assert await cached_describe(object()) == "described"
+
+        assert calls == 3
+        assert len(logger.warnings) == 1
+
+    asyncio.run(main())
+
+
+class Forecast(BaseModel):
+    city: str
+    high: float
+
+
+def make_cache(backend: str, tmp_path, **kwargs):
+    if backend == "memory":
+        return MemoryTaskCache(**kwargs)
+    elif backend == "disk":
+        return DiskTaskCache(tmp_path / "task_cache", **kwargs)
+    return SQLiteTaskCache(tmp_path / "task_cache.db", **kwargs)
+
+
+@pytest.mark.parametrize("backend", ["memory", "disk", "sqlite"])
+def test_results_are_returned_as_the_result_type(backend, tmp_path):
+    async def main():
+        cache = make_cache(backend, tmp_path)
+        await cache.set("forecast:1", Forecast(city="Oslo", high=12.5))
+
+        assert await cache.get("forecast:1", Forecast) == Forecast(
+            city="Oslo", high=12.5
+        )
+        with pytest.raises(KeyError):
+            await cache.get("forecast:2", Forecast)
+
+        await cache.delete("forecast:1")
+        with pytest.raises(KeyError):
+            await cache.get("forecast:1")
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("backend", ["memory", "disk", "sqlite"])
+def test_expired_results_are_misses_unless_the_ttl_is_overridden(backend, tmp_path):
+    async def main():
+        cache = make_cache(backend, tmp_path, ttl_seconds=0)
+        await cache.set("expired", 1)
+        await cache.set("kept", 2, ttl_seconds=60)
+
+        with pytest.raises(KeyError):
+            await cache.get("expired")
+        assert await cache.get("kept") == 2
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_least_recently_used_results_are_evicted(backend, tmp_path):
+    async def main():
+        cache = make_cache(backend, tmp_path, max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        with pytest.raises(KeyError):
+            await cache.get("b")
+
+    asyncio.run(main())
+
+
+def test_disk_cache_evicts_below_its_capacity(tmp_path):
+    async def main():
+        cache = make_cache("disk", tmp_path, max_entries=10)
+        for i in range(11):
+            await cache.set(f"key-{i}", i)
+
+        assert len(list(cache.path.glob("*.json"))) <= 10
+        assert await cache.get("key-10") == 10
+
+        await cache.clear()
+        assert list(cache.path.glob("*.json")) == []
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("backend", ["disk", "sqlite"])
+def test_persistent_caches_share_results_across_instances(backend, tmp_path):
+    async def main():
+        await make_cache(backend, tmp_path).set("key", {"value": 1})
+        assert await make_cache(backend, tmp_path).get("key") == {"value": 1}
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "backend, cache_type",
+    [("memory", MemoryTaskCache), ("disk", DiskTaskCache), ("sqlite", SQLiteTaskCache)],
+)
+def test_create_task_cache_uses_the_configured_backend(backend, cache_type, tmp_path):
+    settings = TaskCacheSettings(
+        backend=backend, path=str(tmp_path / "cache"), max_entries=5, ttl_seconds=30
+    )
+    cache = create_task_cache(settings)
+    assert isinstance(cache, cache_type)
+    assert (cache.max_entries, cache.ttl_seconds) == (5, 30)
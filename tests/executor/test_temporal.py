@@ -0,0 +1,47 @@
+import asyncio
+
+from mcp_agent.app import MCPApp
+from mcp_agent.config import (
+    LoggerSettings,
+    OpenTelemetrySettings,
+    Settings,
+    TemporalSettings,
+)
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+
+def create_app() -> MCPApp:
+    return MCPApp(
+        name="test_temporal",
+        settings=Settings(
+            execution_engine="temporal",
+            temporal=TemporalSettings(host="localhost:7233", task_queue="test"),
+            logger=LoggerSettings(type="none"),
+            otel=OpenTelemetrySettings(enabled=False),
+        ),
+        human_input_callback=None,
+    )
+
+
+def test_tool_activity_aggregators_belong_to_the_worker(monkeypatch):
+    closed = []
+
+    async def close(self):
+        closed.append(tuple(self.server_names))
+
+    monkeypatch.setattr(MCPAggregator, "close", close)
+
+    async def main():
+        app = create_app()
+        async with app.run():
+            executor = app.executor
+            aggregator = executor.get_aggregator(["fetch", "filesystem"])
+            assert executor.get_aggregator(["fetch", "filesystem"]) is aggregator
+            assert executor.get_aggregator(["fetch"]) is not aggregator
+            assert aggregator.context is app.context
+
+            await executor.close_aggregators()
+            assert sorted(closed) == [("fetch",), ("fetch", "filesystem")]
+            assert executor.get_aggregator(["fetch"]) is not aggregator
+
+    asyncio.run(main())
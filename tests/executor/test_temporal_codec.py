@@ -0,0 +1,105 @@
+import asyncio
+import os
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from mcp_agent.config import TemporalPayloadCodecSettings
+from mcp_agent.executor.temporal_codec import (
+    BLOB_REFERENCE_ENCODING,
+    ZLIB_ENCODING,
+    CompactingPayloadCodec,
+    LocalFileBlobStore,
+)
+
+
+def make_payload(data: bytes) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=data)
+
+
+def create_codec(tmp_path, **settings) -> CompactingPayloadCodec:
+    return CompactingPayloadCodec(
+        TemporalPayloadCodecSettings(
+            compression_threshold_bytes=100,
+            offload_threshold_bytes=1000,
+            blob_store_path=str(tmp_path / "blobs"),
+            **settings,
+        )
+    )
+
+
+def round_trip(codec: CompactingPayloadCodec, payload: Payload):
+    async def main():
+        [encoded] = await codec.encode([payload])
+        [decoded] = await codec.decode([encoded])
+        return encoded, decoded
+
+    return asyncio.run(main())
+
+
+def test_small_payloads_are_left_untouched(tmp_path):
+    payload = make_payload(b'"short"')
+    encoded, decoded = round_trip(create_codec(tmp_path), payload)
+    assert encoded == payload
+    assert decoded == payload
+
+
+def test_compressible_payloads_are_compressed_inline(tmp_path):
+    payload = make_payload(b'"' + b"a" * 5000 + b'"')
+    encoded, decoded = round_trip(create_codec(tmp_path), payload)
+    assert encoded.metadata["encoding"] == ZLIB_ENCODING
+    assert len(encoded.data) < 1000
+    assert decoded == payload
+
+
+def test_large_payloads_are_offloaded_to_the_blob_store_once(tmp_path):
+    payload = make_payload(os.urandom(5000))
+    codec = create_codec(tmp_path)
+    encoded, decoded = round_trip(codec, payload)
+
+    assert encoded.metadata["encoding"] == BLOB_REFERENCE_ENCODING
+    assert len(encoded.data) == 64
+    assert decoded == payload
+
+    # Content-addressed: encoding the same payload again stores no new blob
+    round_trip(codec, payload)
+    assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # one directory, one blob
+
+
+def test_blobs_are_read_from_the_store_by_another_codec(tmp_path):
+    payload = make_payload(os.urandom(5000))
+    encoded, _ = round_trip(create_codec(tmp_path), payload)
+
+    reader = create_codec(tmp_path)
+
+    async def main():
+        return await reader.decode([encoded])
+
+    assert asyncio.run(main()) == [payload]
+    assert reader._cache_size > 0
+
+
+def test_blob_references_need_a_blob_store(tmp_path):
+    encoded, _ = round_trip(create_codec(tmp_path), make_payload(os.urandom(5000)))
+    codec = CompactingPayloadCodec(TemporalPayloadCodecSettings(blob_store_path=None))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(codec.decode([encoded]))
+
+
+def test_the_blob_cache_is_bounded(tmp_path):
+    codec = create_codec(tmp_path, cache_size_bytes=12000)
+    for _ in range(5):
+        round_trip(codec, make_payload(os.urandom(5000)))
+    assert len(codec._cache) == 2
+    assert codec._cache_size <= 12000
+
+
+def test_local_blob_store_round_trip(tmp_path):
+    async def main():
+        store = LocalFileBlobStore(tmp_path)
+        key = await store.put(b"data")
+        assert await store.put(b"data") == key
+        assert await store.get(key) == b"data"
+
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.config import TokenRateLimitSettings
+from mcp_agent.executor.token_limiter import TokenBucket, TokenRateLimiter
+
+
+def make_response(input_tokens: int, output_tokens: int):
+    return SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens)
+    )
+
+
+def create_limiter(**tokens_per_minute) -> TokenRateLimiter:
+    return TokenRateLimiter(
+        TokenRateLimitSettings(tokens_per_minute=tokens_per_minute, chars_per_token=1)
+    )
+
+
+def available_tokens(limiter: TokenRateLimiter, name: str) -> int:
+    # The bucket keeps refilling (by ~17 tokens per second here) while the test runs
+    return limiter.stats()[name]["available_tokens"]
+
+
+def test_the_most_specific_budget_applies():
+    limiter = TokenRateLimiter(
+        TokenRateLimitSettings(
+            tokens_per_minute={"Anthropic": 1000, "claude-x": 2000},
+            default_tokens_per_minute=500,
+        )
+    )
+    assert limiter.get_tokens_per_minute("Anthropic", "claude-x") == 2000
+    assert limiter.get_tokens_per_minute("Anthropic", "claude-y") == 1000
+    assert limiter.get_tokens_per_minute("OpenAI", "gpt-x") == 500
+    assert create_limiter().get("OpenAI", "gpt-x") is None
+
+
+def test_unused_reserved_tokens_are_refunded_from_the_response_usage():
+    async def main():
+        limiter = create_limiter(Anthropic=1000)
+        response = await limiter.run(
+            "Anthropic",
+            "claude-x",
+            "x" * 100,
+            max_tokens=400,
+            fn=lambda: asyncio.sleep(0, make_response(100, 50)),
+        )
+        assert response.usage.output_tokens == 50
+        # 500 tokens were reserved, 150 used
+        assert 850 <= available_tokens(limiter, "Anthropic/claude-x") < 860
+
+    asyncio.run(main())
+
+
+def test_usage_above_the_reservation_is_charged_to_the_bucket():
+    async def main():
+        limiter = create_limiter(Anthropic=1000)
+        await limiter.run(
+            "Anthropic",
+            "claude-x",
+            "x" * 10,
+            max_tokens=10,
+            fn=lambda: asyncio.sleep(0, make_response(300, 100)),
+        )
+        assert 600 <= available_tokens(limiter, "Anthropic/claude-x") < 610
+
+    asyncio.run(main())
+
+
+def test_failed_requests_return_their_whole_reservation():
+    async def main():
+        limiter = create_limiter(Anthropic=1000)
+
+        async def fail():
+            raise RuntimeError("overloaded")
+
+        with pytest.raises(RuntimeError):
+            await limiter.run("Anthropic", "claude-x", "x" * 100, 400, fail)
+        assert limiter.stats()["Anthropic/claude-x"]["available_tokens"] == 1000
+
+    asyncio.run(main())
+
+
+def test_requests_wait_for_the_bucket_to_refill():
+    async def main():
+        # Refills 100 tokens per second
+        bucket = TokenBucket(6000)
+        assert await bucket.acquire(6000) < 0.05
+        waited = await bucket.acquire(10)
+        assert 0.05 < waited < 1
+
+    asyncio.run(main())
+
+
+def test_reservations_are_settled_once():
+    async def main():
+        limiter = create_limiter(Anthropic=1000)
+        reservation = await limiter.reserve("Anthropic", None, "x" * 100, 100)
+        reservation.release()
+        reservation.release()
+        reservation.reconcile(None)
+        assert limiter.stats()["Anthropic/None"]["available_tokens"] == 1000
+
+    asyncio.run(main())
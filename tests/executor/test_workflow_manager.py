@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.app import MCPApp
+from mcp_agent.config import (
+    LoggerSettings,
+    OpenTelemetrySettings,
+    Settings,
+    WorkflowRunSettings,
+)
+from mcp_agent.executor.workflow import Workflow, WorkflowResult
+
+
+def create_app(**run_settings) -> MCPApp:
+    return MCPApp(
+        name="test_workflow_manager",
+        settings=Settings(
+            logger=LoggerSettings(type="none"),
+            otel=OpenTelemetrySettings(enabled=False),
+            workflow_runs=WorkflowRunSettings(**run_settings),
+        ),
+        human_input_callback=None,
+    )
+
+
+class GatedWorkflow(Workflow[str]):
+    """Runs until its gate is opened."""
+
+    gate: asyncio.Event
+
+    async def run(self, value: str = "done") -> WorkflowResult[str]:
+        await self.gate.wait()
+        return WorkflowResult(value=value)
+
+
+class FailingWorkflow(Workflow[str]):
+    async def run(self) -> WorkflowResult[str]:
+        raise RuntimeError("boom")
+
+
+def test_runs_beyond_the_concurrency_limit_wait_as_pending():
+    async def main():
+        app = create_app(max_concurrent_runs=1)
+        async with app.run():
+            GatedWorkflow.gate = asyncio.Event()
+            manager = app.run_manager
+            first = await manager.start(GatedWorkflow, "first")
+            second = await manager.start(GatedWorkflow, "second")
+            await asyncio.sleep(0.01)
+
+            assert manager.get_status(first).status == "running"
+            assert manager.get_status(second).status == "pending"
+            assert [s.run_id for s in manager.list_runs("pending")] == [second]
+
+            GatedWorkflow.gate.set()
+            assert (
+                await manager.wait(first, timeout_seconds=5)
+            ).result.value == "first"
+            assert (
+                await manager.wait(second, timeout_seconds=5)
+            ).result.value == "second"
+
+    asyncio.run(main())
+
+
+def test_status_changes_are_reported_to_listeners():
+    async def main():
+        app = create_app()
+        async with app.run():
+            GatedWorkflow.gate = asyncio.Event()
+            GatedWorkflow.gate.set()
+            statuses = []
+            app.run_manager.add_listener(lambda status: statuses.append(status.status))
+
+            run_id = await app.run_manager.start(GatedWorkflow)
+            await app.run_manager.wait(run_id, timeout_seconds=5)
+            await asyncio.sleep(0)
+
+            assert statuses == ["pending", "running", "completed"]
+
+    asyncio.run(main())
+
+
+def test_failed_runs_keep_their_error():
+    async def main():
+        app = create_app()
+        async with app.run():
+            run_id = await app.run_manager.start(FailingWorkflow)
+            status = await app.run_manager.wait(run_id, timeout_seconds=5)
+
+            assert status.status == "failed"
+            assert status.error == "RuntimeError: boom"
+            with pytest.raises(ValueError):
+                await app.run_manager.provide_input(run_id, "too late")
+
+    asyncio.run(main())
+
+
+def test_cancelled_runs_finish_as_cancelled():
+    async def main():
+        app = create_app()
+        async with app.run():
+            GatedWorkflow.gate = asyncio.Event()
+            run_id = await app.run_manager.start(GatedWorkflow, run_id="run-1")
+            with pytest.raises(ValueError):
+                await app.run_manager.start(GatedWorkflow, run_id="run-1")
+
+            assert await app.run_manager.cancel(run_id) is True
+            assert app.run_manager.get_status(run_id).status == "cancelled"
+            assert await app.run_manager.cancel(run_id) is False
+
+    asyncio.run(main())
+
+
+def test_only_the_most_recent_finished_runs_are_retained():
+    async def main():
+        app = create_app(max_retained_runs=2)
+        async with app.run():
+            for i in range(3):
+                run_id = await app.run_manager.start(FailingWorkflow, run_id=f"run-{i}")
+                await app.run_manager.wait(run_id, timeout_seconds=5)
+
+            assert [s.run_id for s in app.run_manager.list_runs()] == ["run-1", "run-2"]
+            with pytest.raises(KeyError):
+                app.run_manager.get_status("run-0")
+
+    asyncio.run(main())
+
+
+def test_finished_runs_are_dropped_after_the_retention_window():
+    async def main():
+        app = create_app(retention_seconds=0)
+        async with app.run():
+            GatedWorkflow.gate = asyncio.Event()
+            active = await app.run_manager.start(GatedWorkflow)
+            finished = await app.run_manager.start(FailingWorkflow)
+            await app.run_manager.wait(finished, timeout_seconds=5)
+
+            with pytest.raises(KeyError):
+                app.run_manager.get_status(finished)
+            assert app.run_manager.get_status(active).status == "running"
+            GatedWorkflow.gate.set()
+
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.config import AsyncioSettings, Settings
+from mcp_agent.context import configure_executor
+from mcp_agent.executor.workflow_signal import Signal
+
+
+def create_executor(ttl_seconds: float | None):
+    settings = Settings(
+        asyncio=AsyncioSettings(signal_registration_ttl_seconds=ttl_seconds)
+    )
+    return asyncio.run(configure_executor(settings))
+
+
+def test_waits_expire_after_the_configured_registration_ttl():
+    signal_bus = create_executor(ttl_seconds=0.05).signal_bus
+    assert signal_bus.registration_ttl_seconds == 0.05
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                signal_bus.wait_for_signal(Signal(name="human_input")), timeout=5
+            )
+        assert signal_bus._get_pending("human_input") == []
+
+    asyncio.run(main())
+
+
+def test_signals_within_the_registration_ttl_are_delivered():
+    signal_bus = create_executor(ttl_seconds=5).signal_bus
+
+    async def main():
+        waiter = asyncio.create_task(
+            signal_bus.wait_for_signal(Signal(name="human_input"))
+        )
+        await asyncio.sleep(0)
+        await signal_bus.signal(Signal(name="human_input", payload="yes"))
+        assert await waiter == "yes"
+
+    asyncio.run(main())
+
+
+def test_shorter_wait_timeouts_take_precedence_over_the_registration_ttl():
+    signal_bus = create_executor(ttl_seconds=5).signal_bus
+    assert signal_bus.get_wait_timeout(1) == 1
+    assert signal_bus.get_wait_timeout(None) == 5
+    assert create_executor(ttl_seconds=None).signal_bus.get_wait_timeout(None) is None
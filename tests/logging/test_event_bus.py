@@ -0,0 +1,109 @@
+import asyncio
+
+from mcp_agent.logging.events import Event, EventFilter
+from mcp_agent.logging.listeners import EventListener, FilteredListener
+from mcp_agent.logging.transport import AsyncEventBus, FilteredEventTransport
+
+
+def make_event(message: str, type: str = "info") -> Event:
+    return Event(type=type, namespace="app", message=message)
+
+
+class RecordingTransport(FilteredEventTransport):
+    def __init__(self, event_filter: EventFilter | None = None):
+        super().__init__(event_filter=event_filter)
+        self.batches = []
+
+    async def send_matched_event(self, event):
+        self.batches.append([event.message])
+
+    async def send_matched_events(self, events):
+        self.batches.append([event.message for event in events])
+
+
+class RecordingListener(FilteredListener):
+    def __init__(self, event_filter: EventFilter | None = None):
+        super().__init__(event_filter=event_filter)
+        self.batches = []
+
+    async def handle_matched_events(self, events):
+        self.batches.append([event.message for event in events])
+
+
+class FailingListener(EventListener):
+    async def handle_event(self, event):
+        raise RuntimeError("listener failed")
+
+
+def test_queued_events_are_dispatched_in_batches():
+    async def main():
+        transport, listener = RecordingTransport(), RecordingListener()
+        bus = AsyncEventBus(transport=transport)
+        bus.max_batch_size = 2
+        bus.add_listener("recording", listener)
+        for message in "abcde":
+            await bus.emit(make_event(message))
+
+        await bus.start()
+        await bus.stop()
+
+        expected = [["a", "b"], ["c", "d"], ["e"]]
+        assert transport.batches == expected
+        assert listener.batches == expected
+
+    asyncio.run(main())
+
+
+def test_filtered_sinks_only_receive_matching_events():
+    async def main():
+        errors_only = EventFilter(types={"error"})
+        transport = RecordingTransport(event_filter=errors_only)
+        errors, everything = RecordingListener(errors_only), RecordingListener()
+        bus = AsyncEventBus(transport=transport)
+        bus.add_listener("errors", errors)
+        bus.add_listener("everything", everything)
+        await bus.emit(make_event("a"))
+        await bus.emit(make_event("b", "error"))
+        await bus.emit(make_event("c"))
+
+        await bus.start()
+        await bus.stop()
+
+        assert transport.batches == [["b"]]
+        assert errors.batches == [["b"]]
+        assert everything.batches == [["a", "b", "c"]]
+
+    asyncio.run(main())
+
+
+def test_filtered_listeners_are_not_called_for_batches_without_matches():
+    async def main():
+        listener = RecordingListener(EventFilter(types={"error"}))
+        bus = AsyncEventBus()
+        bus.add_listener("errors", listener)
+        await bus.emit(make_event("a"))
+
+        await bus.start()
+        await bus.stop()
+
+        assert listener.batches == []
+
+    asyncio.run(main())
+
+
+def test_a_failing_listener_does_not_stop_the_others():
+    async def main():
+        listener = RecordingListener()
+        bus = AsyncEventBus()
+        bus.add_listener("failing", FailingListener())
+        bus.add_listener("recording", listener)
+
+        await bus.start()
+        await bus.emit(make_event("a"))
+        await asyncio.sleep(0.01)
+        await bus.emit(make_event("b"))
+        await bus.stop()
+
+        assert [m for batch in listener.batches for m in batch] == ["a", "b"]
+
+    asyncio.run(main())
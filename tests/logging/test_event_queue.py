@@ -0,0 +1,102 @@
+import asyncio
+
+from mcp_agent.logging.events import Event
+from mcp_agent.logging.transport import AsyncEventBus, EventQueue
+
+
+def make_event(message: str, type: str = "info") -> Event:
+    return Event(type=type, namespace="app", message=message)
+
+
+def drain(queue: EventQueue) -> list[str]:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait().message)
+    return messages
+
+
+def test_drop_oldest_drops_the_oldest_queued_event():
+    queue = EventQueue(maxsize=3, overflow_policy="drop_oldest")
+    for message, type in [("a", "info"), ("b", "debug"), ("c", "info"), ("d", "info")]:
+        assert queue.put_nowait(make_event(message, type))
+
+    assert drain(queue) == ["b", "c", "d"]
+    assert queue.dropped == 1
+    assert queue.dropped_by_type == {"info": 1}
+
+
+def test_drop_debug_first_keeps_more_important_events():
+    queue = EventQueue(maxsize=3, overflow_policy="drop_debug_first")
+    queue.put_nowait(make_event("a"))
+    queue.put_nowait(make_event("b", "debug"))
+    queue.put_nowait(make_event("c"))
+
+    # A queued debug event makes room for new events
+    queue.put_nowait(make_event("d", "error"))
+    # New debug events are dropped rather than displacing other events
+    queue.put_nowait(make_event("e", "debug"))
+    # Without debug events, the oldest event is dropped
+    queue.put_nowait(make_event("f"))
+
+    assert drain(queue) == ["c", "d", "f"]
+    assert queue.dropped_by_type == {"debug": 2, "info": 1}
+
+
+def test_block_makes_producers_wait_for_room():
+    async def main():
+        queue = EventQueue(maxsize=1, overflow_policy="block")
+        await queue.put(make_event("a"))
+        assert not queue.put_nowait(make_event("b"))
+
+        producer = asyncio.create_task(queue.put(make_event("c")))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        assert (await queue.get()).message == "a"
+        await asyncio.wait_for(producer, timeout=1)
+        assert (await queue.get()).message == "c"
+        assert queue.dropped == 0
+
+    asyncio.run(main())
+
+
+def test_closed_queues_are_drained_before_stopping_their_consumer():
+    async def main():
+        queue = EventQueue(maxsize=0)
+        for message in "abc":
+            queue.put_nowait(make_event(message))
+        queue.close()
+
+        messages = []
+        while (event := await queue.get()) is not None:
+            messages.append(event.message)
+        assert messages == ["a", "b", "c"]
+
+    asyncio.run(main())
+
+
+def test_blocked_emits_on_the_bus_loop_drop_the_oldest_event():
+    async def main():
+        bus = AsyncEventBus(max_queue_size=2, overflow_policy="block")
+        # Running, but not consuming, so that the queue stays full
+        bus._running = True
+        bus._loop = asyncio.get_running_loop()
+        for message in "abc":
+            bus.emit_nowait(make_event(message))
+
+        assert drain(bus.queue) == ["b", "c"]
+        assert bus.queue.dropped == 1
+
+    asyncio.run(main())
+
+
+def test_events_emitted_before_the_bus_starts_are_dropped_once_full():
+    async def main():
+        bus = AsyncEventBus(max_queue_size=1, overflow_policy="block")
+        await bus.emit(make_event("a"))
+        await bus.emit(make_event("b"))
+
+        assert drain(bus.queue) == ["a"]
+        assert bus.queue.dropped == 1
+
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+import asyncio
+import gzip
+import json
+
+from mcp_agent.logging.events import Event, EventFilter
+from mcp_agent.logging.transport import FileTransport
+
+
+def make_event(message: str, type: str = "info", **data) -> Event:
+    return Event(type=type, namespace="app", message=message, data=data)
+
+
+def read_messages(path) -> list[str]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt") as f:
+        return [json.loads(line)["message"] for line in f]
+
+
+def write_events(transport: FileTransport, messages):
+    async def main():
+        await transport.start()
+        await transport.send_events([make_event(message) for message in messages])
+        await transport.stop()
+
+    asyncio.run(main())
+
+
+def test_events_are_written_as_json_lines_on_stop(tmp_path):
+    path = tmp_path / "logs" / "app.jsonl"
+    transport = FileTransport(
+        path, event_filter=EventFilter(min_level="info"), flush_interval=60
+    )
+
+    async def main():
+        await transport.send_events(
+            [make_event("a", user="ada"), make_event("b", "debug"), make_event("c")]
+        )
+        await transport.stop()
+
+    asyncio.run(main())
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["message"] for line in lines] == ["a", "c"]
+    assert lines[0]["level"] == "INFO"
+    assert lines[0]["data"] == {"user": "ada"}
+    assert transport.is_closed
+
+
+def test_write_mode_truncates_the_existing_file(tmp_path):
+    path = tmp_path / "app.jsonl"
+    path.write_text("old\n")
+    write_events(FileTransport(path, mode="w"), ["a"])
+    assert read_messages(path) == ["a"]
+
+    write_events(FileTransport(path), ["b"])
+    assert read_messages(path) == ["a", "b"]
+
+
+def test_files_are_rotated_by_size_keeping_backup_count_backups(tmp_path):
+    path = tmp_path / "app.jsonl"
+    transport = FileTransport(path, max_bytes=1, backup_count=2)
+    write_events(transport, ["a", "b", "c", "d"])
+
+    assert read_messages(path) == []
+    assert read_messages(tmp_path / "app.jsonl.1") == ["d"]
+    assert read_messages(tmp_path / "app.jsonl.2") == ["c"]
+    assert not (tmp_path / "app.jsonl.3").exists()
+
+
+def test_rotated_files_can_be_compressed(tmp_path):
+    path = tmp_path / "app.jsonl"
+    transport = FileTransport(path, max_bytes=200, backup_count=3, compress=True)
+    write_events(transport, [f"message {i}" for i in range(6)])
+
+    messages = []
+    for backup in sorted(tmp_path.glob("app.jsonl.*.gz"), reverse=True):
+        messages.extend(read_messages(backup))
+    messages.extend(read_messages(path))
+    assert messages == [f"message {i}" for i in range(6)]
+
+
+def test_files_are_rotated_by_age(tmp_path):
+    path = tmp_path / "app.jsonl"
+    transport = FileTransport(path, rotate_interval=1e-9, backup_count=5)
+    write_events(transport, ["a", "b"])
+
+    assert read_messages(tmp_path / "app.jsonl.1") == ["b"]
+    assert read_messages(tmp_path / "app.jsonl.2") == ["a"]
+
+
+def test_without_backups_rotation_discards_the_file(tmp_path):
+    path = tmp_path / "app.jsonl"
+    transport = FileTransport(path, max_bytes=1, backup_count=0)
+    write_events(transport, ["a", "b"])
+
+    assert read_messages(path) == []
+    assert list(tmp_path.iterdir()) == [path]
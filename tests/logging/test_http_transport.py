@@ -0,0 +1,171 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+from mcp_agent.logging.events import Event
+from mcp_agent.logging.transport import HTTPTransport
+
+
+def make_events(count: int, start: int = 0):
+    return [
+        Event(type="info", namespace="test", message=str(i))
+        for i in range(start, start + count)
+    ]
+
+
+class MockEndpoint:
+    """HTTP endpoint that records the messages it receives and fails on demand."""
+
+    def __init__(self):
+        self.failures = 0
+        self.failure_status = 503
+        self.received = []
+        self.requests = 0
+        self.encodings = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=self.failure_status)
+
+        # aiohttp decompresses gzip-encoded request bodies
+        events = json.loads(await request.read())
+        self.encodings.append(request.headers.get("Content-Encoding"))
+        self.received.extend(event["message"] for event in events)
+        return web.Response(status=200)
+
+    @asynccontextmanager
+    async def serve(self):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            yield f"http://127.0.0.1:{port}/"
+        finally:
+            await runner.cleanup()
+
+
+def test_stop_waits_for_a_batch_that_is_being_retried():
+    async def main():
+        endpoint = MockEndpoint()
+        endpoint.failures = 1
+        async with endpoint.serve() as url:
+            transport = HTTPTransport(url, batch_size=5, retry_backoff=0.2)
+            await transport.send_matched_events(make_events(5))
+
+            # Stop while the flusher is backing off after the first failure
+            while endpoint.requests == 0:
+                await asyncio.sleep(0.01)
+            await transport.stop()
+
+            assert endpoint.received == [str(i) for i in range(5)]
+            assert transport._flush_task is None
+            assert transport._session is None
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+
+def test_failed_batches_are_spilled_and_resent_after_the_next_send(tmp_path):
+    async def main():
+        endpoint = MockEndpoint()
+        async with endpoint.serve() as url:
+            transport = HTTPTransport(
+                url, max_retries=0, flush_interval=60, spill_path=tmp_path
+            )
+            await transport.start()
+
+            endpoint.failures = 1
+            await transport.send_matched_events(make_events(3))
+            await transport._flush()
+            assert endpoint.received == []
+            assert len(list(tmp_path.iterdir())) == 1
+
+            await transport.send_matched_events(make_events(2, start=3))
+            await transport._flush()
+            assert endpoint.received == ["3", "4", "0", "1", "2"]
+            assert list(tmp_path.iterdir()) == []
+
+            await transport.stop()
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+
+def test_stop_without_start_resends_spilled_batches_without_a_flusher(tmp_path):
+    async def main():
+        endpoint = MockEndpoint()
+        async with endpoint.serve() as url:
+            spilling = HTTPTransport(url, spill_path=tmp_path)
+            spilling._spill(spilling._encode(make_events(2)), 2)
+
+            transport = HTTPTransport(url, spill_path=tmp_path)
+            await transport.stop()
+
+            assert endpoint.received == ["0", "1"]
+            assert list(tmp_path.iterdir()) == []
+            assert transport._flush_task is None
+            assert transport._session is None
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+
+def test_full_batches_are_sent_without_waiting_for_the_flush_interval():
+    async def main():
+        endpoint = MockEndpoint()
+        async with endpoint.serve() as url:
+            transport = HTTPTransport(url, batch_size=3, flush_interval=60)
+            await transport.send_matched_events(make_events(2))
+            await asyncio.sleep(0.05)
+            assert endpoint.received == []
+
+            await transport.send_matched_events(make_events(1, start=2))
+            while not endpoint.received:
+                await asyncio.sleep(0.01)
+            assert endpoint.received == ["0", "1", "2"]
+            assert endpoint.encodings == ["gzip"]
+
+            await transport.stop()
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+
+def test_batches_rejected_as_invalid_are_dropped_not_retried(tmp_path):
+    async def main():
+        endpoint = MockEndpoint()
+        endpoint.failures = 1
+        endpoint.failure_status = 400
+        async with endpoint.serve() as url:
+            transport = HTTPTransport(
+                url, compress=False, retry_backoff=0.01, spill_path=tmp_path
+            )
+            await transport.send_matched_events(make_events(2))
+            await transport.stop()
+
+            assert endpoint.requests == 1
+            assert endpoint.received == []
+            assert list(tmp_path.iterdir()) == []
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+
+def test_rate_limited_batches_are_retried():
+    async def main():
+        endpoint = MockEndpoint()
+        endpoint.failures = 2
+        endpoint.failure_status = 429
+        async with endpoint.serve() as url:
+            transport = HTTPTransport(url, compress=False, retry_backoff=0.01)
+            await transport.send_matched_events(make_events(2))
+            await transport.stop()
+
+            assert endpoint.requests == 3
+            assert endpoint.received == ["0", "1"]
+            assert endpoint.encodings == [None]
+
+    asyncio.run(asyncio.wait_for(main(), timeout=10))
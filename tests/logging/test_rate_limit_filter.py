@@ -0,0 +1,112 @@
+from mcp_agent.config import LogRateLimitSettings
+from mcp_agent.logging import events
+from mcp_agent.logging.events import Event, RateLimitFilter
+
+
+def make_event(
+    message: str = "message", namespace: str = "app", name=None, type="info"
+) -> Event:
+    return Event(type=type, namespace=namespace, name=name, message=message)
+
+
+def create_filter(**rule) -> RateLimitFilter:
+    return RateLimitFilter(min_level=None, rules=[LogRateLimitSettings(**rule)])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_state_is_bounded_to_the_most_recently_used_keys():
+    rate_limit = RateLimitFilter(
+        min_level=None,
+        rules=[LogRateLimitSettings(first_n=1, sample_rate=0.0)],
+        max_states=3,
+    )
+
+    for i in range(100):
+        assert rate_limit.matches(make_event(namespace=f"app.{i}"))
+    assert len(rate_limit._states) == 3
+
+    # Recently used keys keep their state, evicted ones start afresh
+    assert not rate_limit.matches(make_event(namespace="app.99"))
+    assert rate_limit.matches(make_event(namespace="app.0"))
+    assert len(rate_limit._states) == 3
+
+
+def test_the_first_n_events_pass_before_sampling_applies():
+    rate_limit = create_filter(first_n=2, sample_rate=0.0)
+
+    passed = [rate_limit.matches(make_event(str(i))) for i in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert rate_limit.suppressed == 3
+
+
+def test_events_after_the_first_n_are_sampled(monkeypatch):
+    draws = iter([0.1, 0.7, 0.3, 0.5])
+    monkeypatch.setattr(events.random, "random", lambda: next(draws))
+    rate_limit = create_filter(sample_rate=0.5)
+
+    passed = [rate_limit.matches(make_event(str(i))) for i in range(4)]
+    assert passed == [True, False, True, False]
+
+
+def test_the_token_bucket_allows_bursts_then_the_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(events.time, "monotonic", clock)
+    rate_limit = create_filter(rate=2.0, burst=3)
+
+    assert [rate_limit.matches(make_event(str(i))) for i in range(4)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    clock.now += 1.0
+    assert [rate_limit.matches(make_event(str(i))) for i in range(3)] == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_repeats_are_suppressed_and_counted_on_the_next_event(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(events.time, "monotonic", clock)
+    rate_limit = create_filter(dedup_seconds=10)
+
+    assert rate_limit.matches(make_event("disk full"))
+    assert not rate_limit.matches(make_event("disk full"))
+    assert not rate_limit.matches(make_event("disk full"))
+
+    event = make_event("disk ok")
+    assert rate_limit.matches(event)
+    assert event.data == {"suppressed_repeats": 2, "suppressed_message": "disk full"}
+
+    clock.now += 10
+    assert rate_limit.matches(make_event("disk ok"))
+
+
+def test_the_first_matching_rule_applies_per_namespace_and_name():
+    rate_limit = RateLimitFilter(
+        min_level=None,
+        rules=[
+            LogRateLimitSettings(types=["error"]),
+            LogRateLimitSettings(namespace="app.http", first_n=1, sample_rate=0.0),
+        ],
+    )
+
+    assert rate_limit.matches(make_event(namespace="app.http.client"))
+    assert not rate_limit.matches(make_event(namespace="app.http.client"))
+    # Each namespace and event name is limited separately
+    assert rate_limit.matches(make_event(namespace="app.http.server"))
+    assert rate_limit.matches(make_event(namespace="app.http.client", name="retry"))
+    # Errors match the first rule, which doesn't limit them
+    assert rate_limit.matches(make_event(namespace="app.http.client", type="error"))
+    # Events matching no rule pass
+    assert rate_limit.matches(make_event(namespace="app.db"))
+    assert rate_limit.matches(make_event(namespace="app.db"))
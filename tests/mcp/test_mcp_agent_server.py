@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from mcp_agent.app import MCPApp
+from mcp_agent.config import LoggerSettings, OpenTelemetrySettings, Settings
+from mcp_agent.executor.workflow import Workflow, WorkflowResult
+from mcp_agent.mcp.mcp_agent_server import (
+    create_mcp_server_for_app,
+    get_run_arguments,
+)
+
+
+class AskWorkflow(Workflow[str]):
+    async def run(self, question: str) -> WorkflowResult[str]:
+        answer = await self.wait_for_input(question)
+        return WorkflowResult(value=f"{question} {answer}")
+
+
+class GreetWorkflow(Workflow[str]):
+    async def run(self, name: str, greeting: str = "Hello", punctuation: str = "!"):
+        return WorkflowResult(value=f"{greeting} {name}{punctuation}")
+
+
+def create_app() -> MCPApp:
+    return MCPApp(
+        name="test_mcp_agent_server",
+        settings=Settings(
+            logger=LoggerSettings(type="none"),
+            otel=OpenTelemetrySettings(enabled=False),
+        ),
+        human_input_callback=None,
+    )
+
+
+async def call_tool(session, name: str, **arguments):
+    result = await session.call_tool(name, arguments)
+    assert not result.isError, result.content
+    return json.loads(result.content[0].text) if result.content else None
+
+
+def test_user_input_reaches_a_waiting_workflow_run():
+    async def main():
+        app = create_app()
+        async with app.run():
+            app.workflow(AskWorkflow)
+            server = create_mcp_server_for_app(app)
+            async with create_connected_server_and_client_session(
+                server._mcp_server
+            ) as session:
+                started = await call_tool(
+                    session,
+                    "run_workflow",
+                    workflow_name="AskWorkflow",
+                    args={"question": "Ready?"},
+                )
+                run_id = started["run_id"]
+
+                await call_tool(
+                    session, "provide_user_input", run_id=run_id, input_data="Yes"
+                )
+                status = await call_tool(
+                    session, "wait_for_workflow", run_id=run_id, timeout_seconds=5
+                )
+
+                assert status["status"] == "completed"
+                assert status["result"]["value"] == "Ready? Yes"
+
+    asyncio.run(asyncio.wait_for(main(), timeout=30))
+
+
+def test_user_input_given_before_the_run_waits_is_kept_for_it():
+    class AskTwiceWorkflow(Workflow[str]):
+        async def run(self) -> WorkflowResult[str]:
+            await asyncio.sleep(0.05)
+            first = await self.wait_for_input("First?")
+            second = await self.wait_for_input("Second?")
+            return WorkflowResult(value=f"{first} {second}")
+
+    async def main():
+        app = create_app()
+        async with app.run():
+            run_id = await app.run_manager.start(AskTwiceWorkflow)
+            await app.run_manager.provide_input(run_id, "a")
+            await app.run_manager.provide_input(run_id, "b")
+
+            status = await app.run_manager.wait(run_id, timeout_seconds=5)
+            assert status.status == "completed"
+            assert status.result.value == "a b"
+
+            with pytest.raises(ValueError):
+                await app.run_manager.provide_input(run_id, "c")
+
+    asyncio.run(main())
+
+
+def test_run_arguments_are_keyword_arguments_of_run_in_parameter_order():
+    assert get_run_arguments(GreetWorkflow, {"punctuation": "?", "name": "Ada"}) == [
+        "Ada",
+        "Hello",
+        "?",
+    ]
+    assert get_run_arguments(AskWorkflow, {"question": "Ready?"}) == ["Ready?"]
+
+    with pytest.raises(TypeError):
+        get_run_arguments(GreetWorkflow, {"greeting": "Hi"})
+    with pytest.raises(TypeError):
+        get_run_arguments(GreetWorkflow, {"name": "Ada", "unknown": 1})
+
+
+def test_run_workflow_passes_args_as_keyword_arguments():
+    async def main():
+        app = create_app()
+        async with app.run():
+            app.workflow(GreetWorkflow)
+            server = create_mcp_server_for_app(app)
+            async with create_connected_server_and_client_session(
+                server._mcp_server
+            ) as session:
+                started = await call_tool(
+                    session,
+                    "run_workflow",
+                    workflow_name="GreetWorkflow",
+                    args={"punctuation": "?", "name": "Ada"},
+                )
+                status = await call_tool(
+                    session,
+                    "wait_for_workflow",
+                    run_id=started["run_id"],
+                    timeout_seconds=5,
+                )
+                assert status["result"]["value"] == "Hello Ada?"
+
+    asyncio.run(main())
+
+
+def test_pause_and_resume_are_not_exposed_for_asyncio():
+    async def main():
+        app = create_app()
+        async with app.run():
+            server = create_mcp_server_for_app(app)
+            tools = {tool.name for tool in await server.list_tools()}
+            assert "provide_user_input" in tools
+            assert not tools & {"pause_workflow", "resume_workflow"}
+
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from mcp_agent.telemetry.metrics import (
+    HistogramValue,
+    MetricsRegistry,
+    start_prometheus_server,
+)
+
+
+def test_counters_sum_each_label_set_across_threads():
+    registry = MetricsRegistry()
+    calls = registry.counter("tool.calls")
+
+    def record():
+        for _ in range(100):
+            calls.add(1, server="fetch", status="ok")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls.add(2, status="error", server="fetch")
+
+    assert calls.get(status="ok", server="fetch") == 400
+    assert calls.get(server="fetch", status="error") == 2
+    assert calls.get(server="other") == 0
+    assert {tuple(s.labels.items()): s.value for s in calls.collect()} == {
+        (("server", "fetch"), ("status", "ok")): 400,
+        (("server", "fetch"), ("status", "error")): 2,
+    }
+
+
+def test_disabled_registries_ignore_updates():
+    registry = MetricsRegistry(enabled=False)
+    registry.counter("calls").add(1)
+    registry.gauge("depth").set(3)
+    registry.histogram("duration").record(0.1)
+
+    assert all(metric.series == [] for metric in registry.collect())
+
+
+def test_instruments_are_registered_once_per_name():
+    registry = MetricsRegistry()
+    assert registry.counter("calls") is registry.counter("calls")
+    with pytest.raises(ValueError):
+        registry.gauge("calls")
+
+
+def test_gauges_combine_set_values_with_their_callback():
+    registry = MetricsRegistry()
+    depth = registry.gauge("queue.depth")
+    depth.set(3, queue="a")
+    depth.add(-1, queue="a")
+    assert depth.get(queue="a") == 2
+
+    depth.callback = lambda: [({"queue": "b"}, 5)]
+    assert [(s.labels, s.value) for s in depth.collect()] == [
+        ({"queue": "a"}, 2),
+        ({"queue": "b"}, 5),
+    ]
+
+    depth.callback = lambda: 1 / 0
+    assert [s.labels for s in depth.collect()] == [{"queue": "a"}]
+
+
+def test_histograms_count_observations_per_bucket():
+    registry = MetricsRegistry()
+    duration = registry.histogram("duration", buckets=[1.0, 0.1])
+    for value in [0.05, 0.1, 0.5, 2.0]:
+        duration.record(value, route="/")
+
+    [series] = duration.collect()
+    assert series.labels == {"route": "/"}
+    assert series.value == HistogramValue(
+        buckets=[0.1, 1.0], counts=[2, 1, 1], sum=2.65, count=4
+    )
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry()
+    registry.counter("tool.calls", "MCP tool calls").add(3, server='say "hi"')
+    duration = registry.histogram("tool.duration", unit="s", buckets=[0.1, 1.0])
+    duration.record(0.05)
+    duration.record(0.5)
+    registry.gauge("queue.depth", callback=lambda: 7)
+
+    assert registry.to_prometheus() == "\n".join(
+        [
+            "# HELP tool_calls_total MCP tool calls",
+            "# TYPE tool_calls_total counter",
+            'tool_calls_total{server="say \\"hi\\""} 3.0',
+            "# TYPE tool_duration_seconds histogram",
+            'tool_duration_seconds_bucket{le="0.1"} 1',
+            'tool_duration_seconds_bucket{le="1.0"} 2',
+            'tool_duration_seconds_bucket{le="+Inf"} 2',
+            "tool_duration_seconds_sum 0.55",
+            "tool_duration_seconds_count 2",
+            "# TYPE queue_depth gauge",
+            "queue_depth 7.0",
+            "",
+        ]
+    )
+
+
+def test_prometheus_server_serves_the_metrics_path():
+    registry = MetricsRegistry()
+    registry.counter("calls").add(1)
+    server = start_prometheus_server(registry, port=0)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert "calls_total 1" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/other")
+    finally:
+        server.shutdown()
+        server.server_close()
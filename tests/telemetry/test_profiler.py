@@ -0,0 +1,117 @@
+import asyncio
+import json
+import time
+
+import pytest
+from opentelemetry import trace
+
+from mcp_agent.telemetry.profiler import (
+    LoopStall,
+    Profile,
+    ProfiledSpan,
+    Profiler,
+    format_summary,
+)
+
+MS = 1_000_000
+
+
+def make_span(span_id: int, name: str, start_ms: int, end_ms: int, parent_id=None):
+    return ProfiledSpan(
+        span_id=span_id,
+        parent_id=parent_id,
+        name=name,
+        start_ns=start_ms * MS,
+        end_ns=end_ms * MS,
+        cpu_ns=(end_ms - start_ms) * MS // 2,
+    )
+
+
+def make_profile() -> Profile:
+    return Profile(
+        start_ns=0,
+        end_ns=100 * MS,
+        spans=[
+            make_span(1, "workflow", 0, 100),
+            make_span(2, "llm call", 10, 50, parent_id=1),
+            make_span(3, "tool call", 40, 80, parent_id=1),
+            make_span(4, "tool call", 60, 90, parent_id=1),
+        ],
+        stalls=[
+            LoopStall(start_ns=20 * MS, duration_ns=5 * MS, stack=["app.py:1 in f"])
+        ],
+    )
+
+
+def test_chrome_trace_puts_overlapping_spans_on_separate_tracks():
+    trace_events = make_profile().to_chrome_trace()["traceEvents"]
+    spans = [e for e in trace_events if e.get("cat") == "span"]
+
+    # Nested and disjoint spans share their parent's track, overlapping ones don't
+    assert [(e["name"], e["tid"]) for e in spans] == [
+        ("workflow", 0),
+        ("llm call", 0),
+        ("tool call", 1),
+        ("tool call", 0),
+    ]
+    assert spans[1]["ts"] == 10_000 and spans[1]["dur"] == 40_000
+    assert spans[1]["args"] == {"cpu_ms": 20.0}
+
+    [stall] = [e for e in trace_events if e.get("cat") == "stall"]
+    assert stall["tid"] == 2
+    assert stall["args"] == {"stack": ["app.py:1 in f"]}
+
+
+def test_folded_stacks_are_weighted_by_self_time():
+    folded = make_profile().to_folded()
+    assert folded.splitlines() == [
+        # Concurrent children (110ms) outlast the workflow (100ms): no self time left
+        "workflow;llm call 40000",
+        "workflow;tool call 70000",
+        "event loop stall;app.py:1 in f 5000",
+    ]
+
+
+def test_summary_aggregates_spans_by_name_slowest_first():
+    summary = make_profile().summary()
+    assert list(summary) == ["workflow", "tool call", "llm call", "event loop stall"]
+    assert summary["tool call"].count == 2
+    assert summary["tool call"].wall_seconds == pytest.approx(0.07)
+    assert summary["tool call"].cpu_seconds == pytest.approx(0.035)
+    assert (
+        format_summary(make_profile(), limit=1).splitlines()[1].startswith("workflow")
+    )
+
+
+def test_profiles_are_written_in_the_requested_format(tmp_path):
+    profile = make_profile()
+    chrome = profile.write(tmp_path / "profile.json")
+    assert json.loads(chrome.read_text()) == profile.to_chrome_trace()
+    folded = profile.write(tmp_path / "out" / "profile.folded", format="folded")
+    assert folded.read_text() == profile.to_folded()
+    with pytest.raises(ValueError):
+        profile.write(tmp_path / "profile.txt", format="text")
+
+
+def test_profiler_records_spans_and_event_loop_stalls():
+    def block_the_loop():
+        time.sleep(0.2)
+
+    async def main():
+        profiler = Profiler(stall_threshold_seconds=0.05)
+        profiler.start()
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span("workflow"):
+            with tracer.start_as_current_span("step"):
+                await asyncio.sleep(0.01)
+            block_the_loop()
+        await asyncio.sleep(0.05)
+        profile = profiler.stop()
+        assert [span.name for span in profile.spans] == ["workflow", "step"]
+        assert profile.spans[1].parent_id == profile.spans[0].span_id
+
+        [stall] = profile.stalls
+        assert stall.duration_ns >= 0.1e9
+        assert any("block_the_loop" in frame for frame in stall.stack)
+
+    asyncio.run(main())
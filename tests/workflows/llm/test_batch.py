@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.config import BatchSettings
+from mcp_agent.workflows.llm.batch import BatchProcessor, LocalBatchBackend
+
+
+class RecordingBackend(LocalBatchBackend):
+    """Local backend that records the size of every batch it receives."""
+
+    def __init__(self, request=None):
+        super().__init__(request or self.echo)
+        self.batch_sizes = []
+
+    @staticmethod
+    async def echo(prompt: str) -> str:
+        if prompt == "fail":
+            raise ValueError("invalid request")
+        return prompt.upper()
+
+    async def submit(self, requests):
+        self.batch_sizes.append(len(requests))
+        return await super().submit(requests)
+
+
+def create_processor(**settings) -> BatchProcessor:
+    return BatchProcessor(BatchSettings(poll_interval_seconds=0.01, **settings))
+
+
+def test_requests_are_submitted_together_once_the_batch_is_full():
+    async def main():
+        processor = create_processor(max_batch_size=3, max_wait_seconds=60)
+        backend = RecordingBackend()
+
+        responses = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    processor.submit("model", backend, {"prompt": prompt})
+                    for prompt in ("a", "b", "c")
+                )
+            ),
+            timeout=5,
+        )
+        assert responses == ["A", "B", "C"]
+        assert backend.batch_sizes == [3]
+
+    asyncio.run(main())
+
+
+def test_partial_batches_are_submitted_after_the_wait():
+    async def main():
+        processor = create_processor(max_batch_size=100, max_wait_seconds=0.05)
+        backend = RecordingBackend()
+
+        responses = await asyncio.wait_for(
+            asyncio.gather(
+                processor.submit("model-a", backend, {"prompt": "a"}),
+                processor.submit("model-a", backend, {"prompt": "b"}),
+                processor.submit("model-b", backend, {"prompt": "c"}),
+            ),
+            timeout=5,
+        )
+        assert responses == ["A", "B", "C"]
+        # One batch per key
+        assert sorted(backend.batch_sizes) == [1, 2]
+
+    asyncio.run(main())
+
+
+def test_failed_requests_fail_alone():
+    async def main():
+        processor = create_processor(max_batch_size=2)
+        backend = RecordingBackend()
+
+        ok, failed = await asyncio.gather(
+            processor.submit("model", backend, {"prompt": "a"}),
+            processor.submit("model", backend, {"prompt": "fail"}),
+            return_exceptions=True,
+        )
+        assert ok == "A"
+        assert isinstance(failed, ValueError)
+
+    asyncio.run(main())
+
+
+def test_a_failed_batch_fails_all_its_requests():
+    class FailingBackend(RecordingBackend):
+        async def submit(self, requests):
+            raise ConnectionError("batch endpoint unavailable")
+
+    async def main():
+        processor = create_processor(max_batch_size=2)
+        results = await asyncio.gather(
+            *(
+                processor.submit("model", FailingBackend(), {"prompt": prompt})
+                for prompt in ("a", "b")
+            ),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_close_cancels_queued_requests():
+    async def main():
+        processor = create_processor(max_wait_seconds=60)
+        request = asyncio.create_task(
+            processor.submit("model", RecordingBackend(), {"prompt": "a"})
+        )
+        await asyncio.sleep(0)
+
+        await processor.close()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+    asyncio.run(main())